@@ -0,0 +1 @@
+"""Benchmarks of the textstat functions, see `python -m benchmarks --help`."""
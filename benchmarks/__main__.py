@@ -0,0 +1,214 @@
+"""Time the public functions of `textstat.backend` on fixed corpora, with
+cold and warm caches, write a JSON report and compare it with a baseline.
+
+    python -m benchmarks --corpus tweet paragraph --output report.json
+    python -m benchmarks --baseline report.json --lang en_US -k syllable
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import platform
+import re
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
+
+import textstat
+from textstat.backend import counts, metrics, selections, transformations
+from textstat.backend.caches import reset_cache_info
+
+from .corpora import CORPORA, SEEDS, get_corpus
+
+MODES = ("cold", "warm")
+# A single cold call is too noisy to call a change a regression, reports
+# timed with fewer calls are compared without flagging anything
+MIN_REPEAT = 3
+# Values of the arguments without a default, other than `text` and `lang`
+ARGUMENTS: dict[str, Any] = {
+    "ignore_spaces": True,
+    "metrics": ["flesch_reading_ease", "smog_index", "text_standard"],
+    "ms_per_char": 14.69,
+    "rm_apostrophe": True,
+    "strict_lower": False,
+    "strict_upper": True,
+    "syllable_threshold": 2,
+    "variant": 1,
+}
+
+
+def iter_functions() -> Iterator[tuple[str, Callable[..., Any], list[str]]]:
+    """The benchmarked functions, with their qualified names and the names of
+    their required parameters."""
+    for module in (counts, metrics, selections, transformations):
+        for name in module.__all__:
+            func = getattr(module, name)
+            params = inspect.signature(func).parameters
+            if next(iter(params)) != "text":
+                continue
+            required = [
+                param.name
+                for param in params.values()
+                if param.default is param.empty and param.name != "text"
+            ]
+            yield f"{module.__name__.rsplit('.', 1)[-1]}.{name}", func, required
+
+
+def clear_caches() -> None:
+    """Drop the cached results, but keep the language resources loaded."""
+    reset_cache_info("document", clear=True)
+    reset_cache_info("word", clear=True)
+
+
+def time_call(func: Callable[[], Any], mode: str, repeat: int) -> float:
+    """The best time of a call out of `repeat` runs, in seconds.
+
+    A cold run is a single call after clearing the caches. A warm run is
+    enough calls to take at least 0.2 seconds, after a first call.
+    """
+    if mode == "warm":
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat, number)) / number
+
+    best = float("inf")
+    for _ in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(
+    langs: list[str],
+    corpora: list[str],
+    modes: list[str],
+    pattern: str,
+    repeat: int,
+) -> dict[str, Any]:
+    results = {}
+    for lang in langs:
+        for corpus in corpora:
+            text = get_corpus(corpus, lang)
+            for name, func, required in iter_functions():
+                if not re.search(pattern, name):
+                    continue
+                kwargs = {
+                    param: lang if param == "lang" else ARGUMENTS[param]
+                    for param in required
+                }
+                for mode in modes:
+                    key = f"{mode}/{lang}/{corpus}/{name}"
+                    try:
+                        results[key] = time_call(
+                            lambda: func(text, **kwargs), mode, repeat
+                        )
+                    except ValueError as error:
+                        # e.g. gunning_fog has no syllable threshold for German
+                        print(f"{key}: skipped, {error}", file=sys.stderr)
+                        continue
+                    print(f"{key}: {results[key] * 1e3:.3f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "textstat": ".".join(map(str, textstat.__version__)),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """The lines of the comparison of two reports, the slower results first.
+    Results slower than the baseline by more than `threshold` are flagged, if
+    both reports kept the best of at least `MIN_REPEAT` calls."""
+    ratios = {
+        key: seconds / baseline["results"][key]
+        for key, seconds in report["results"].items()
+        if baseline["results"].get(key)
+    }
+    repeat = min(report["meta"]["repeat"], baseline["meta"].get("repeat", 1))
+    lines = []
+    if repeat < MIN_REPEAT:
+        lines.append(
+            f"Changes are not flagged, the reports need --repeat {MIN_REPEAT} "
+            "or more"
+        )
+    for key, ratio in sorted(ratios.items(), key=lambda item: -item[1]):
+        flag = ""
+        if repeat >= MIN_REPEAT and ratio > 1 + threshold:
+            flag = "  SLOWER"
+        elif repeat >= MIN_REPEAT and ratio < 1 / (1 + threshold):
+            flag = "  faster"
+        lines.append(
+            f"{ratio:6.2f}x  {baseline['results'][key] * 1e3:10.3f} ms -> "
+            f"{report['results'][key] * 1e3:10.3f} ms  {key}{flag}"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument(
+        "--lang", nargs="+", choices=list(SEEDS), default=list(SEEDS)
+    )
+    parser.add_argument("--corpus", nargs="+", choices=CORPORA, default=CORPORA)
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument(
+        "-k",
+        dest="pattern",
+        default="",
+        help="Only time the functions whose name matches this regular "
+        "expression, e.g. 'metrics.smog_index'.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of timed calls, the best one is kept. Changes are only "
+        f"flagged with {MIN_REPEAT} or more. Default: 3.",
+    )
+    parser.add_argument("--output", help="Where to write the JSON report.")
+    parser.add_argument(
+        "--baseline", help="A previous JSON report to compare the results with."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative slowdown over the baseline that is a regression. "
+        "Default: 0.25.",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.lang, args.corpus, args.mode, args.pattern, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    lines = compare(report, baseline, args.threshold)
+    print("\n".join(lines), file=sys.stderr)
+    # Exit with an error if something got slower
+    return int(any(line.endswith("SLOWER") for line in lines))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
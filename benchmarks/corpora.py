@@ -0,0 +1,158 @@
+"""The fixed corpora of the benchmarks, built offline from a seed paragraph for
+every supported language.
+
+The longer corpora are the sentences of the seed in a shuffled order, with a
+fixed random seed, so they are the same on every run and every machine.
+"""
+
+from __future__ import annotations
+
+import random
+
+SEEDS = {
+    "en_US": (
+        "The village sat at the edge of a wide, slow river. Every morning the "
+        "fishermen pushed their boats into the water before the sun had cleared "
+        "the hills. Children ran along the bank, shouting at the herons that "
+        "stood motionless in the reeds. Nobody remembered exactly when the old "
+        "stone bridge had been built, although everybody had an opinion about "
+        "it. In the afternoon the market filled with vegetables, baskets of "
+        "bread and the unmistakable smell of smoked fish. Administrative "
+        "responsibilities were handled by a committee of extraordinarily "
+        "patient volunteers. When the rains came, the river rose quickly and "
+        "the whole community worked together to protect the lower fields."
+    ),
+    "de_DE": (
+        "Das Dorf lag am Rand eines breiten, langsamen Flusses. Jeden Morgen "
+        "schoben die Fischer ihre Boote ins Wasser, bevor die Sonne über die "
+        "Hügel gestiegen war. Kinder liefen am Ufer entlang und riefen den "
+        "Reihern zu, die regungslos im Schilf standen. Niemand wusste genau, "
+        "wann die alte Steinbrücke gebaut worden war. Am Nachmittag füllte "
+        "sich der Markt mit Gemüse, Brotkörben und dem Geruch von geräuchertem "
+        "Fisch. Die Gemeindeverwaltung wurde von außergewöhnlich geduldigen "
+        "Freiwilligen übernommen. Wenn der Regen kam, stieg der Fluss schnell, "
+        "und die ganze Gemeinschaft schützte gemeinsam die unteren Felder."
+    ),
+    "es_ES": (
+        "El pueblo estaba a la orilla de un río ancho y lento. Cada mañana los "
+        "pescadores empujaban sus barcas al agua antes de que el sol asomara "
+        "por las colinas. Los niños corrían por la orilla gritando a las garzas "
+        "que esperaban inmóviles entre los juncos. Nadie recordaba cuándo se "
+        "había construido el viejo puente de piedra. Por la tarde el mercado se "
+        "llenaba de verduras, cestas de pan y olor a pescado ahumado. La "
+        "administración municipal estaba en manos de voluntarios "
+        "extraordinariamente pacientes. Cuando llegaban las lluvias, el río "
+        "crecía deprisa y todo el pueblo trabajaba para proteger los campos."
+    ),
+    "fr_FR": (
+        "Le village se trouvait au bord d'une rivière large et lente. Chaque "
+        "matin, les pêcheurs poussaient leurs barques dans l'eau avant que le "
+        "soleil ne dépasse les collines. Les enfants couraient le long de la "
+        "rive en criant après les hérons immobiles dans les roseaux. Personne "
+        "ne savait exactement quand le vieux pont de pierre avait été construit. "
+        "L'après-midi, le marché se remplissait de légumes, de paniers de pain "
+        "et d'une odeur de poisson fumé. L'administration communale était "
+        "assurée par des bénévoles extraordinairement patients. Quand la pluie "
+        "arrivait, la rivière montait vite et tout le village protégeait les "
+        "champs."
+    ),
+    "it_IT": (
+        "Il villaggio sorgeva sulla riva di un fiume largo e lento. Ogni mattina "
+        "i pescatori spingevano le barche in acqua prima che il sole superasse "
+        "le colline. I bambini correvano lungo la riva gridando agli aironi "
+        "immobili tra le canne. Nessuno ricordava quando fosse stato costruito "
+        "il vecchio ponte di pietra. Nel pomeriggio il mercato si riempiva di "
+        "verdure, cesti di pane e profumo di pesce affumicato. "
+        "L'amministrazione comunale era affidata a volontari straordinariamente "
+        "pazienti. Quando arrivavano le piogge, il fiume cresceva in fretta e "
+        "tutta la comunità proteggeva i campi."
+    ),
+    "nl_NL": (
+        "Het dorp lag aan de rand van een brede, trage rivier. Elke ochtend "
+        "duwden de vissers hun boten het water in voordat de zon boven de "
+        "heuvels uitkwam. Kinderen renden langs de oever en riepen naar de "
+        "reigers die roerloos in het riet stonden. Niemand wist precies wanneer "
+        "de oude stenen brug was gebouwd. In de middag vulde de markt zich met "
+        "groenten, manden brood en de geur van gerookte vis. Het gemeentebestuur "
+        "werd geleid door buitengewoon geduldige vrijwilligers. Als de regen "
+        "kwam, steeg de rivier snel en beschermde het hele dorp samen de lage "
+        "velden."
+    ),
+    "pl_PL": (
+        "Wieś leżała nad brzegiem szerokiej, powolnej rzeki. Każdego ranka "
+        "rybacy spychali łodzie na wodę, zanim słońce wzeszło nad wzgórzami. "
+        "Dzieci biegały wzdłuż brzegu i krzyczały na czaple stojące nieruchomo "
+        "w trzcinach. Nikt nie pamiętał, kiedy zbudowano stary kamienny most. "
+        "Po południu targ wypełniał się warzywami, koszami chleba i zapachem "
+        "wędzonej ryby. Administracją zajmowali się niezwykle cierpliwi "
+        "wolontariusze. Kiedy przychodziły deszcze, rzeka szybko wzbierała, a "
+        "cała społeczność wspólnie chroniła niższe pola."
+    ),
+    "ru_RU": (
+        "Деревня стояла на берегу широкой медленной реки. Каждое утро рыбаки "
+        "сталкивали лодки в воду, пока солнце ещё не поднялось над холмами. "
+        "Дети бегали по берегу и кричали на цапель, неподвижно стоявших в "
+        "камышах. Никто точно не помнил, когда был построен старый каменный "
+        "мост. После обеда рынок наполнялся овощами, корзинами хлеба и запахом "
+        "копчёной рыбы. Управлением занимались необыкновенно терпеливые "
+        "добровольцы. Когда начинались дожди, река быстро поднималась, и вся "
+        "деревня вместе защищала нижние поля."
+    ),
+    "hu_HU": (
+        "A falu egy széles, lassú folyó partján feküdt. A halászok minden reggel "
+        "vízre tolták a csónakjaikat, mielőtt a nap felkelt volna a dombok "
+        "fölött. A gyerekek a parton futkostak, és a nádasban mozdulatlanul álló "
+        "gémekre kiabáltak. Senki sem emlékezett, mikor épült a régi kőhíd. "
+        "Délután a piac megtelt zöldséggel, kenyeres kosarakkal és füstölt hal "
+        "illatával. Az ügyintézést rendkívül türelmes önkéntesek végezték. "
+        "Amikor megjöttek az esők, a folyó gyorsan megáradt, és az egész "
+        "közösség együtt védte az alsó mezőket."
+    ),
+}
+
+CORPORA = ("tweet", "paragraph", "article", "book")
+# Maximum size of the tweet and minimum sizes of the others, in characters
+SIZES = {
+    "tweet": 280,
+    "article": 50 * 2**10,
+    "book": 5 * 2**20,
+}
+
+
+def get_corpus(name: str, lang: str) -> str:
+    """Build a corpus.
+
+    Parameters
+    ----------
+    name : str
+        "tweet", "paragraph" (the seed), "article" (50 KB) or "book" (5 MB).
+    lang : str
+        One of the languages of `SEEDS`.
+
+    Returns
+    -------
+    str
+        The corpus.
+
+    """
+    seed = SEEDS[lang]
+    if name == "paragraph":
+        return seed
+    size = SIZES[name]
+    sentences = seed.replace(". ", ".\0").split("\0")
+    if name == "tweet":
+        tweet = ""
+        for sentence in sentences:
+            if len(tweet) + len(sentence) >= size:
+                break
+            tweet += sentence + " "
+        return tweet.rstrip()
+
+    rng = random.Random(0)
+    paragraphs = []
+    length = 0
+    while length < size:
+        paragraph = " ".join(rng.sample(sentences, len(sentences)))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
@@ -0,0 +1,124 @@
+"""Time `import textstat` and the first call in every language, each in a new
+interpreter, and check them against an import-time budget.
+
+    python -m benchmarks.startup --output startup.json
+    python -m benchmarks.startup --baseline startup.json --budget 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+from .__main__ import compare
+from .corpora import SEEDS
+
+# Available in every language, and load the syllable and easy word resources
+METRICS = ["sentence_count", "syllable_count", "smog_index", "difficult_words"]
+# Run in a new interpreter, prints the import time and the first call time
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import textstat
+imported = time.perf_counter()
+if sys.argv[1]:
+    textstat.Engine(lang=sys.argv[1]).analyze(sys.argv[2], json.loads(sys.argv[3]))
+print(json.dumps([imported - start, time.perf_counter() - imported]))
+"""
+
+
+def time_startup(lang: str | None, repeat: int) -> tuple[float, float]:
+    """The best import time and the best first call time out of `repeat` new
+    interpreters, in seconds. Without `lang`, only the import is timed."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT, lang or "", SEEDS.get(lang, "")]
+            + [json.dumps(METRICS)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        times.append(json.loads(output))
+    return min(t[0] for t in times), min(t[1] for t in times)
+
+
+def run(langs: list[str], repeat: int) -> dict[str, Any]:
+    results = {"import": time_startup(None, repeat)[0]}
+    print(f"import: {results['import'] * 1e3:.3f} ms", file=sys.stderr)
+    for lang in langs:
+        key = f"first_call/{lang}"
+        results[key] = time_startup(lang, repeat)[1]
+        print(f"{key}: {results[key] * 1e3:.3f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument(
+        "--lang", nargs="+", choices=list(SEEDS), default=list(SEEDS)
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of new interpreters, the best time is kept. Default: 5.",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Maximum time of `import textstat`, in milliseconds.",
+    )
+    parser.add_argument("--output", help="Where to write the JSON report.")
+    parser.add_argument(
+        "--baseline", help="A previous JSON report to compare the results with."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative slowdown over the baseline that is a regression. "
+        "Default: 0.25.",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.lang, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    failed = False
+    if args.budget is not None and report["results"]["import"] * 1e3 > args.budget:
+        print(
+            f"import: over the budget of {args.budget:g} ms", file=sys.stderr
+        )
+        failed = True
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        lines = compare(report, baseline, args.threshold)
+        print("\n".join(lines), file=sys.stderr)
+        failed = failed or any(line.endswith("SLOWER") for line in lines)
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,12 @@ setup(
     package_data={"": ["easy_word_list"]},
     include_package_data=True,
     install_requires=["pyphen", "nltk", "setuptools"],
+    extras_require={
+        "numpy": ["numpy"],
+        "pandas": ["pandas"],
+        "pyarrow": ["pyarrow"],
+    },
+    entry_points={"console_scripts": ["textstat=textstat.__main__:main"]},
     license="MIT",
     python_requires=">=3.6",
     classifiers=(
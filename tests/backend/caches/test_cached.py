@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sys
+import threading
+
+from textstat.backend import caches, counts
+from textstat.backend.caches import _cached
+from .. import resources
+
+
+def test_cached_normalizes_arguments() -> None:
+    counts.count_words.cache_clear()  # type: ignore
+
+    counts.count_words(resources.SHORT_TEXT)
+    counts.count_words(resources.SHORT_TEXT, rm_punctuation=True)
+    counts.count_words(text=resources.SHORT_TEXT, rm_punctuation=True)
+    counts.count_words(resources.SHORT_TEXT, True)
+
+    info = counts.count_words.cache_info()  # type: ignore
+    assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+
+    counts.count_words(resources.SHORT_TEXT, rm_punctuation=False)
+    assert counts.count_words.cache_info().currsize == 2  # type: ignore
+
+
+def test_cached_group() -> None:
+    assert counts.count_words.cache_group == "document"  # type: ignore
+    assert counts.count_word_syllables.cache_group == "word"  # type: ignore
+    assert counts.count_words in caches.get_cache_group("document").functions
+
+
+def test_cached_digests_dont_keep_texts() -> None:
+    text = resources.LONG_TEXT * 2
+    references = sys.getrefcount(text)
+
+    counts.count_words(text)
+
+    assert sys.getrefcount(text) == references
+    assert id(text) in _cached._DIGESTS
+    counts.count_words.cache_clear()  # type: ignore
+    assert not _cached._DIGESTS
+
+
+def test_cached_counts_concurrent_calls() -> None:
+    counts.count_chars.cache_clear()  # type: ignore
+    n_threads, n_calls = 8, 2000
+
+    def call() -> None:
+        for _ in range(n_calls):
+            counts.count_chars(resources.SHORT_TEXT, True)
+
+    threads = [threading.Thread(target=call) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = counts.count_chars.cache_info()  # type: ignore
+    assert info.hits + info.misses == n_threads * n_calls
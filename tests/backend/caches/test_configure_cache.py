@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import caches, counts, utils
+from .. import resources
+
+
+@pytest.fixture
+def restore_caches():
+    yield
+    caches.configure_cache()
+    caches.configure_cache("resource")
+
+
+def test_configure_cache_max_text_length(restore_caches) -> None:
+    caches.configure_cache("document", max_text_length=len(resources.SHORT_TEXT) - 1)
+
+    counts.count_letters(resources.SHORT_TEXT)
+    counts.count_letters(resources.SHORT_TEXT)
+
+    info = counts.count_letters.cache_info()  # type: ignore
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+
+    counts.count_letters(resources.EMPTY_STR)
+    assert counts.count_letters.cache_info().currsize == 1  # type: ignore
+
+
+def test_configure_cache_max_bytes(restore_caches) -> None:
+    counts.count_words.cache_clear()  # type: ignore
+    counts.count_words(resources.SHORT_TEXT)
+    assert counts.count_words.cache_info().nbytes > 0  # type: ignore
+
+    caches.configure_cache("document", max_bytes=0)
+    assert counts.count_words.cache_info().currsize == 0  # type: ignore
+
+    counts.count_words(resources.SHORT_TEXT)
+    assert counts.count_words.cache_info().currsize == 0  # type: ignore
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu", "ttl"])
+def test_configure_cache_policy(restore_caches, policy: str) -> None:
+    caches.configure_cache("word", policy=policy, maxsize=2, ttl=60)
+    assert caches.get_cache_group("word").backend.maxsize == 2
+
+    for word in ["one", "two", "three"]:
+        counts.count_word_syllables(word, "en_US")
+
+    assert counts.count_word_syllables.cache_info().currsize == 2  # type: ignore
+
+
+def test_configure_cache_disabled(restore_caches) -> None:
+    caches.configure_cache(policy="none")
+    counts.count_chars.cache_clear()  # type: ignore
+
+    counts.count_chars(resources.SHORT_TEXT, True)
+    counts.count_chars(resources.SHORT_TEXT, True)
+
+    info = counts.count_chars.cache_info()  # type: ignore
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+    # The language resources are still cached
+    assert caches.get_cache_group("resource").enabled
+
+
+def test_configure_cache_unbounded(restore_caches) -> None:
+    caches.configure_cache("word", maxsize=None)
+    assert caches.get_cache_group("word").backend.maxsize is None
+
+    caches.configure_cache("word")
+    assert caches.get_cache_group("word").backend.maxsize == (
+        utils.constants.WORD_CACHE_SIZE
+    )
+
+
+def test_configure_cache_digest_keys() -> None:
+    counts.count_chars.cache_clear()  # type: ignore
+    text = resources.LONG_TEXT
+    assert len(text) >= utils.constants.CACHE_DIGEST_MIN_LENGTH
+
+    # An equal but distinct string object hits the cached result
+    counts.count_chars(text, True)
+    counts.count_chars("".join(list(text)), True)
+
+    info = counts.count_chars.cache_info()  # type: ignore
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"group": "sentence"}, {"policy": "fifo"}, {"policy": "ttl"}, {"maxsize": -1}],
+)
+def test_configure_cache_invalid(restore_caches, kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        caches.configure_cache(**kwargs)
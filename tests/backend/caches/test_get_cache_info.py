@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import caches, metrics
+from .. import resources
+
+
+def test_get_cache_info() -> None:
+    caches.reset_cache_info("document", clear=True)
+
+    metrics.words_per_sentence(resources.SHORT_TEXT)
+    metrics.words_per_sentence(resources.SHORT_TEXT)
+
+    info = caches.get_cache_info("document")
+    assert set(info["groups"]) == {"document"}
+
+    func_info = info["functions"]["words_per_sentence"]
+    assert (func_info.hits, func_info.misses, func_info.currsize) == (1, 1, 1)
+    assert func_info.nbytes > 0
+    assert func_info == metrics.words_per_sentence.cache_info()  # type: ignore
+
+    group_info = info["groups"]["document"]
+    assert group_info.hits == sum(i.hits for i in info["functions"].values())
+    assert group_info.currsize == sum(i.currsize for i in info["functions"].values())
+    assert group_info.nbytes == sum(i.nbytes for i in info["functions"].values())
+
+
+def test_get_cache_info_all_groups() -> None:
+    info = caches.get_cache_info()
+    assert set(info["groups"]) == {"document", "word", "resource"}
+    assert "count_word_syllables" in info["functions"]
+    assert "get_cmudict" in info["functions"]
+
+
+def test_get_cache_info_unknown_group() -> None:
+    with pytest.raises(ValueError):
+        caches.get_cache_info("sentence")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from textstat.backend import caches
+
+
+@pytest.mark.parametrize(
+    "policy, evicted",
+    [("lru", "b"), ("lfu", "c")],
+)
+def test_make_cache_backend_eviction(policy: str, evicted: str) -> None:
+    backend = caches.make_cache_backend(policy, maxsize=2)
+    backend.set("a", 1, 1)
+    backend.set("b", 2, 1)
+    backend.get("a")
+    backend.get("b")
+    backend.get("a")
+    backend.set("c", 3, 1)
+    backend.get("c")
+    backend.set("d", 4, 1)
+
+    assert backend.get(evicted) is None
+    assert backend.get("d") == 4
+    assert len(backend.sizes()) == 2
+
+
+def test_make_cache_backend_max_bytes() -> None:
+    backend = caches.make_cache_backend("lru", max_bytes=10)
+    backend.set("a", 1, 6)
+    backend.set("b", 2, 6)
+    backend.set("c", 3, 11)
+
+    assert backend.sizes() == [("b", 6)]
+
+
+def test_make_cache_backend_ttl() -> None:
+    now = [0.0]
+    backend = caches.TTLCacheBackend(10, timer=lambda: now[0])
+    backend.set("a", 1, 1)
+    now[0] = 5
+    assert backend.get("a") == 1
+    now[0] = 10
+    assert backend.get("a") is None
+    assert backend.sizes() == []
+
+
+def test_make_cache_backend_none() -> None:
+    backend = caches.make_cache_backend("none")
+    backend.set("a", 1, 1)
+    assert backend.get("a", 0) == 0
+    assert isinstance(backend, caches.CacheBackend)
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_make_cache_backend_threads(policy: str) -> None:
+    backend = caches.make_cache_backend(policy, maxsize=50)
+
+    def work(start: int) -> None:
+        for i in range(start, start + 2000):
+            backend.set(i % 80, i, 1)
+            backend.get((i * 7) % 80)
+            if i % 50 == 0:
+                backend.sizes()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Raises "OrderedDict mutated during iteration" on unlocked lookups
+        list(executor.map(work, range(0, 8000, 2000)))
+
+    assert len(backend.sizes()) == 50
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from textstat.backend import caches, counts
+from .. import resources
+
+
+def test_reset_cache_info() -> None:
+    counts.count_letters(resources.SHORT_TEXT)
+    counts.count_letters(resources.SHORT_TEXT)
+
+    caches.reset_cache_info("document")
+    info = counts.count_letters.cache_info()  # type: ignore
+    assert (info.hits, info.misses) == (0, 0)
+    assert info.currsize == 1
+
+    caches.reset_cache_info(clear=True)
+    assert counts.count_letters.cache_info().currsize == 0  # type: ignore
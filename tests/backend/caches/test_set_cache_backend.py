@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Any, Hashable
+
+import pytest
+from textstat.backend import caches, counts
+from .. import resources
+
+
+class DictCacheBackend:
+    def __init__(self) -> None:
+        self.entries: dict[Hashable, tuple[Any, int]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self.entries.get(key, (default, 0))[0]
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        self.entries[key] = (value, size)
+
+    def delete(self, key: Hashable) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def sizes(self) -> list[tuple[Hashable, int]]:
+        return [(key, size) for key, (_, size) in self.entries.items()]
+
+
+def test_set_cache_backend() -> None:
+    backend = DictCacheBackend()
+    caches.set_cache_backend(backend, "document")
+    try:
+        counts.count_letters(resources.SHORT_TEXT)
+        counts.count_letters(resources.SHORT_TEXT)
+    finally:
+        caches.configure_cache("document")
+
+    owner = "textstat.backend.counts._count_letters.count_letters"
+    assert owner in {key[0] for key in backend.entries}
+    assert counts.count_letters.cache_info().hits >= 1  # type: ignore
+
+
+def test_set_cache_backend_invalid() -> None:
+    with pytest.raises(TypeError):
+        caches.set_cache_backend(object())  # type: ignore
+    with pytest.raises(ValueError):
+        caches.set_cache_backend(DictCacheBackend(), "sentence")
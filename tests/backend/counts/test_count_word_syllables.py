@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import counts
+
+
+@pytest.mark.parametrize(
+    "lang,word,n_syllables",
+    [
+        ("en_US", "", 0),
+        ("en_US", "relived", 2),
+        ("en_US", "monopoly", 4),
+        ("en_US", "day's", 1),
+        ("en_US", "stimulating", 4),
+        ("de_DE", "sonnenschein", 3),
+        ("en_US", "  spaced  ", 1),
+        ("en_US", "\tmonopoly\n", 4),
+    ],
+)
+def test_count_word_syllables(lang: str, word: str, n_syllables: int) -> None:
+    assert counts.count_word_syllables(word, lang) == n_syllables
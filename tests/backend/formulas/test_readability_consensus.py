@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import formulas, metrics
+from .. import resources
+
+
+def test_readability_consensus() -> None:
+    # 8.5 counts for 8, 9 and 8, the reading ease for 8 and 9
+    assert formulas.readability_consensus(8.5, 65, 1, 2, 3, 4, 5, 6) == 8.0
+    # Ties go to the grade that comes first
+    assert formulas.readability_consensus(1, 95, 2, 3, 4, 6, 7, 8) == 1.0
+    assert formulas.readability_consensus(0, 0, 0, 0, 0, 0, 0, 0) == 0.0
+
+
+@pytest.mark.parametrize(
+    "text", [resources.EMPTY_STR, resources.EASY_TEXT, resources.LONG_TEXT]
+)
+def test_readability_consensus_arrays(text: str) -> None:
+    np = pytest.importorskip("numpy")
+    scores = [
+        metrics.flesch_kincaid_grade(text, "en_US"),
+        metrics.flesch_reading_ease(text, "en_US"),
+        metrics.smog_index(text, "en_US"),
+        metrics.coleman_liau_index(text),
+        metrics.automated_readability_index(text),
+        metrics.dale_chall_readability_score(text, "en_US"),
+        metrics.linsear_write_formula(text, "en_US", False, True),
+        metrics.gunning_fog(text, "en_US"),
+    ]
+
+    grades = formulas.readability_consensus(*(np.array([s, s]) for s in scores))
+
+    assert list(grades) == [metrics.text_standard(text, "en_US")] * 2
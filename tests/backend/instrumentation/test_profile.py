@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from textstat.backend import counts, instrumentation, metrics
+from .. import resources
+
+
+def test_profile() -> None:
+    counts.count_sentences.cache_clear()  # type: ignore
+    metrics.flesch_reading_ease.cache_clear()  # type: ignore
+
+    with instrumentation.profile() as profiler:
+        counts.count_sentences(resources.LONG_TEXT)
+        counts.count_sentences(resources.LONG_TEXT)
+        metrics.flesch_reading_ease(resources.LONG_TEXT, "en_US")
+    # Not recorded anymore
+    counts.count_sentences(resources.LONG_TEXT)
+
+    records = profiler.as_dict()
+    assert records["counts.count_sentences"]["calls"] == 3
+    assert records["counts.count_sentences"]["misses"] == 1
+    assert records["counts.count_sentences"]["hits"] == 2
+    assert "metrics.flesch_reading_ease" in records
+    for record in records.values():
+        assert record["calls"] == record["hits"] + record["misses"]
+        assert 0 <= record["own_time"] <= record["total_time"]
+    fre = records["metrics.flesch_reading_ease"]
+    assert fre["own_time"] < fre["total_time"]
+
+    table = profiler.format_table(limit=2).splitlines()
+    assert len(table) == 3
+    assert table[0].split()[:4] == ["function", "calls", "hits", "misses"]
+    assert table[1].split()[0] == next(iter(records))
+
+
+def test_profile_errors() -> None:
+    with instrumentation.profile() as profiler:
+        with pytest.raises(ValueError):
+            metrics.gunning_fog(resources.SHORT_TEXT, "de_DE")
+        with pytest.raises(RuntimeError):
+            profiler.__enter__()
+    assert profiler.as_dict()["metrics.gunning_fog"]["misses"] == 1
+    assert not instrumentation._observed_call.OBSERVERS
+
+
+def test_profile_analyze() -> None:
+    ts = type(textstat)()
+    texts = [resources.SHORT_TEXT, resources.EASY_TEXT]
+
+    with instrumentation.profile() as profiler:
+        ts.batch(texts, ["flesch_reading_ease", "smog_index"], n_jobs=1)
+
+    records = profiler.as_dict()
+    assert "profiles.get_text_profile" in records
+    for name in ["analyze.flesch_reading_ease", "analyze.smog_index"]:
+        assert records[name]["calls"] == records[name]["misses"] == len(texts)
+        assert records[name]["total_time"] > 0
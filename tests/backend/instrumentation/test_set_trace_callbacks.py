@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from textstat import textstat
+from textstat.backend import counts, instrumentation, metrics
+from .. import resources
+
+
+def test_set_trace_callbacks() -> None:
+    metrics.flesch_reading_ease.cache_clear()  # type: ignore
+    started: list[str] = []
+    ended: list[tuple[Any, ...]] = []
+
+    def on_start(call: instrumentation.ObservedCallInfo) -> int:
+        started.append(call.name)
+        return len(started)
+
+    def on_end(call: instrumentation.ObservedCallInfo, span: int) -> None:
+        ended.append(
+            (span, call.name, call.text_length, call.lang, call.cached, call.elapsed)
+        )
+
+    instrumentation.set_trace_callbacks(on_start, on_end)
+    try:
+        metrics.flesch_reading_ease(resources.EASY_TEXT, lang="en_US")
+        metrics.flesch_reading_ease(resources.EASY_TEXT, "en_US")
+    finally:
+        instrumentation.set_trace_callbacks()
+    counts.count_sentences(resources.EASY_TEXT)
+
+    assert started[0] == started[-1] == "metrics.flesch_reading_ease"
+    assert len(started) == len(ended) > 2
+    # Nested calls end before their caller, which ends last
+    span, name, text_length, lang, cached, elapsed = ended[-2]
+    assert (span, name) == (1, "metrics.flesch_reading_ease")
+    assert (text_length, lang, cached) == (len(resources.EASY_TEXT), "en_US", False)
+    assert elapsed >= max(end[-1] for end in ended[:-2])
+    assert ended[-1][0] == len(started)
+    assert ended[-1][4] is True
+    assert {end[1] for end in ended} >= {"counts.count_sentences"}
+
+
+def test_set_trace_callbacks_errors() -> None:
+    ended = []
+    instrumentation.set_trace_callbacks(on_end=lambda call, span: ended.append(call))
+    try:
+        with pytest.raises(ValueError):
+            metrics.gunning_fog(resources.SHORT_TEXT, "de_DE")
+    finally:
+        instrumentation.set_trace_callbacks()
+    assert ended[-1].name == "metrics.gunning_fog"
+    assert not instrumentation._observed_call.OBSERVERS
+
+
+def test_set_trace_callbacks_analyze() -> None:
+    ts = type(textstat)()
+    ended: list[instrumentation.ObservedCallInfo] = []
+    text = resources.SHORT_TEXT + " Not cached yet."
+
+    instrumentation.set_trace_callbacks(on_end=lambda call, span: ended.append(call))
+    try:
+        ts.analyze(text, ["flesch_reading_ease", "lexicon_count"])
+        ts.evaluate(ts.text_profile(text), ["gunning_fog"])
+    finally:
+        instrumentation.set_trace_callbacks()
+
+    calls = {call.name: call for call in ended if call.name.startswith("analyze.")}
+    assert list(calls) == [
+        "analyze.flesch_reading_ease",
+        "analyze.lexicon_count",
+        "analyze.gunning_fog",
+    ]
+    assert calls["analyze.gunning_fog"].text_length == len(text)
+    assert calls["analyze.gunning_fog"].lang == "en_US"
+
+
+def test_set_trace_callbacks_failing_callback() -> None:
+    def fail(*args: Any) -> None:
+        raise RuntimeError("tracer is down")
+
+    instrumentation.set_trace_callbacks(on_start=fail, on_end=fail)
+    try:
+        with pytest.warns(Warning, match="tracer is down"):
+            score = metrics.flesch_reading_ease(resources.EASY_TEXT, "en_US")
+    finally:
+        instrumentation.set_trace_callbacks()
+    assert score == metrics.flesch_reading_ease(resources.EASY_TEXT, "en_US")
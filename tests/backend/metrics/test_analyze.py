@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from textstat.backend import counts, metrics
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        (resources.EMPTY_STR, "en_US"),
+        (resources.EASY_TEXT, "en_US"),
+        (resources.LONG_TEXT, "en_US"),
+        (resources.HARD_HUNGARIAN_TEXT, "hu_HU"),
+    ],
+)
+def test_analyze(text: str, lang: str) -> None:
+    results = metrics.analyze(
+        text,
+        lang,
+        [
+            "flesch_reading_ease",
+            "smog_index",
+            "coleman_liau_index",
+            "text_standard",
+            "count_words",
+        ],
+    )
+
+    assert results == {
+        "flesch_reading_ease": metrics.flesch_reading_ease(text, lang),
+        "smog_index": metrics.smog_index(text, lang),
+        "coleman_liau_index": metrics.coleman_liau_index(text),
+        "text_standard": metrics.text_standard(text, lang),
+        "count_words": counts.count_words(text),
+    }
+
+
+def test_analyze_kwargs() -> None:
+    results = metrics.analyze(
+        resources.LONG_TEXT,
+        "en_US",
+        {
+            "wiener_sachtextformel": {"variant": 2},
+            "linsear_write_formula": {"strict_upper": False},
+            "gunning_fog": None,
+        },
+    )
+
+    assert results == {
+        "wiener_sachtextformel": metrics.wiener_sachtextformel(
+            resources.LONG_TEXT, 2, "en_US"
+        ),
+        "linsear_write_formula": metrics.linsear_write_formula(
+            resources.LONG_TEXT, "en_US", strict_lower=False, strict_upper=False
+        ),
+        "gunning_fog": metrics.gunning_fog(resources.LONG_TEXT, "en_US"),
+    }
+
+
+def test_analyze_unknown_metric() -> None:
+    with pytest.raises(ValueError):
+        metrics.analyze(resources.SHORT_TEXT, "en_US", ["flesch_reading_eas"])
+
+
+def test_analyze_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        metrics.analyze(resources.SHORT_TEXT, "en_US", {"lix": {"threshold": 3}})
+    with pytest.raises(ValueError):
+        metrics.analyze(
+            resources.SHORT_TEXT, "en_US", {"count_difficult_words": {"unique": True}}
+        )
+    assert metrics.analyze(
+        resources.LONG_TEXT, "en_US", {"count_difficult_words": {"unique": False}}
+    ) == {
+        "count_difficult_words": counts.count_difficult_words(
+            resources.LONG_TEXT, "en_US", unique=False
+        )
+    }
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import profiles
+from .. import resources
+
+TEXT = "\n".join(
+    [
+        resources.LONG_TEXT + ".",
+        resources.PUNCT_TEXT,
+        "Mr. Smith went to Washington. It rained!Then it stopped.",
+        resources.HARD_ARABIC_TEXT,
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        (TEXT, "en_US"),
+        (resources.SHORT_TEXT, "en_US"),
+        ("", "en_US"),
+        (TEXT, "ar_SA"),
+    ],
+)
+def test_get_sentence_index(text: str, lang: str) -> None:
+    index = profiles.get_sentence_index(text, lang)
+    n = len(index)
+
+    assert index.span(0, n) == (0, len(text))
+    for start, stop in [(0, n), (0, 0), (1, 3), (2, n), (n // 2, n - 1)]:
+        begin, end = index.span(start, stop)
+        assert index.profile(start, stop) == (
+            profiles.get_text_profile(text[begin:end], lang)
+        )
+
+
+def test_sentence_index_windows() -> None:
+    index = profiles.get_sentence_index(TEXT, "en_US")
+
+    windows = list(index.windows(5, 2))
+
+    assert [(start, stop) for start, stop, _ in windows] == [
+        (i, i + 5) for i in range(0, len(index) - 4, 2)
+    ]
+    for start, stop, profile in windows:
+        assert profile == index.profile(start, stop)
+    assert [(start, stop) for start, stop, _ in index.windows(100)] == [
+        (0, len(index))
+    ]
+    with pytest.raises(ValueError):
+        index.windows(0)
+
+
+def test_get_sentence_index_skips_profile_cache() -> None:
+    text = resources.LONG_TEXT + " The sentences are not profiled one by one."
+    profiles.get_text_profile.cache_clear()  # type: ignore
+
+    profiles.get_sentence_index(text, "en_US")
+
+    assert profiles.get_text_profile.cache_info().currsize == 0  # type: ignore
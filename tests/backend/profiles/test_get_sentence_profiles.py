@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import counts, profiles
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.EMPTY_STR,
+        resources.SHORT_TEXT,
+        resources.PUNCT_TEXT,
+        resources.LONG_TEXT,
+        "Mr. Smith went to Washington. Hi. It rained all day. Bye.",
+    ],
+)
+def test_get_sentence_profiles(text: str) -> None:
+    sentences = profiles.get_sentence_profiles(text, "en_US")
+
+    assert len(sentences) == (counts.count_sentences(text) if text else 0)
+    for start, end, profile in sentences:
+        assert profile == profiles.get_text_profile(text[start:end], "en_US")
+        assert profile.count_sentences() == 1
+
+
+def test_get_sentence_profiles_short_candidates() -> None:
+    text = "Mr. Smith went to Washington. Hi. It rained all day. Bye."
+
+    spans = [
+        text[start:end]
+        for start, end, _ in profiles.get_sentence_profiles(text, "en_US")
+    ]
+
+    assert spans == ["Mr. Smith went to Washington.", "Hi. It rained all day. Bye."]
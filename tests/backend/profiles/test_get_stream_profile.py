@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import profiles
+from .. import resources
+
+TEXT = "\n\n".join(
+    [
+        resources.LONG_TEXT,
+        resources.PUNCT_TEXT,
+        resources.EASY_TEXT,
+        resources.HARD_ARABIC_TEXT,
+    ]
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, len(TEXT)])
+@pytest.mark.parametrize("block_size", [1, 50, 2**16])
+def test_get_stream_profile(chunk_size: int, block_size: int) -> None:
+    chunks = (TEXT[i:i + chunk_size] for i in range(0, len(TEXT), chunk_size))
+
+    profile = profiles.get_stream_profile(chunks, "en_US", block_size=block_size)
+
+    assert profile == profiles.get_text_profile(TEXT, "en_US")
+
+
+def test_get_stream_profile_empty() -> None:
+    assert profiles.get_stream_profile([], "en_US") == (
+        profiles.get_text_profile("", "en_US")
+    )
+
+
+def test_get_stream_profile_long_sentence() -> None:
+    text = " ".join(["word"] * 1000)
+    chunks = (text[i:i + 10] for i in range(0, len(text), 10))
+
+    profile = profiles.get_stream_profile(
+        chunks, "en_US", block_size=100, max_buffer_size=200
+    )
+    expected = profiles.get_text_profile(text, "en_US")
+
+    # Cut between words
+    assert profile.count_words() == expected.count_words()
+    assert profile.count_syllables() == expected.count_syllables()
+    assert profile.count_sentences() > expected.count_sentences()
+
+
+def test_get_stream_profile_skips_profile_cache() -> None:
+    chunks = [resources.LONG_TEXT, resources.PUNCT_TEXT]
+    profiles.get_text_profile.cache_clear()  # type: ignore
+
+    profiles.get_stream_profile(chunks, "en_US", block_size=50)
+
+    assert profiles.get_text_profile.cache_info().currsize == 0  # type: ignore
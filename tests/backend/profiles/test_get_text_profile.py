@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import counts, profiles
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        (resources.EMPTY_STR, "en_US"),
+        (resources.EASY_TEXT, "en_US"),
+        (resources.SHORT_TEXT, "en_US"),
+        (resources.PUNCT_TEXT, "en_US"),
+        (resources.LONG_TEXT, "en_US"),
+        (resources.LONG_SPANISH_TEXT, "es_ES"),
+        (resources.HARD_HUNGARIAN_TEXT, "hu_HU"),
+        (resources.HARD_ARABIC_TEXT, "en_US"),
+    ],
+)
+def test_get_text_profile(text: str, lang: str) -> None:
+    profile = profiles.get_text_profile(text, lang)
+
+    assert profile.lang == lang
+    assert profile.count_chars() == counts.count_chars(text, ignore_spaces=True)
+    assert profile.count_chars(False) == counts.count_chars(text, ignore_spaces=False)
+    assert profile.count_letters() == counts.count_letters(text)
+    assert profile.count_words() == counts.count_words(text)
+    assert profile.count_words(False) == counts.count_words(text, rm_punctuation=False)
+    assert profile.count_sentences() == counts.count_sentences(text)
+    assert profile.count_syllables() == counts.count_syllables(text, lang)
+    assert profile.count_polysyllable_words() == counts.count_polysyllable_words(
+        text, lang
+    )
+    assert profile.count_monosyllable_words() == counts.count_monosyllable_words(
+        text, lang
+    )
+    assert profile.count_long_words() == counts.count_long_words(text)
+    assert profile.count_miniwords() == counts.count_miniwords(text)
+    for threshold in (0, 2, 3):
+        assert profile.count_difficult_words(threshold) == (
+            counts.count_difficult_words(text, lang, threshold)
+        )
+    assert profile.count_complex_arabic_words() == (
+        counts.count_complex_arabic_words(text)
+    )
+    assert profile.count_arabic_long_words() == counts.count_arabic_long_words(text)
+    assert profile.count_arabic_syllables() == counts.count_arabic_syllables(text)
+    assert profile.count_faseeh() == counts.count_faseeh(text)
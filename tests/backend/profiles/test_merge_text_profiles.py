@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import profiles
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        (resources.EASY_TEXT, "en_US"),
+        (resources.LONG_TEXT, "en_US"),
+        (resources.HARD_HUNGARIAN_TEXT, "hu_HU"),
+        (resources.HARD_ARABIC_TEXT, "en_US"),
+        (" ".join(["Word."] * 150), "en_US"),
+    ],
+)
+def test_merge_text_profiles(text: str, lang: str) -> None:
+    # Cut after every sentence
+    parts = text.replace(". ", ". \0").split("\0")
+
+    profile = profiles.merge_text_profiles(
+        profiles.get_text_profile(part, lang) for part in parts
+    )
+
+    assert profile == profiles.get_text_profile(text, lang)
+
+
+def test_merge_text_profiles_errors() -> None:
+    with pytest.raises(ValueError):
+        profiles.merge_text_profiles([])
+    with pytest.raises(ValueError):
+        profiles.merge_text_profiles(
+            [
+                profiles.get_text_profile(resources.SHORT_TEXT, "en_US"),
+                profiles.get_text_profile(resources.SHORT_TEXT, "de_DE"),
+            ]
+        )
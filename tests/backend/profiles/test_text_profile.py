@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import metrics, profiles
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        (resources.EMPTY_STR, "en_US"),
+        (resources.EASY_TEXT, "en_US"),
+        (resources.SHORT_TEXT, "en_US"),
+        (resources.PUNCT_TEXT, "en_US"),
+        (resources.LONG_TEXT, "en_US"),
+        (resources.LONG_TEXT, "hu_HU"),
+        (resources.HARD_HUNGARIAN_TEXT, "hu_HU"),
+        (resources.EASY_ARABIC_TEXT, "en_US"),
+    ],
+)
+def test_text_profile(text: str, lang: str) -> None:
+    profile = profiles.get_text_profile(text, lang)
+
+    for name in [
+        "automated_readability_index",
+        "chars_per_word",
+        "coleman_liau_index",
+        "gulpease_index",
+        "gutierrez_polini",
+        "letters_per_word",
+        "lix",
+        "mcalpine_eflaw",
+        "osman",
+        "rix",
+        "sentences_per_word",
+        "words_per_sentence",
+    ]:
+        assert getattr(profile, name)() == getattr(metrics, name)(text)
+
+    for name in [
+        "crawford",
+        "dale_chall_readability_score",
+        "dale_chall_readability_score_v2",
+        "fernandez_huerta",
+        "flesch_kincaid_grade",
+        "flesch_reading_ease",
+        "gunning_fog",
+        "smog_index",
+        "spache_readability",
+        "syllables_per_word",
+        "szigriszt_pazos",
+        "text_standard",
+    ]:
+        assert getattr(profile, name)() == getattr(metrics, name)(text, lang)
+
+    for strict_lower in (False, True):
+        for strict_upper in (False, True):
+            assert profile.linsear_write_formula(
+                strict_lower, strict_upper
+            ) == metrics.linsear_write_formula(text, lang, strict_lower, strict_upper)
+    for variant in (1, 2, 3, 4):
+        assert profile.wiener_sachtextformel(variant) == (
+            metrics.wiener_sachtextformel(text, variant, lang)
+        )
+    assert profile.reading_time(14.69) == metrics.reading_time(text, 14.69)
+
+
+def test_text_profile_without_syllables() -> None:
+    text = resources.HARD_ARABIC_TEXT
+    profile = profiles.get_text_profile(text, "ar_SA")
+
+    assert profile.syllables is None
+    assert profile.merge(profile).syllables is None
+    for name in ["osman", "lix", "rix", "words_per_sentence", "gulpease_index"]:
+        assert getattr(profile, name)() == getattr(metrics, name)(text)
+    for name in ["flesch_reading_ease", "smog_index", "text_standard"]:
+        with pytest.raises(KeyError):
+            getattr(metrics, name)(text, "ar_SA")
+        with pytest.raises(KeyError):
+            getattr(profile, name)()
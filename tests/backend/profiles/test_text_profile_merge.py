@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from textstat.backend import profiles
+from .. import resources
+
+PARTS = [resources.EASY_TEXT, resources.LONG_TEXT + ".", resources.PUNCT_TEXT]
+TEXT = "\n".join(PARTS)
+
+
+def test_merge() -> None:
+    first, second, third = (
+        profiles.get_text_profile(part, "en_US")
+        for part in (PARTS[0] + "\n", PARTS[1] + "\n", PARTS[2])
+    )
+    expected = profiles.get_text_profile(TEXT, "en_US")
+
+    assert first.merge(second, third) == expected
+    assert first + second + third == expected
+    assert first + (second + third) == expected
+    assert sum([first, second, third]) == expected
+    assert first.merge() is first
+
+
+def test_merge_errors() -> None:
+    profile = profiles.get_text_profile(resources.SHORT_TEXT, "en_US")
+
+    with pytest.raises(ValueError):
+        profile + profiles.get_text_profile(resources.SHORT_TEXT, "de_DE")
+    with pytest.raises(TypeError):
+        profile + 1  # type: ignore
+
+
+def test_pickle() -> None:
+    profile = profiles.get_text_profile(resources.LONG_TEXT, "hu_HU")
+
+    unpickled = pickle.loads(pickle.dumps(profile))
+
+    assert unpickled == profile
+    assert unpickled.smog_index() == profile.smog_index()
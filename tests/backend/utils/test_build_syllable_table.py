@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from textstat.__main__ import main
+from textstat.backend import utils
+
+
+def test_build_syllable_table(tmp_path) -> None:
+    word_list = tmp_path / "words.txt"
+    word_list.write_text("Blorptastic\nhello\n\nzorp\n", encoding="utf-8")
+    store = utils.SyllableStore(tmp_path / "store.db")
+    store.add("en_US", "zorp", 7)
+    store.close()
+
+    path = tmp_path / "en_US.bin"
+    n_words = utils.build_syllable_table(
+        path, "en_US", [tmp_path / "store.db", word_list]
+    )
+    table = utils.open_syllable_table(path)
+
+    assert n_words == len(table) == 3
+    # Earlier sources take precedence
+    assert table.get("zorp") == 7
+    assert table.get("hello") == 2
+    assert table.get("blorptastic") is not None
+
+
+def test_build_syllable_table_command(tmp_path) -> None:
+    path = tmp_path / "en_US.bin"
+    assert main(["build-syllable-table", str(path)]) == 0
+    assert len(utils.open_syllable_table(path)) == len(
+        utils.get_syllable_table("en_US")  # type: ignore
+    )
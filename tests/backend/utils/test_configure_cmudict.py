@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import nltk
+import pytest
+from textstat.backend import utils
+from textstat.backend.utils import _get_cmudict
+
+
+@pytest.fixture
+def cmudict_options(monkeypatch):
+    for key, value in _get_cmudict._CMUDICT_OPTIONS.items():
+        monkeypatch.setitem(_get_cmudict._CMUDICT_OPTIONS, key, value)
+    yield
+    utils.get_cmudict.cache_clear()  # type: ignore
+
+
+def test_configure_cmudict_offline(cmudict_options, monkeypatch) -> None:
+    def find(resource_name: str) -> None:
+        raise LookupError(resource_name)
+
+    def download(*args, **kwargs) -> None:
+        raise AssertionError("cmudict must not be downloaded in offline mode")
+
+    monkeypatch.setattr(nltk.data, "find", find)
+    monkeypatch.setattr(nltk, "download", download)
+    utils.configure_cmudict(offline=True)
+
+    with pytest.raises(LookupError):
+        utils.get_cmudict("en_US")
+    assert utils.get_cmudict("de_DE") is None
+
+
+def test_configure_cmudict_data_path(cmudict_options, monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(nltk.data, "path", list(nltk.data.path))
+    utils.configure_cmudict(data_path=tmp_path)
+
+    assert utils.get_cmudict("en_US") is not None
+    assert nltk.data.path[0] == str(tmp_path)
+
+
+def test_nltk_is_imported_lazily() -> None:
+    code = (
+        "import sys, textstat; textstat.syllable_count('Hello world'); "
+        "sys.exit('nltk' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
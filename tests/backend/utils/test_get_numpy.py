@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+from textstat.backend import utils
+from textstat.backend.utils import _get_numpy
+
+
+def test_get_numpy_caches_missing_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_get_numpy, "_STATE", {})
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    assert utils.get_numpy() is None
+    # The failed import is not retried
+    monkeypatch.delitem(sys.modules, "numpy")
+    assert utils.get_numpy() is None
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import utils
+
+
+def test_get_syllable_table() -> None:
+    table = utils.get_syllable_table("en_US")
+    assert table is not None
+    cmudict = utils.get_cmudict("en_US")
+    assert len(table) == len(cmudict)  # type: ignore
+
+    for word in ["hello", "readability", "a", "don't", "it's"]:
+        phones = cmudict[word][0]  # type: ignore
+        assert table.get(word) == sum(1 for p in phones if p[-1].isdigit())
+    assert table.get("blorptastic") is None
+    assert "hello" in table
+
+
+@pytest.mark.parametrize("lang", ["de_DE", "es_ES", "hu_HU"])
+def test_get_syllable_table_missing(lang: str) -> None:
+    assert utils.get_syllable_table(lang) is None
+
+
+def test_syllable_table_build() -> None:
+    counts = {"zebra": 2, "apple": 2, "a": 1, "café": 2, "": 0}
+    table = utils.SyllableTable(utils.SyllableTable.build(counts))
+
+    assert len(table) == len(counts)
+    assert {word: table.get(word) for word in counts} == counts
+    assert list(table.words()) == sorted(counts, key=str.encode)
+    assert table.get("b") is None
+
+    with pytest.raises(ValueError):
+        utils.SyllableTable.build({"long": 256})
+    with pytest.raises(ValueError):
+        utils.SyllableTable(b"not a table")
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import mmap
+
+from textstat.backend import counts, utils
+
+
+def test_set_syllable_table_dir(tmp_path) -> None:
+    (tmp_path / "de.bin").write_bytes(utils.SyllableTable.build({"blorp": 9}))
+    utils.set_syllable_table_dir(tmp_path)
+    try:
+        table = utils.get_syllable_table("de_DE")
+        assert table is not None
+        assert isinstance(table._data, mmap.mmap)
+        assert counts.count_word_syllables("blorp", "de_DE") == 9
+        # Words missing from the table are still counted
+        assert counts.count_word_syllables("haus", "de_DE") == 1
+    finally:
+        utils.set_syllable_table_dir(None)
+
+    assert utils.get_syllable_table("de_DE") is None
+    assert counts.count_word_syllables("blorp", "de_DE") != 9
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import warnings
+
+import pytest
+from textstat.backend import counts, utils
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    yield tmp_path / "syllables.db"
+    utils.set_syllable_store(None)
+
+
+def test_syllable_store(store_path) -> None:
+    store = utils.SyllableStore(store_path, batch_size=2)
+    store.add("en_US", "blorptastic", 3)
+    assert store.get("en_US", "blorptastic") == 3
+
+    # Another process only sees full batches
+    other = utils.SyllableStore(store_path)
+    assert other.get("en_US", "blorptastic") is None
+    store.add("en_US", "zorp", 1)
+    assert other.get("en_US", "blorptastic") == 3
+    assert other.get("de_DE", "blorptastic") is None
+
+    store.add("de_DE", "blorptastic", 4)
+    store.close()
+    assert other.get("de_DE", "blorptastic") == 4
+    assert len(other) == 3
+    other.close()
+
+
+def test_set_syllable_store(store_path) -> None:
+    word = "blorptastic"
+    store = utils.set_syllable_store(store_path)
+    assert utils.get_syllable_store() is store
+
+    counts.count_word_syllables.cache_clear()  # type: ignore
+    n_syll = counts.count_word_syllables(word, "en_US")
+    assert store.get("en_US", word) == n_syll
+    # Words in the pronunciation dictionary are not stored
+    counts.count_word_syllables("hello", "en_US")
+    assert store.get("en_US", "hello") is None
+
+    # Restarted workers read the count from the store
+    utils.set_syllable_store(None)
+    store = utils.set_syllable_store(store_path)
+    store.add("en_US", "zorp", 7)
+    counts.count_word_syllables.cache_clear()  # type: ignore
+    assert counts.count_word_syllables("zorp", "en_US") == 7
+    assert len(store) == 2
+
+
+def test_syllable_store_read_error(tmp_path) -> None:
+    # A directory can't be opened as a database
+    store = utils.SyllableStore(tmp_path)
+
+    with pytest.warns(Warning, match="Could not read"):
+        assert store.get("en_US", "blorptastic") is None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert store.get("en_US", "zorp") is None
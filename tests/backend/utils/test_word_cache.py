@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from textstat.backend import counts, utils, validations
+from .. import resources
+
+
+def test_word_cache() -> None:
+    for func in [
+        counts.count_syllables,
+        counts.count_word_syllables,
+        counts.count_polysyllable_words,
+        counts.count_monosyllable_words,
+        validations.is_difficult_word,
+    ]:
+        func.cache_clear()  # type: ignore
+
+    counts.count_polysyllable_words(resources.EASY_TEXT, "en_US")
+    counts.count_monosyllable_words(resources.EASY_TEXT, "en_US")
+    validations.is_difficult_word("Regardless", 2, "en_US")
+
+    # Per-word lookups don't end up in the document-level cache
+    assert counts.count_syllables.cache_info().currsize == 0  # type: ignore
+
+    info = counts.count_word_syllables.cache_info()  # type: ignore
+    assert info.maxsize == utils.constants.WORD_CACHE_SIZE
+    assert info.currsize > 0
+    assert info.hits > 0
@@ -23,6 +23,8 @@ from .. import resources
         ("fragile", 2, "en", True),
         ("readability", 2, "en", True),
         ("regardless", 2, "en", True),
+        ("  spaced  ", 2, "en", False),
+        ("  fragile  ", 2, "en", True),
     ],
 )
 def test_is_difficult_word(
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from textstat.backend import profiles, vectorized
+from textstat.backend.utils import _get_numpy
+from .. import resources
+
+TEXTS = [
+    resources.EMPTY_STR,
+    resources.SHORT_TEXT,
+    resources.EASY_TEXT,
+    resources.LONG_TEXT,
+    resources.PUNCT_TEXT,
+    resources.HARD_ARABIC_TEXT,
+    " ".join(["Word."] * 150),
+]
+
+METRICS = {
+    name: None
+    for name in vectorized.__all__
+    if name not in ("evaluate", "get_count_arrays")
+}
+METRICS["wiener_sachtextformel"] = {"variant": 1}
+# The textstat methods that differ from the vectorized metrics, and their
+# arguments
+PUBLIC_METHODS = {
+    "chars_per_word": ("avg_character_per_word", {}),
+    "letters_per_word": ("avg_letter_per_word", {}),
+    "sentences_per_word": ("avg_sentence_per_word", {}),
+    "syllables_per_word": ("avg_syllables_per_word", {}),
+    "text_standard": ("text_standard", {"float_output": True}),
+}
+LANG_TEXTS = {
+    "es_ES": [resources.LONG_SPANISH_TEXT, resources.EASY_SPANISH_TEXT],
+    "it_IT": [resources.ITALIAN_TEXT],
+    "de_DE": [resources.GERMAN_SAMPLE_A, resources.GERMAN_SAMPLE_B],
+    "ru_RU": [resources.LONG_RUSSIAN_TEXT_GUILLEMETS],
+}
+LANGS = ["en_US", "hu_HU", "es_ES", "it_IT", "de_DE", "pl_PL", "ru_RU"]
+
+
+def _check_evaluate(lang: str) -> None:
+    texts = TEXTS + LANG_TEXTS.get(lang, [])
+    text_profiles = [profiles.get_text_profile(text, lang) for text in texts]
+    counts = vectorized.get_count_arrays(text_profiles)
+    ts = type(textstat)()
+    ts.set_lang(lang)
+
+    for name, kwargs in METRICS.items():
+        method, public_kwargs = PUBLIC_METHODS.get(name, (name, kwargs or {}))
+        try:
+            expected = [getattr(ts, method)(text, **public_kwargs) for text in texts]
+        except ValueError:
+            # e.g. no syllable threshold or Flesch constants for the language
+            with pytest.raises(ValueError):
+                vectorized.evaluate(counts, {name: kwargs}, lang)
+            continue
+
+        values = vectorized.evaluate(counts, {name: kwargs}, lang)[name]
+
+        assert list(values) == expected, name
+        assert expected == [
+            getattr(profile, name)(**(kwargs or {})) for profile in text_profiles
+        ], name
+
+
+@pytest.mark.parametrize("lang", LANGS)
+def test_evaluate(lang: str) -> None:
+    _check_evaluate(lang)
+
+
+@pytest.mark.parametrize("lang", LANGS)
+def test_evaluate_without_numpy(lang: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(_get_numpy._STATE, "numpy", None)
+    assert vectorized.get_count_arrays([])["words"] == []
+
+    _check_evaluate(lang)
+    assert vectorized.flesch_kincaid_grade(10, [2, 0], [15, 0]) == [
+        pytest.approx(4.06),
+        0.0,
+    ]
+
+
+def test_evaluate_errors() -> None:
+    counts = vectorized.get_count_arrays(
+        [profiles.get_text_profile(resources.SHORT_TEXT, "en_US")]
+    )
+
+    with pytest.raises(ValueError):
+        vectorized.evaluate(counts, ["unknown"])
+    with pytest.raises(ValueError):
+        vectorized.evaluate({"words": [1]}, ["words_per_sentence"])
+    with pytest.raises(ValueError):
+        # No syllable threshold for the difficult words of German
+        vectorized.evaluate(
+            vectorized.get_count_arrays(
+                [profiles.get_text_profile(resources.SHORT_TEXT, "de_DE")]
+            ),
+            ["gunning_fog"],
+        )
+    with pytest.raises(ValueError):
+        vectorized.evaluate(counts, {"wiener_sachtextformel": {"variant": 5}})
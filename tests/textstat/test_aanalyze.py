@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+import textstat
+from ..backend import resources
+
+TEXTS = [
+    resources.EMPTY_STR,
+    resources.EASY_TEXT,
+    resources.SHORT_TEXT,
+    resources.PUNCT_TEXT,
+    resources.LONG_TEXT,
+]
+METRICS = ["flesch_reading_ease", "lexicon_count", "text_standard"]
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the largest number of calls running at once."""
+
+    def __init__(self) -> None:
+        super().__init__(8)
+        self.running = self.max_running = 0
+        self.lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):  # type: ignore[override]
+        def run():
+            with self.lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.running -= 1
+
+        return super().submit(run)
+
+
+@pytest.fixture
+def restore_async():
+    yield
+    textstat.configure_async()
+
+
+async def analyze_all(engine) -> list[dict]:
+    return await asyncio.gather(*(engine.aanalyze(text, METRICS) for text in TEXTS))
+
+
+def test_aanalyze(restore_async) -> None:
+    engine = textstat.Engine(lang="hu_HU", round_points=2)
+    assert asyncio.run(analyze_all(engine)) == [
+        engine.analyze(text, METRICS) for text in TEXTS
+    ]
+
+
+def test_aanalyze_max_concurrency(restore_async) -> None:
+    with CountingExecutor() as executor:
+        textstat.configure_async(executor, max_concurrency=2)
+        asyncio.run(analyze_all(textstat.textstat))
+    assert executor.max_running <= 2
+
+
+def test_aanalyze_process_executor(restore_async) -> None:
+    with ProcessPoolExecutor(2) as executor:
+        textstat.configure_async(executor)
+        results = asyncio.run(analyze_all(textstat.textstat))
+    assert results == [textstat.analyze(text, METRICS) for text in TEXTS]
+
+
+def test_aanalyze_unknown_metric() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(textstat.aanalyze(resources.SHORT_TEXT, ["not_a_metric"]))
+    with pytest.raises(ValueError):
+        textstat.configure_async(max_concurrency=0)
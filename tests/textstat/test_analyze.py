@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.EMPTY_STR,
+        resources.EASY_TEXT,
+        resources.SHORT_TEXT,
+        resources.PUNCT_TEXT,
+        resources.LONG_TEXT,
+    ],
+)
+def test_analyze(text: str) -> None:
+    ts = type(textstat)()
+    ts.set_rounding_points(2)
+    names = [
+        "flesch_reading_ease",
+        "flesch_kincaid_grade",
+        "smog_index",
+        "coleman_liau_index",
+        "automated_readability_index",
+        "dale_chall_readability_score",
+        "difficult_words",
+        "linsear_write_formula",
+        "gunning_fog",
+        "text_standard",
+        "lexicon_count",
+        "syllable_count",
+        "avg_syllables_per_word",
+        "spache_readability",
+    ]
+
+    results = ts.analyze(text, names)
+
+    assert list(results) == names
+    for name in names:
+        assert results[name] == getattr(ts, name)(text)
+
+
+def test_analyze_kwargs() -> None:
+    ts = type(textstat)()
+    text = resources.LONG_TEXT
+
+    results = ts.analyze(
+        text,
+        {
+            "text_standard": {"float_output": True},
+            "lexicon_count": {"removepunct": False},
+            "long_word_count": {"threshold": 4},
+            "wiener_sachtextformel": {"variant": 3},
+        },
+    )
+
+    assert results == {
+        "text_standard": ts.text_standard(text, float_output=True),
+        "lexicon_count": ts.lexicon_count(text, removepunct=False),
+        "long_word_count": ts.long_word_count(text, threshold=4),
+        "wiener_sachtextformel": ts.wiener_sachtextformel(text, variant=3),
+    }
+
+
+def test_analyze_difficult_words() -> None:
+    text = resources.LONG_TEXT
+    specs = {
+        "difficult_words": {"syllable_threshold": 3, "unique": False},
+        "lexicon_count": {"split_hyphens": True},
+    }
+
+    # Unique words are counted on the text, the others from its profile
+    assert textstat.analyze(text, ["difficult_words"]) == {
+        "difficult_words": textstat.difficult_words(text)
+    }
+    assert textstat.analyze(text, specs) == {
+        "difficult_words": textstat.difficult_words(text, 3, unique=False),
+        "lexicon_count": textstat.lexicon_count(text, split_hyphens=True),
+    }
+
+
+def test_analyze_unknown_metric() -> None:
+    with pytest.raises(ValueError):
+        textstat.analyze(resources.SHORT_TEXT, ["set_lang"])
+    with pytest.raises(ValueError):
+        textstat.analyze(resources.SHORT_TEXT, {"difficult_words": {"uniq": False}})
+    with pytest.raises(ValueError):
+        textstat.analyze(resources.SHORT_TEXT, ["wiener_sachtextformel"])
+
+
+def test_analyze_arabic() -> None:
+    ts = type(textstat)()
+    ts.set_lang("ar_SA")
+    text = resources.HARD_ARABIC_TEXT
+    names = ["osman", "lexicon_count", "sentence_count", "lix", "char_count"]
+
+    assert ts.analyze(text, names) == {name: getattr(ts, name)(text) for name in names}
+    with pytest.raises(KeyError):
+        ts.flesch_reading_ease(text)
+    with pytest.raises(KeyError):
+        ts.analyze(text, ["osman", "flesch_reading_ease"])
+
+
+@pytest.mark.parametrize("text", [resources.EMPTY_STR, "hello world"])
+@pytest.mark.parametrize(
+    "name",
+    [
+        "flesch_reading_ease",
+        "dale_chall_readability_score",
+        "dale_chall_readability_score_v2",
+        "gunning_fog",
+        "text_standard",
+        "syllable_count",
+        "polysyllabcount",
+    ],
+)
+def test_analyze_arabic_parity(text: str, name: str) -> None:
+    ts = type(textstat)()
+    ts.set_lang("ar_SA")
+
+    # Without syllables analyze scores the texts the method itself can score
+    try:
+        expected = getattr(ts, name)(text)
+    except KeyError:
+        with pytest.raises(KeyError):
+            ts.analyze(text, [name])
+    else:
+        assert ts.analyze(text, [name]) == {name: expected}
+
+
+def test_evaluate_arabic_empty_text() -> None:
+    ts = type(textstat)()
+    ts.set_lang("ar_SA")
+    profile = ts.text_profile(resources.EMPTY_STR)
+    names = ["flesch_reading_ease", "gunning_fog", "syllable_count"]
+
+    assert profile.syllables == 0
+    assert ts.evaluate(profile, names) == {
+        name: getattr(ts, name)(resources.EMPTY_STR) for name in names
+    }
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+METRICS = {
+    "flesch_reading_ease": None,
+    "lexicon_count": None,
+    "linsear_write_formula": None,
+    "text_standard": {"float_output": True},
+    "wiener_sachtextformel": {"variant": 1},
+}
+
+
+def test_analyze_stream() -> None:
+    text = resources.LONG_TEXT * 3
+    chunks = (text[i:i + 100] for i in range(0, len(text), 100))
+
+    assert textstat.analyze_stream(chunks, METRICS) == (
+        textstat.analyze(text, METRICS)
+    )
+
+
+def test_analyze_stream_errors() -> None:
+    with pytest.raises(ValueError):
+        textstat.analyze_stream([resources.SHORT_TEXT], ["difficult_words"])
+    with pytest.raises(ValueError):
+        textstat.analyze_stream(
+            [resources.SHORT_TEXT], {"lexicon_count": {"split_hyphens": True}}
+        )
+
+
+def test_analyze_file(tmp_path) -> None:
+    path = tmp_path / "text.txt"
+    path.write_text(resources.LONG_TEXT, encoding="utf-16")
+
+    assert textstat.analyze_file(path, METRICS, encoding="utf-16") == (
+        textstat.analyze(resources.LONG_TEXT, METRICS)
+    )
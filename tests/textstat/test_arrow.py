@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from textstat import Engine, textstat
+from ..backend import resources
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+arrow = pytest.importorskip("textstat.arrow")
+
+METRICS = ["flesch_reading_ease", "text_standard", "lexicon_count"]
+TEXTS = [resources.LONG_TEXT, None, resources.EASY_TEXT, resources.LONG_TEXT]
+
+
+def test_analyze_batches() -> None:
+    table = pa.table({"id": [1, 2, 3, 4], "body": TEXTS})
+
+    batches = list(
+        arrow.analyze_batches(table.to_batches(max_chunksize=3), "body", METRICS)
+    )
+
+    assert len(batches) == 2
+    result = pa.Table.from_batches(batches)
+    assert result.column_names == ["id", "body"] + METRICS
+    for text, row in zip(TEXTS, result.to_pylist()):
+        if text is None:
+            assert all(row[name] is None for name in METRICS)
+        else:
+            assert {name: row[name] for name in METRICS} == (
+                textstat.analyze(text, METRICS)
+            )
+
+
+def test_analyze_parquet(tmp_path: Path) -> None:
+    source = tmp_path / "corpus.parquet"
+    destination = tmp_path / "scores.parquet"
+    pq.write_table(pa.table({"body": TEXTS}), source)
+    engine = Engine(lang="es_ES")
+
+    arrow.analyze_parquet(
+        source,
+        destination,
+        "body",
+        {"szigriszt_pazos": None},
+        engine=engine,
+        keep_columns=False,
+        batch_size=2,
+    )
+
+    result = pq.read_table(destination)
+    assert result.column_names == ["szigriszt_pazos"]
+    assert result.column("szigriszt_pazos").to_pylist() == [
+        None if text is None else engine.szigriszt_pazos(text) for text in TEXTS
+    ]
+
+
+def test_analyze_parquet_empty(tmp_path: Path) -> None:
+    source = tmp_path / "corpus.parquet"
+    destination = tmp_path / "scores.parquet"
+    pq.write_table(pa.table({"body": pa.array([], pa.string())}), source)
+
+    arrow.analyze_parquet(source, destination, "body", METRICS)
+
+    result = pq.read_table(destination)
+    assert result.num_rows == 0
+    assert result.schema.field("text_standard").type == pa.string()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+import pytest
+from textstat import textstat
+from textstat.backend import counts, utils
+from ..backend import resources
+
+TEXTS = [
+    resources.EMPTY_STR,
+    resources.EASY_TEXT,
+    resources.SHORT_TEXT,
+    resources.PUNCT_TEXT,
+    resources.LONG_TEXT,
+]
+METRICS = ["flesch_reading_ease", "lexicon_count", "text_standard"]
+
+
+@pytest.mark.parametrize("n_jobs, chunksize", [(1, None), (2, None), (2, 1)])
+def test_batch(n_jobs: int, chunksize: int | None) -> None:
+    ts = type(textstat)()
+    ts.set_lang("hu_HU")
+    ts.set_rounding_points(2)
+
+    results = ts.batch(TEXTS, METRICS, n_jobs=n_jobs, chunksize=chunksize)
+
+    assert results == [ts.analyze(text, METRICS) for text in TEXTS]
+
+
+def test_batch_executor() -> None:
+    with ThreadPoolExecutor(2) as executor:
+        results = textstat.batch(iter(TEXTS), METRICS, executor=executor)
+        assert results == [textstat.analyze(text, METRICS) for text in TEXTS]
+        # The executor is left running
+        assert executor.submit(len, "text").result() == 4
+
+
+class _InlineExecutor(Executor):
+    """Runs the calls in the calling thread and records the chunk sizes."""
+
+    def __init__(self) -> None:
+        self.chunksizes: list[int] = []
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        self.chunksizes.append(len(args[0]))
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.mark.parametrize(
+    "n_jobs, chunksize, chunksizes", [(1, None, [2, 2, 1]), (2, 3, [3, 2])]
+)
+def test_batch_executor_chunksize(
+    n_jobs: int, chunksize: int | None, chunksizes: list[int]
+) -> None:
+    # Chunks only depend on n_jobs and chunksize, not on the executor
+    executor = _InlineExecutor()
+
+    results = textstat.batch(
+        TEXTS, METRICS, n_jobs=n_jobs, executor=executor, chunksize=chunksize
+    )
+
+    assert results == [textstat.analyze(text, METRICS) for text in TEXTS]
+    assert executor.chunksizes == chunksizes
+
+
+def test_batch_unknown_metric() -> None:
+    with pytest.raises(ValueError):
+        textstat.batch(TEXTS, ["flesch_reading_ease", "not_a_metric"], n_jobs=2)
+
+
+def test_batch_flushes_syllable_store(tmp_path) -> None:
+    store_path = tmp_path / "syllables.db"
+    utils.set_syllable_store(store_path, batch_size=1000)
+    counts.count_word_syllables.cache_clear()  # type: ignore
+    try:
+        textstat.batch(["Blorptastic zorpification."] * 2, ["syllable_count"], 1)
+
+        # Without waiting for the store to fill a batch or to be closed
+        other = utils.SyllableStore(store_path)
+        assert other.get("en_US", "blorptastic") is not None
+        other.close()
+    finally:
+        utils.set_syllable_store(None)
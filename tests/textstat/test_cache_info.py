@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import textstat
+from ..backend import resources
+
+
+def test_cache_info() -> None:
+    textstat.reset_cache_info(clear=True)
+    textstat.flesch_reading_ease(resources.SHORT_TEXT)
+    textstat.flesch_reading_ease(resources.SHORT_TEXT)
+
+    info = textstat.cache_info()
+    assert info["functions"]["flesch_reading_ease"].hits == 1
+    assert info["groups"]["document"].hits >= 1
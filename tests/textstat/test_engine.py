@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from textstat import Engine, textstat
+from ..backend import resources
+
+LANGS = ["en_US", "de_DE", "es_ES", "it_IT", "hu_HU"]
+
+
+@pytest.mark.parametrize("lang", LANGS)
+def test_engine(lang: str) -> None:
+    ts = type(textstat)()
+    ts.set_lang(lang)
+    ts.set_rm_apostrophe(False)
+    ts.set_rounding_points(1)
+    engine = Engine(lang=lang, rm_apostrophe=False, round_points=1)
+
+    for method in ["flesch_reading_ease", "lexicon_count", "syllable_count"]:
+        assert getattr(engine, method)(resources.LONG_TEXT) == getattr(ts, method)(
+            resources.LONG_TEXT
+        )
+    assert engine.remove_punctuation("don't!") == ts.remove_punctuation("don't!")
+
+
+def test_engine_is_immutable() -> None:
+    engine = Engine()
+    with pytest.raises(AttributeError):
+        engine.set_lang("de_DE")
+    with pytest.raises(AttributeError):
+        engine.set_rounding_points(2)
+    with pytest.raises(AttributeError):
+        engine.text_encoding = "latin-1"
+
+    german = engine.replace(lang="de_DE")
+    assert (engine.lang, german.lang) == ("en_US", "de_DE")
+    assert german == Engine("de_DE")
+    assert pickle.loads(pickle.dumps(german)) == german
+    with pytest.raises(TypeError):
+        engine.replace(language="de_DE")
+
+
+def test_engine_threads() -> None:
+    engines = [Engine(lang=lang) for lang in LANGS]
+    expected = [engine.flesch_reading_ease(resources.LONG_TEXT) for engine in engines]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(
+                lambda i: engines[i % len(engines)].flesch_reading_ease(
+                    resources.LONG_TEXT
+                ),
+                range(200),
+            )
+        )
+
+    assert results == [expected[i % len(engines)] for i in range(200)]
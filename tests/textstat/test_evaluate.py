@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import textstat as textstat_module
+from textstat import textstat
+from ..backend import resources
+
+METRICS = {
+    "flesch_reading_ease": None,
+    "lexicon_count": None,
+    "smog_index": None,
+    "text_standard": {"float_output": True},
+}
+
+
+def test_evaluate() -> None:
+    profile = textstat.text_profile(resources.LONG_TEXT)
+
+    assert isinstance(profile, textstat_module.TextProfile)
+    assert textstat.evaluate(profile, METRICS) == (
+        textstat.analyze(resources.LONG_TEXT, METRICS)
+    )
+
+
+def test_evaluate_shards() -> None:
+    shards = [resources.LONG_TEXT + ".\n"] * 3
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        profile = sum(executor.map(textstat.text_profile, shards))
+
+    assert textstat.evaluate(profile, METRICS) == (
+        textstat.analyze("".join(shards), METRICS)
+    )
+
+
+def test_evaluate_difficult_words() -> None:
+    profile = textstat.text_profile(resources.LONG_TEXT)
+    specs = {"difficult_words": {"unique": False}}
+
+    assert textstat.evaluate(profile, specs) == {
+        "difficult_words": textstat.difficult_words(
+            resources.LONG_TEXT, unique=False
+        )
+    }
+
+
+def test_evaluate_errors() -> None:
+    profile = textstat.text_profile(resources.SHORT_TEXT)
+
+    with pytest.raises(ValueError):
+        textstat.evaluate(profile, ["difficult_words"])
+    with pytest.raises(ValueError):
+        textstat.evaluate(profile, ["merge"])
+    with pytest.raises(ValueError):
+        textstat.evaluate(profile, {"difficult_words": {"unique": True}})
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import textstat
+
+
+def test_import_is_lazy() -> None:
+    code = (
+        "import sys, textstat\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "assert 'textstat.backend.counts' not in sys.modules\n"
+        "assert 'lexicon_count' not in vars(textstat)\n"
+        "assert 'lexicon_count' in dir(textstat)\n"
+        "assert textstat.lexicon_count('Two words') == 2\n"
+        "assert 'textstat.backend.counts' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes() -> None:
+    from textstat.backend.caches import get_cache_info
+    from textstat.engine import Engine
+
+    assert textstat.Engine is Engine
+    assert textstat.cache_info is get_cache_info
+    assert set(textstat.__all__) <= set(dir(textstat))
+    assert set(textstat.backend.__all__) <= set(dir(textstat.backend))
+
+
+def test_default_instance_methods() -> None:
+    assert textstat.flesch_reading_ease == textstat.textstat.flesch_reading_ease
+    assert textstat.set_lang.__self__ is textstat.textstat
+    assert "flesch_reading_ease" in dir(textstat)
+    assert "_cache_clear" not in dir(textstat)
+    for name in ["_cache_clear", "no_such_metric"]:
+        assert not hasattr(textstat, name)
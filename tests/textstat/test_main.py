@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import lzma
+import multiprocessing
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from textstat import textstat
+import textstat.__main__ as textstat_main
+from textstat.__main__ import main
+from ..backend import resources
+
+TEXTS = [resources.LONG_TEXT, resources.EASY_TEXT, resources.SHORT_TEXT]
+METRICS = ["flesch_reading_ease", "lexicon_count"]
+
+
+def _set_stdin(monkeypatch: pytest.MonkeyPatch, data: bytes) -> None:
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+
+@pytest.mark.parametrize("compress", [bytes, gzip.compress, lzma.compress])
+def test_score_jsonl(
+    compress: Callable[[bytes], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    lines = [json.dumps({"id": i, "body": text}) for i, text in enumerate(TEXTS)]
+    lines.insert(1, json.dumps({"id": "missing", "body": None}))
+    _set_stdin(monkeypatch, compress("\n".join(lines).encode()))
+
+    assert main(
+        ["score", "-f", "jsonl", "--text-field", "body", "--keep-field", "id"]
+        + ["-m", ",".join(METRICS), "-j", "2", "--batch-size", "1"]
+    ) == 0
+
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row.pop("id") for row in rows] == [0, "missing", 1, 2]
+    assert rows.pop(1) == dict.fromkeys(METRICS)
+    assert rows == [textstat.analyze(text, METRICS) for text in TEXTS]
+
+
+def test_score_csv(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    lines = tmp_path / "lines.txt.gz"
+    lines.write_bytes(gzip.compress("\n".join(TEXTS[1:]).encode()))
+    text = tmp_path / "text.txt"
+    text.write_text(TEXTS[0], encoding="utf-8")
+
+    assert main(["score", "-o", "csv", "-m", "lexicon_count", str(lines)]) == 0
+    assert capsys.readouterr().out.splitlines() == ["lexicon_count"] + [
+        str(textstat.lexicon_count(text)) for text in TEXTS[1:]
+    ]
+
+    assert main(["score", "-f", "text", "-m", "lexicon_count", str(text)]) == 0
+    assert json.loads(capsys.readouterr().out) == {
+        "lexicon_count": textstat.lexicon_count(TEXTS[0])
+    }
+
+
+def test_score_errors(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit):
+        main(["score", "-m", "unknown"])
+
+    _set_stdin(monkeypatch, b"not json\n")
+    assert main(["score", "-f", "jsonl", "-m", "lexicon_count"]) == 1
+    assert "-:1" in capsys.readouterr().err
+
+
+def test_score_language_errors(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _set_stdin(monkeypatch, b"Hello world.\n")
+
+    assert main(["score", "-m", "flesch_reading_ease", "--lang", "ar_SA"]) == 1
+    err = capsys.readouterr().err.strip().splitlines()
+    assert err[-1] == (
+        "python -m textstat score: error: Syllables can't be counted for ar_SA, "
+        "pyphen has no dictionary for it"
+    )
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_score_worker_errors(
+    jobs: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    if jobs != "1" and multiprocessing.get_start_method() != "fork":
+        pytest.skip("The workers don't inherit the patched function")
+
+    def fail(*args: object) -> None:
+        raise KeyError("missing resource")
+
+    monkeypatch.setattr(textstat_main, "_analyze_texts", fail)
+    _set_stdin(monkeypatch, b"Hello world.\nBye.\n")
+
+    assert main(["score", "-m", "lexicon_count", "-j", jobs]) == 1
+    assert capsys.readouterr().err == (
+        "python -m textstat score: error: missing resource\n"
+    )
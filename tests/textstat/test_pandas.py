@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+from textstat import Engine, textstat
+from ..backend import resources
+
+pd = pytest.importorskip("pandas")
+# Registers the accessor
+pytest.importorskip("textstat.pandas")
+
+METRICS = ["flesch_reading_ease", "smog_index", "lexicon_count"]
+
+
+def test_analyze() -> None:
+    texts = [resources.LONG_TEXT, resources.EASY_TEXT, resources.LONG_TEXT]
+    series = pd.Series(texts, index=["a", "b", "c"])
+
+    frame = series.textstat.analyze(METRICS)
+
+    assert list(frame.columns) == METRICS
+    assert list(frame.index) == ["a", "b", "c"]
+    for text, (_, row) in zip(texts, frame.iterrows()):
+        assert row.to_dict() == textstat.analyze(text, METRICS)
+
+
+def test_analyze_missing_values() -> None:
+    series = pd.Series([resources.SHORT_TEXT, None, math.nan])
+
+    frame = series.textstat.analyze(METRICS, n_jobs=2)
+
+    assert frame.loc[0].to_dict() == textstat.analyze(resources.SHORT_TEXT, METRICS)
+    assert frame.loc[1:].isna().all().all()
+    assert list(pd.Series([None]).textstat.analyze(METRICS).columns) == METRICS
+
+
+def test_analyze_engine() -> None:
+    series = pd.Series([resources.LONG_SPANISH_TEXT])
+    engine = Engine(lang="es_ES")
+
+    frame = series.textstat.analyze({"szigriszt_pazos": None}, engine=engine)
+
+    assert frame.loc[0, "szigriszt_pazos"] == engine.szigriszt_pazos(
+        resources.LONG_SPANISH_TEXT
+    )
+
+
+def test_analyze_errors() -> None:
+    with pytest.raises(TypeError):
+        pd.Series([1, 2]).textstat.analyze(METRICS)
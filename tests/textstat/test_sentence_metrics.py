@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+
+def test_sentence_metrics() -> None:
+    text = resources.LONG_TEXT
+
+    results = textstat.sentence_metrics(text, ["flesch_kincaid_grade", "smog_index"])
+
+    assert len(results) == textstat.sentence_count(text)
+    for result in results:
+        sentence = text[result["start"]:result["end"]]
+        assert result == {
+            "start": result["start"],
+            "end": result["end"],
+            "words": textstat.lexicon_count(sentence),
+            "syllables": textstat.syllable_count(sentence),
+            "difficult_words": len(
+                textstat.difficult_words_list(sentence, unique=False)
+            ),
+            "flesch_kincaid_grade": textstat.flesch_kincaid_grade(sentence),
+            "smog_index": textstat.smog_index(sentence),
+        }
+
+
+def test_sentence_metrics_arabic() -> None:
+    ts = type(textstat)()
+    ts.set_lang("ar_SA")
+    text = resources.HARD_ARABIC_TEXT
+
+    results = ts.sentence_metrics(text, ["osman"])
+
+    assert len(results) == ts.sentence_count(text)
+    for result in results:
+        sentence = text[result["start"]:result["end"]]
+        assert result["syllables"] is result["difficult_words"] is None
+        assert result["osman"] == ts.osman(sentence)
+
+
+def test_sentence_metrics_errors() -> None:
+    with pytest.raises(ValueError):
+        textstat.sentence_metrics(resources.LONG_TEXT, ["difficult_words"])
@@ -23,3 +23,17 @@ def test_set_lang(lang: str, expected: int) -> None:
     ts = type(textstat)()
     ts.set_lang(lang)
     assert ts.syllable_count(resources.EASY_TEXT) == expected
+
+
+def test_set_lang_without_reading_ease_constants() -> None:
+    # Polish has no Flesch Reading Ease constants, which empty texts don't need
+    ts = type(textstat)()
+    ts.set_lang("pl_PL")
+
+    assert ts.flesch_reading_ease(resources.EMPTY_STR) == 0.0
+    assert ts.text_standard(resources.EMPTY_STR) == "-1th and 0th grade"
+    assert ts.analyze(resources.EMPTY_STR, ["flesch_reading_ease"]) == {
+        "flesch_reading_ease": 0.0
+    }
+    with pytest.raises(ValueError):
+        ts.flesch_reading_ease(resources.LONG_TEXT)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+METRICS = ["flesch_reading_ease", "linsear_write_formula", "text_standard"]
+
+
+def test_sliding_windows() -> None:
+    text = resources.LONG_TEXT
+    index = textstat.sentence_index(text)
+
+    windows = list(textstat.sliding_windows(text, METRICS, size=4, step=3))
+
+    assert len(windows) == (len(index) - 4) // 3 + 1
+    for start, stop, results in windows:
+        begin, end = index.span(start, stop)
+        assert results == textstat.analyze(text[begin:end], METRICS)
+
+
+def test_sliding_windows_errors() -> None:
+    with pytest.raises(ValueError):
+        textstat.sliding_windows(resources.LONG_TEXT, ["difficult_words"], 4)
+    with pytest.raises(ValueError):
+        textstat.sliding_windows(resources.LONG_TEXT, METRICS, 4, step=0)
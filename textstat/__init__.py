@@ -1,14 +1,74 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .textstat import textstat
 from . import backend
 
+if TYPE_CHECKING:
+    from .engine import Engine
+    from .aio import configure_async
+    from .backend.instrumentation import profile, set_trace_callbacks
+    from .backend.profiles import TextProfile
+    from .backend.caches import (
+        configure_cache,
+        get_cache_info as cache_info,
+        reset_cache_info,
+        set_cache_backend,
+    )
+
 
 __version__ = (0, 7, 11)
 
+# Imported on first access, with the module and the name they come from, so
+# that `import textstat` stays cheap
+_LAZY_ATTRIBUTES = {
+    "Engine": (".engine", "Engine"),
+    "configure_async": (".aio", "configure_async"),
+    "profile": (".backend.instrumentation", "profile"),
+    "TextProfile": (".backend.profiles", "TextProfile"),
+    "cache_info": (".backend.caches", "get_cache_info"),
+    "configure_cache": (".backend.caches", "configure_cache"),
+    "reset_cache_info": (".backend.caches", "reset_cache_info"),
+    "set_cache_backend": (".backend.caches", "set_cache_backend"),
+    "set_trace_callbacks": (".backend.instrumentation", "set_trace_callbacks"),
+}
+
+
+def _is_method(name: str) -> bool:
+    """Whether `name` is a public method of the default `textstat` instance."""
+    return not name.startswith("_") and callable(getattr(textstat, name, None))
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module, __name__), attribute)
+    elif _is_method(name):
+        # The methods of the default instance, e.g. `textstat.flesch_reading_ease`
+        value = getattr(textstat, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-for attribute in dir(textstat):
-    if callable(getattr(textstat, attribute)):
-        if not attribute.startswith("_"):
-            globals()[attribute] = getattr(textstat, attribute)
+def __dir__() -> list[str]:
+    methods = {name for name in dir(textstat) if _is_method(name)}
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | methods)
 
 
-__all__ = ["textstat", "backend"]
+__all__ = [
+    "textstat",
+    "backend",
+    "Engine",
+    "TextProfile",
+    "cache_info",
+    "configure_async",
+    "configure_cache",
+    "profile",
+    "reset_cache_info",
+    "set_cache_backend",
+    "set_trace_callbacks",
+]
@@ -0,0 +1,289 @@
+"""Command line interface, see `python -m textstat --help`."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import lzma
+import sys
+from collections import deque
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator
+
+from .backend import utils
+from .engine import Engine
+from .textstat import _analyze_texts, _load_resources
+
+# Magic numbers of the compressed inputs
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+# Errors of the input, the metrics or the language resources, which are
+# reported without a traceback, also when they are raised in a worker
+_SCORE_ERRORS = (BrokenExecutor, LookupError, OSError, ValueError)
+
+
+def _error_message(error: Exception) -> str:
+    """The message of an error, without the quotes that KeyError adds."""
+    if isinstance(error, KeyError) and len(error.args) == 1:
+        return str(error.args[0])
+    return str(error)
+
+
+def _open_input(path: str, encoding: str) -> IO[str]:
+    """Open a file, or stdin for "-", decompressing gzip and xz input."""
+    raw: Any = sys.stdin.buffer if path == "-" else open(path, "rb")
+    stream = io.BufferedReader(raw) if not hasattr(raw, "peek") else raw
+    magic = stream.peek(len(_XZ_MAGIC))
+    if magic.startswith(_GZIP_MAGIC):
+        stream = gzip.GzipFile(fileobj=stream)
+    elif magic.startswith(_XZ_MAGIC):
+        stream = lzma.LZMAFile(stream)
+    return io.TextIOWrapper(stream, encoding=encoding)
+
+
+def _read_documents(
+    paths: list[str],
+    input_format: str,
+    text_field: str,
+    keep_fields: list[str],
+    encoding: str,
+) -> Iterator[tuple[str | None, dict[str, Any]]]:
+    """Read the text and the kept fields of every document, in order."""
+    for path in paths:
+        file = _open_input(path, encoding)
+        try:
+            if input_format == "text":
+                yield file.read(), {}
+            elif input_format == "lines":
+                for line in file:
+                    yield line.rstrip("\r\n"), {}
+            else:
+                for i, line in enumerate(file, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        text = record.get(text_field)
+                    except (ValueError, AttributeError):
+                        raise ValueError(f"{path}:{i}: not a JSON object") from None
+                    if text is not None and not isinstance(text, str):
+                        raise ValueError(f"{path}:{i}: {text_field} is not a string")
+                    yield text, {name: record.get(name) for name in keep_fields}
+        finally:
+            # Leave stdin open
+            if path == "-":
+                file.detach()
+            else:
+                file.close()
+
+
+def _score(
+    engine: Engine, specs: dict[str, dict[str, Any]], texts: list[str | None]
+) -> list[dict[str, Any] | None]:
+    """Score a chunk of documents in this process."""
+    results = iter(_analyze_texts(engine, specs, [t for t in texts if t is not None]))
+    return [None if text is None else next(results) for text in texts]
+
+
+def _iter_results(
+    engine: Engine,
+    specs: dict[str, dict[str, Any]],
+    texts: Iterable[str | None],
+    n_jobs: int,
+    batch_size: int,
+) -> Iterator[list[dict[str, Any] | None]]:
+    """Score the documents in chunks of `batch_size`, on `n_jobs` processes,
+    and yield the results of every chunk in order.
+    """
+    texts = iter(texts)
+    chunks = iter(lambda: list(islice(texts, batch_size)), [])
+    if n_jobs == 1:
+        for chunk in chunks:
+            yield _score(engine, specs, chunk)
+        return
+
+    # Keep every worker busy without reading the whole input ahead
+    with ProcessPoolExecutor(
+        max_workers=n_jobs, initializer=_load_resources, initargs=(engine.lang,)
+    ) as pool:
+        pending: deque[Future[list[dict[str, Any] | None]]] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(_score, engine, specs, chunk))
+                if len(pending) > 2 * n_jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Don't score the rest of the input after an error
+            for future in pending:
+                future.cancel()
+
+
+def _score_command(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    metric_names = [
+        name for value in args.metrics for name in value.split(",") if name
+    ]
+    try:
+        metric_args = json.loads(args.metric_args)
+    except ValueError:
+        metric_args = None
+    if not isinstance(metric_args, dict):
+        parser.error("--metric-args must be a JSON object")
+    specs = {name: metric_args.get(name) or {} for name in metric_names}
+    if args.jobs < 1 or args.batch_size < 1:
+        parser.error("--jobs and --batch-size must be positive")
+    engine = Engine(lang=args.lang, round_points=args.round)
+    try:
+        # Fail before reading the input if a metric is unknown, or can't be
+        # calculated in the language
+        engine.analyze("", specs)
+    except (TypeError, ValueError) as error:
+        parser.error(str(error))
+    except _SCORE_ERRORS as error:
+        print(f"{parser.prog}: error: {_error_message(error)}", file=sys.stderr)
+        return 1
+
+    documents = _read_documents(
+        args.inputs, args.format, args.text_field, args.keep_fields, args.encoding
+    )
+    fields: list[dict[str, Any]] = []
+
+    def texts() -> Iterator[str | None]:
+        for text, kept in documents:
+            fields.append(kept)
+            yield text
+
+    output = sys.stdout
+    columns = args.keep_fields + list(specs)
+    writer = csv.DictWriter(output, columns, lineterminator="\n")
+    if args.output_format == "csv":
+        writer.writeheader()
+    results = _iter_results(engine, specs, texts(), args.jobs, args.batch_size)
+    try:
+        for chunk in results:
+            rows = [
+                {**fields[i], **(result or dict.fromkeys(specs))}
+                for i, result in enumerate(chunk)
+            ]
+            del fields[: len(chunk)]
+            if args.output_format == "csv":
+                writer.writerows(rows)
+            else:
+                output.writelines(json.dumps(row) + "\n" for row in rows)
+            output.flush()
+    except _SCORE_ERRORS as error:
+        print(f"{parser.prog}: error: {_error_message(error)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m textstat")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build-syllable-table",
+        help="Generate a memory-mappable syllable table.",
+        description=(
+            "Generate a syllable table that worker processes can memory-map and "
+            "share, see textstat.backend.utils.set_syllable_table_dir."
+        ),
+    )
+    build.add_argument("output", help="Where to write the table, e.g. en_US.bin.")
+    build.add_argument("--lang", default="en_US", help="Language of the table.")
+    build.add_argument(
+        "--source",
+        action="append",
+        dest="sources",
+        help=(
+            "'cmudict', a syllable store database or a word list file. Can be "
+            "repeated, earlier sources take precedence. Defaults to cmudict."
+        ),
+    )
+
+    score = commands.add_parser(
+        "score",
+        help="Score documents from files or stdin.",
+        description=(
+            "Score documents with several metrics and write a JSON line or a CSV "
+            "row for every document to stdout, in input order. gzip and xz "
+            "input is decompressed."
+        ),
+    )
+    score.add_argument(
+        "inputs", nargs="*", default=["-"], help="Input files, - for stdin."
+    )
+    score.add_argument(
+        "-m",
+        "--metric",
+        action="append",
+        dest="metrics",
+        required=True,
+        help="Metric to calculate, see textstat.analyze. Can be repeated or "
+        "comma-separated.",
+    )
+    score.add_argument(
+        "--metric-args",
+        default="{}",
+        help='Other arguments of the metrics, e.g. \'{"wiener_sachtextformel": '
+        '{"variant": 1}}\'.',
+    )
+    score.add_argument(
+        "-f",
+        "--format",
+        choices=["lines", "jsonl", "text"],
+        default="lines",
+        help="A document per line, a JSON object per line, or a document per "
+        "file. Default: lines.",
+    )
+    score.add_argument(
+        "--text-field", default="text", help="Text field of JSON objects."
+    )
+    score.add_argument(
+        "--keep-field",
+        action="append",
+        dest="keep_fields",
+        default=[],
+        help="Field of JSON objects to copy to the output, e.g. an ID. Can be "
+        "repeated.",
+    )
+    score.add_argument("--encoding", default="utf-8", help="Encoding of the input.")
+    score.add_argument(
+        "-o",
+        "--output-format",
+        choices=["jsonl", "csv"],
+        default="jsonl",
+        help="Default: jsonl.",
+    )
+    score.add_argument("--lang", default="en_US", help="Language of the documents.")
+    score.add_argument(
+        "--round", type=int, help="Number of decimals to round the scores to."
+    )
+    score.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of worker processes."
+    )
+    score.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of documents sent to a worker and written at once.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "score":
+        return _score_command(args, score)
+
+    n_words = utils.build_syllable_table(
+        args.output, args.lang, args.sources or ["cmudict"]
+    )
+    print(f"Wrote {n_words} words to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
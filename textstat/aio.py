@@ -0,0 +1,62 @@
+"""Settings of the asyncio API, see `textstatistics.aanalyze`."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import Executor
+
+_OPTIONS: dict[str, Executor | int | None] = {
+    "executor": None,
+    "max_concurrency": os.cpu_count() or 1,
+}
+# One semaphore per event loop, they can't be shared between loops
+_SEMAPHORES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def configure_async(
+    executor: Executor | None = None, max_concurrency: int | None = None
+) -> None:
+    """Configure where and how many asynchronous calls are run at once.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor or None, optional
+        Executor running the calls, e.g. a ProcessPoolExecutor to use several
+        CPUs. If None, the default executor of the event loop (a thread pool).
+    max_concurrency : int or None, optional
+        Maximum number of calls running at once, further calls wait for one
+        to finish. Default: the number of CPUs.
+
+    Raises
+    ------
+    ValueError
+        If `max_concurrency` is less than 1.
+
+    """
+    if max_concurrency is None:
+        max_concurrency = os.cpu_count() or 1
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    _OPTIONS["executor"] = executor
+    _OPTIONS["max_concurrency"] = max_concurrency
+    _SEMAPHORES.clear()
+
+
+def get_executor() -> Executor | None:
+    """Get the executor running asynchronous calls, None for the loop's default."""
+    return _OPTIONS["executor"]  # type: ignore[return-value]
+
+
+def get_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting the calls running at once in this event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _SEMAPHORES[loop] = asyncio.Semaphore(
+            _OPTIONS["max_concurrency"]  # type: ignore[arg-type]
+        )
+    return semaphore
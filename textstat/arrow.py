@@ -0,0 +1,150 @@
+"""Scoring of Arrow record batches and Parquet files, one batch at a time:
+
+>>> from textstat.arrow import analyze_parquet
+>>> analyze_parquet("corpus.parquet", "scores.parquet", "body", ["smog_index"])
+
+pyarrow is an optional dependency, it is not imported by `textstat` itself.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Mapping
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .backend.utils import get_metric_specs
+from .backend.utils.constants import ARROW_BATCH_SIZE
+from .textstat import textstat, textstatistics
+
+_ARROW_TYPES = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+}
+
+
+def _iter_parquet_batches(
+    parquet_file: pq.ParquetFile, batch_size: int, columns: list[str] | None
+) -> Iterator[pa.RecordBatch]:
+    """Read the batches of a Parquet file, or a single empty batch."""
+    empty = True
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        empty = False
+        yield batch
+    if empty:
+        schema = parquet_file.schema_arrow
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns])
+        yield pa.RecordBatch.from_pylist([], schema=schema)
+
+
+def analyze_batches(
+    batches: Iterable[pa.RecordBatch],
+    column: str,
+    metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+    engine: textstatistics | None = None,
+    keep_columns: bool = True,
+) -> Iterator[pa.RecordBatch]:
+    """Calculate several metrics for the texts of a column of record batches.
+
+    Each batch is scored with `textstatistics.analyze` and yielded before the
+    next one is read, so only one batch is held in memory at a time. The
+    values are the same as the ones of the scalar functions.
+
+    Parameters
+    ----------
+    batches : Iterable[pyarrow.RecordBatch]
+        The record batches, e.g. a `pyarrow.RecordBatchReader` or
+        `pyarrow.dataset.Dataset.to_batches()`.
+    column : str
+        The name of the column of texts. Null texts have null metrics.
+    metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+        The metrics to calculate, see `textstatistics.analyze`.
+    engine : textstatistics or None, optional
+        The instance whose settings are used, e.g. an `Engine` for another
+        language. Default: the shared `textstat` instance.
+    keep_columns : bool, optional
+        Whether to keep the columns of the input batches before the metric
+        columns. Default: True
+
+    Returns
+    -------
+    Iterator[pyarrow.RecordBatch]
+        A batch with a column for every metric for every input batch.
+
+    """
+    if engine is None:
+        engine = textstat
+    specs = dict(get_metric_specs(metrics))
+    # The types of the results don't depend on the text
+    sample = engine.analyze("", specs)
+    fields = [pa.field(name, _ARROW_TYPES[type(sample[name])]) for name in specs]
+
+    for batch in batches:
+        texts = batch.column(column).to_pylist()
+        results: dict[str, dict[str, Any]] = {}
+        for text in texts:
+            if text is not None and text not in results:
+                results[text] = engine.analyze(text, specs)
+
+        arrays = [
+            pa.array(
+                [None if text is None else results[text][field.name] for text in texts],
+                type=field.type,
+            )
+            for field in fields
+        ]
+        if keep_columns:
+            arrays = batch.columns + arrays
+            schema = pa.schema(list(batch.schema) + fields)
+        else:
+            schema = pa.schema(fields)
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def analyze_parquet(
+    source: Any,
+    destination: Any,
+    column: str,
+    metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+    engine: textstatistics | None = None,
+    keep_columns: bool = True,
+    batch_size: int = ARROW_BATCH_SIZE,
+) -> None:
+    """Calculate several metrics for the texts of a column of a Parquet file,
+    and write them to another Parquet file, see `analyze_batches`.
+
+    Parameters
+    ----------
+    source : str, path or file-like object
+        The Parquet file to read.
+    destination : str, path or file-like object
+        The Parquet file to write.
+    column : str
+        The name of the column of texts.
+    metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+        The metrics to calculate, see `textstatistics.analyze`.
+    engine : textstatistics or None, optional
+        The instance whose settings are used. Default: the shared `textstat`
+        instance.
+    keep_columns : bool, optional
+        Whether to copy the columns of `source` before the metric columns.
+        Default: True
+    batch_size : int, optional
+        Number of rows read and scored at once. The default is
+        `utils.constants.ARROW_BATCH_SIZE`.
+
+    """
+    columns = None if keep_columns else [column]
+    batches = _iter_parquet_batches(pq.ParquetFile(source), batch_size, columns)
+    writer = None
+    try:
+        for batch in analyze_batches(batches, column, metrics, engine, keep_columns):
+            if writer is None:
+                writer = pq.ParquetWriter(destination, batch.schema)
+            writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
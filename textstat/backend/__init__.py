@@ -1,14 +1,46 @@
-from . import counts
-from . import metrics
-from . import selections
-from . import transformations
-from . import validations
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import caches
+    from . import counts
+    from . import formulas
+    from . import instrumentation
+    from . import metrics
+    from . import profiles
+    from . import selections
+    from . import transformations
+    from . import utils  # noqa: F401
+    from . import validations
+    from . import vectorized
 
 
 __all__ = [
+    "caches",
     "counts",
+    "formulas",
+    "instrumentation",
     "metrics",
+    "profiles",
     "selections",
     "transformations",
     "validations",
+    "vectorized",
 ]
+
+# The subpackages are imported on first access, so that `import textstat` does
+# not load the language resources and the dependencies of every function
+_SUBPACKAGES = frozenset(__all__) | {"utils"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Importing the subpackage sets it as an attribute of this module
+    return importlib.import_module(f"{__name__}.{name}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBPACKAGES)
@@ -0,0 +1,36 @@
+# utils imports the caches to cache the language resources, it must be
+# initialized first
+from .. import utils  # noqa: F401
+from ._bounded_cache_backend import BoundedCacheBackend
+from ._cache_backend import CacheBackend
+from ._cache_group import CacheGroup
+from ._cache_info import CacheInfo
+from ._cached import cached
+from ._configure_cache import configure_cache
+from ._get_cache_group import get_cache_group
+from ._get_cache_info import get_cache_info
+from ._lfu_cache_backend import LFUCacheBackend
+from ._lru_cache_backend import LRUCacheBackend
+from ._make_cache_backend import make_cache_backend
+from ._null_cache_backend import NullCacheBackend
+from ._reset_cache_info import reset_cache_info
+from ._set_cache_backend import set_cache_backend
+from ._ttl_cache_backend import TTLCacheBackend
+
+__all__ = [
+    "cached",
+    "configure_cache",
+    "get_cache_group",
+    "get_cache_info",
+    "make_cache_backend",
+    "reset_cache_info",
+    "set_cache_backend",
+    "BoundedCacheBackend",
+    "CacheBackend",
+    "CacheGroup",
+    "CacheInfo",
+    "LFUCacheBackend",
+    "LRUCacheBackend",
+    "NullCacheBackend",
+    "TTLCacheBackend",
+]
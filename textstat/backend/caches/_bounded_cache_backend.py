@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class BoundedCacheBackend:
+    """Base class of the in-memory cache backends, bounded by a number of
+    entries and/or the approximate memory used by the stored values.
+
+    Subclasses choose which entry to evict by overriding `_victim`, and can
+    keep track of their own bookkeeping with the `_touch`, `_insert`,
+    `_discard` and `_expired` hooks. All hooks are called under a lock.
+
+    Parameters
+    ----------
+    maxsize : int or None, optional
+        Maximum number of entries. Unbounded if None.
+    max_bytes : int or None, optional
+        Maximum total size of the entries in bytes. Values larger than this are
+        never stored. Unbounded if None.
+
+    Raises
+    ------
+    ValueError
+        If a bound is negative.
+
+    """
+
+    def __init__(self, maxsize: int | None = None, max_bytes: int | None = None):
+        for name, bound in (("maxsize", maxsize), ("max_bytes", max_bytes)):
+            if bound is not None and bound < 0:
+                raise ValueError(f"{name} must be non-negative, got {bound}")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if self._expired(key):
+                self._remove(key)
+                return default
+            self._touch(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.maxsize == 0 or (
+                self.max_bytes is not None and size > self.max_bytes
+            ):
+                return
+            while self._entries and (
+                (self.maxsize is not None and len(self._entries) >= self.maxsize)
+                or (self.max_bytes is not None and self.nbytes + size > self.max_bytes)
+            ):
+                self._remove(self._victim())
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            self._insert(key)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def sizes(self) -> list[tuple[Hashable, int]]:
+        with self._lock:
+            for key in [key for key in self._entries if self._expired(key)]:
+                self._remove(key)
+            return [(key, size) for key, (_, size) in self._entries.items()]
+
+    def _remove(self, key: Hashable) -> None:
+        _, size = self._entries.pop(key)
+        self.nbytes -= size
+        self._discard(key)
+
+    def _victim(self) -> Hashable:
+        """Return the key to evict to make room for a new entry."""
+        return next(iter(self._entries))
+
+    def _touch(self, key: Hashable) -> None:
+        """Called when `key` is looked up."""
+
+    def _insert(self, key: Hashable) -> None:
+        """Called when `key` is stored."""
+
+    def _discard(self, key: Hashable) -> None:
+        """Called when `key` is removed."""
+
+    def _expired(self, key: Hashable) -> bool:
+        """Whether `key` must be treated as missing."""
+        return False
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Storage used by a cache group, see `set_cache_backend`.
+
+    Keys are tuples of the qualified name of the cached function and its
+    normalized arguments. Implementations must be safe to call from several
+    threads and decide on their own what to evict. They may also expose a
+    `maxsize` attribute, which is reported by `cache_info`.
+
+    """
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value stored for `key`, or `default` if there is none."""
+        ...
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        """Store `value` for `key`. `size` approximates its memory in bytes."""
+        ...
+
+    def delete(self, key: Hashable) -> None:
+        """Remove `key` if it is stored."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        ...
+
+    def sizes(self) -> Iterable[tuple[Hashable, int]]:
+        """Return the stored keys with the sizes they were stored with."""
+        ...
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from ..utils.constants import CACHE_DIGEST_MIN_LENGTH
+from ._cache_backend import CacheBackend
+from ._make_cache_backend import make_cache_backend
+from ._null_cache_backend import NullCacheBackend
+
+
+class CacheGroup:
+    """Cached functions sharing a cache backend and an admission rule.
+
+    Parameters
+    ----------
+    name : str
+        The name of the group.
+    settings : dict
+        The default settings of the group, see `configure_cache`.
+
+    """
+
+    def __init__(self, name: str, settings: dict[str, Any]):
+        self.name = name
+        self.defaults = dict(settings)
+        self.functions: list[Callable[..., Any]] = []
+        self.configure(**settings)
+
+    def configure(
+        self,
+        policy: str,
+        maxsize: int | None,
+        max_bytes: int | None,
+        ttl: float | None,
+        max_text_length: int | None,
+    ) -> None:
+        """Replace the backend by a built-in one, and set the admission rule."""
+        if max_text_length is not None and max_text_length < 0:
+            raise ValueError(
+                f"max_text_length must be non-negative, got {max_text_length}"
+            )
+        self.install(make_cache_backend(policy, maxsize, max_bytes, ttl))
+        self.max_text_length = max_text_length
+        # Shortest string that needs more than a plain lookup, see `cached`
+        self.text_length_threshold = CACHE_DIGEST_MIN_LENGTH
+        if max_text_length is not None:
+            self.text_length_threshold = min(
+                self.text_length_threshold, max_text_length + 1
+            )
+
+    def install(self, backend: CacheBackend) -> None:
+        """Replace the backend."""
+        self.backend = backend
+        self.enabled = not isinstance(backend, NullCacheBackend)
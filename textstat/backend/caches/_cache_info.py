@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cached function, see `cached`."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    nbytes: int
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import inspect
+import sys
+import threading
+from collections import OrderedDict
+from functools import wraps
+from hashlib import blake2b
+from itertools import islice
+from typing import Any, Callable, TYPE_CHECKING
+
+from ..instrumentation._observed_call import OBSERVERS, observed_call
+from ..utils.constants import CACHE_DIGEST_MIN_LENGTH
+from ._cache_info import CacheInfo
+from ._get_cache_group import get_cache_group
+
+if TYPE_CHECKING:
+    from ..utils.constants import T, P
+
+_MISSING = object()
+
+# The digests of the last few texts, by identity, so that nested calls on the
+# same text object only hash it once. The texts themselves are not kept alive:
+# an id can be reused once its text is freed, so the length and the builtin
+# hash of the text, which is cached by the str object, are checked as well.
+# `cache_clear` empties it with the caches.
+_DIGESTS: OrderedDict[int, tuple[int, int, tuple[int, bytes]]] = OrderedDict()
+_DIGESTS_SIZE = 8
+_DIGESTS_LOCK = threading.Lock()
+
+_SIZE_SAMPLE = 64
+
+
+def _digest(text: str) -> tuple[int, bytes]:
+    check = (len(text), hash(text))
+    with _DIGESTS_LOCK:
+        entry = _DIGESTS.get(id(text))
+        if entry is not None and entry[:2] == check:
+            return entry[2]
+    digest = (
+        len(text),
+        blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+    )
+    with _DIGESTS_LOCK:
+        _DIGESTS[id(text)] = (*check, digest)
+        while len(_DIGESTS) > _DIGESTS_SIZE:
+            _DIGESTS.popitem(last=False)
+    return digest
+
+
+def _clear_digests() -> None:
+    with _DIGESTS_LOCK:
+        _DIGESTS.clear()
+
+
+def _get_size(value: Any) -> int:
+    """Approximate the memory used by a cached result in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)) and value:
+        # Extrapolate from the first few items of large containers
+        sample = list(islice(value, _SIZE_SAMPLE))
+        size += sum(map(sys.getsizeof, sample)) * len(value) // len(sample)
+    elif hasattr(value, "__dict__"):
+        size += sum(_get_size(attr) for attr in vars(value).values())
+    return size
+
+
+def _get_arguments_normalizer(
+    func: Callable[..., Any],
+) -> Callable[[tuple[Any, ...], dict[str, Any]], tuple[Any, ...] | None]:
+    """Build a function turning the arguments of a call to `func` into the
+    tuple of all its positional arguments, with defaults filled in, so that
+    equivalent calls share a cache entry. It returns None for calls that do
+    not bind to the signature, which are left to `func` to reject.
+    """
+    parameters = inspect.signature(func).parameters.values()
+    names = tuple(param.name for param in parameters)
+    defaults = {
+        param.name: param.default
+        for param in parameters
+        if param.default is not param.empty
+    }
+    if any(param.kind != param.POSITIONAL_OR_KEYWORD for param in parameters):
+        # Not worth normalizing, keep keyword arguments as they were passed
+        def normalize(
+            args: tuple[Any, ...], kwargs: dict[str, Any]
+        ) -> tuple[Any, ...] | None:
+            return args + tuple(sorted(kwargs.items())) if kwargs else args
+
+        return normalize
+
+    def normalize(
+        args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Any, ...] | None:
+        if not kwargs and len(args) == len(names):
+            return args
+        if len(args) > len(names):
+            return None
+        values = list(args)
+        n_kwargs = 0
+        for name in names[len(args):]:
+            if name in kwargs:
+                values.append(kwargs[name])
+                n_kwargs += 1
+            elif name in defaults:
+                values.append(defaults[name])
+            else:
+                return None
+        if n_kwargs != len(kwargs):
+            return None
+        return tuple(values)
+
+    return normalize
+
+
+def cached(group: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Decorator factory caching function results in a cache group without
+    losing type info.
+
+    Positional and keyword arguments are normalized, so `f(t)` and
+    `f(t, x=default)` share an entry. Strings of `CACHE_DIGEST_MIN_LENGTH`
+    characters or more are keyed by a digest of their content, so that the
+    cache does not keep whole texts alive, and results for texts longer than
+    the group's `max_text_length` are never stored. The decorated function
+    gets `cache_info` and `cache_clear` methods like `functools.lru_cache`, and
+    a `cache_reset` method resetting the hit and miss counters only. The
+    counters are updated under a lock, so they are exact with several threads.
+
+    Parameters
+    ----------
+    group : str
+        The name of the cache group, see `get_cache_group`.
+
+    Returns
+    -------
+    Callable
+        The decorator.
+
+    Raises
+    ------
+    ValueError
+        If `group` is unknown.
+
+    """
+    cache_group = get_cache_group(group)
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        owner = f"{func.__module__}.{func.__qualname__}"
+        # e.g. "counts.count_sentences" for the profilers
+        name = f"{func.__module__.split('.')[-2]}.{func.__qualname__}"
+        normalize = _get_arguments_normalizer(func)
+        parameters = tuple(inspect.signature(func).parameters)
+        n_arguments = len(parameters)
+        stats = [0, 0]  # hits, misses
+        # `+=` on a list item is not atomic, concurrent calls would lose counts
+        stats_lock = threading.Lock()
+
+        def get_stats() -> tuple[int, int]:
+            with stats_lock:
+                return stats[0], stats[1]
+
+        def reset_stats() -> None:
+            with stats_lock:
+                stats[:] = [0, 0]
+
+        def make_key(arguments: tuple[Any, ...]) -> tuple[Any, ...] | None:
+            """Return the cache key of a call, or None if it must not be stored."""
+            max_text_length = cache_group.max_text_length
+            for arg in arguments:
+                if (
+                    isinstance(arg, str)
+                    and max_text_length is not None
+                    and len(arg) > max_text_length
+                ):
+                    return None
+            return (
+                owner,
+                tuple(
+                    _digest(arg)
+                    if isinstance(arg, str) and len(arg) >= CACHE_DIGEST_MIN_LENGTH
+                    else arg
+                    for arg in arguments
+                ),
+            )
+
+        def lookup(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Any, bool]:
+            """Return the result of a call and whether it was cached."""
+            if not cache_group.enabled:
+                with stats_lock:
+                    stats[1] += 1
+                return func(*args, **kwargs), False
+
+            if kwargs or len(args) != n_arguments:
+                arguments = normalize(args, kwargs)
+            else:
+                arguments = args
+            key: tuple[Any, ...] | None = (owner, arguments)
+            if arguments is None:
+                key = None
+            else:
+                # Only texts need to be digested or checked for admission
+                threshold = cache_group.text_length_threshold
+                for arg in arguments:
+                    if isinstance(arg, str) and len(arg) >= threshold:
+                        key = make_key(arguments)
+                        break
+            if key is None:
+                with stats_lock:
+                    stats[1] += 1
+                return func(*args, **kwargs), False
+
+            backend = cache_group.backend
+            value = backend.get(key, _MISSING)
+            if value is not _MISSING:
+                with stats_lock:
+                    stats[0] += 1
+                return value, True
+
+            with stats_lock:
+                stats[1] += 1
+            value = func(*args, **kwargs)
+            backend.set(key, value, _get_size(value))
+            return value, False
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if OBSERVERS:
+                return observed_call(name, parameters, lookup, args, kwargs)
+            return lookup(args, kwargs)[0]
+
+        def cache_info() -> CacheInfo:
+            backend = cache_group.backend
+            sizes = [size for key, size in backend.sizes() if key[0] == owner]
+            hits, misses = get_stats()
+            return CacheInfo(
+                hits,
+                misses,
+                getattr(backend, "maxsize", None),
+                len(sizes),
+                sum(sizes),
+            )
+
+        def cache_clear() -> None:
+            backend = cache_group.backend
+            for key, _ in backend.sizes():
+                if key[0] == owner:
+                    backend.delete(key)
+            reset_stats()
+            _clear_digests()
+
+        wrapper.cache_info = cache_info  # type: ignore
+        wrapper.cache_clear = cache_clear  # type: ignore
+        wrapper.cache_reset = reset_stats  # type: ignore
+        wrapper.cache_group = group  # type: ignore
+        wrapper._cache_owner = owner  # type: ignore
+        wrapper._cache_stats = get_stats  # type: ignore
+        cache_group.functions.append(wrapper)
+        return wrapper  # type: ignore
+
+    return decorator
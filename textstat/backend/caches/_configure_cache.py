@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..utils.constants import CACHE_GROUPS
+from ._get_cache_group import get_cache_group
+
+# Settings that are not given take the default of the group, None is a value
+_DEFAULT: Any = object()
+# The groups configured when no group is given. The language resources are
+# only reloaded if "resource" is configured by name
+_DOCUMENT_GROUPS = [name for name in CACHE_GROUPS if name != "resource"]
+
+
+def configure_cache(
+    group: str | None = None,
+    policy: str = _DEFAULT,
+    maxsize: int | None = _DEFAULT,
+    max_bytes: int | None = _DEFAULT,
+    ttl: float | None = _DEFAULT,
+    max_text_length: int | None = _DEFAULT,
+) -> None:
+    """Replace the backend of a cache group by a new built-in backend. Omitted
+    settings take the group's defaults (see `utils.constants.CACHE_GROUPS`), so
+    calling `configure_cache()` restores the default caches.
+
+    Entries cached by the previous backend are dropped.
+
+    Parameters
+    ----------
+    group : str or None, optional
+        The cache group to configure, or None for the "document" and "word"
+        groups. The "resource" group, which keeps the dictionaries and word
+        lists of the languages, is only configured when it is named.
+    policy : str, optional
+        One of "lru", "lfu", "ttl" or "none". "none" disables caching, e.g.
+        for one-shot batch jobs where results are never reused.
+    maxsize : int or None, optional
+        Maximum number of entries, None for no limit.
+    max_bytes : int or None, optional
+        Approximate maximum memory used by the cached results, in bytes, None
+        for no limit. Results larger than this are never stored.
+    ttl : float or None, optional
+        Lifetime of the entries in seconds, for the "ttl" policy.
+    max_text_length : int or None, optional
+        Results for texts longer than this many characters are computed but
+        never stored. None for no limit.
+
+    Raises
+    ------
+    ValueError
+        If `group` or `policy` is unknown, or a limit is negative.
+
+    """
+    settings = {
+        "policy": policy,
+        "maxsize": maxsize,
+        "max_bytes": max_bytes,
+        "ttl": ttl,
+        "max_text_length": max_text_length,
+    }
+    for name in _DOCUMENT_GROUPS if group is None else [group]:
+        cache_group = get_cache_group(name)
+        cache_group.configure(
+            **{
+                key: cache_group.defaults[key] if value is _DEFAULT else value
+                for key, value in settings.items()
+            }
+        )
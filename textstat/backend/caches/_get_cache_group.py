@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from ..utils.constants import CACHE_GROUPS
+from ._cache_group import CacheGroup
+
+_CACHE_GROUPS = {
+    name: CacheGroup(name, settings) for name, settings in CACHE_GROUPS.items()
+}
+
+
+def get_cache_group(name: str) -> CacheGroup:
+    """Get a cache group by name.
+
+    Parameters
+    ----------
+    name : str
+        One of "document" (results computed from a whole text), "word"
+        (results computed from a single word) or "resource" (loaded language
+        resources).
+
+    Returns
+    -------
+    CacheGroup
+        The cache group.
+
+    Raises
+    ------
+    ValueError
+        If there is no cache group with this name.
+
+    """
+    try:
+        return _CACHE_GROUPS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache group '{name}', expected one of {list(_CACHE_GROUPS)}"
+        ) from None
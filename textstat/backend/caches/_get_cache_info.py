@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from ..utils.constants import CACHE_GROUPS
+from ._cache_info import CacheInfo
+from ._get_cache_group import get_cache_group
+
+
+def get_cache_info(group: str | None = None) -> dict[str, dict[str, CacheInfo]]:
+    """Get the cache statistics of every cached function and cache group.
+
+    Parameters
+    ----------
+    group : str or None, optional
+        Only report this cache group and its functions, or all if None.
+
+    Returns
+    -------
+    dict
+        A dict with two dicts: "groups", mapping each cache group to its
+        statistics, and "functions", mapping the name of each cached function
+        to its statistics. Hits and misses of a group are the sums over its
+        functions, and its size and memory are those of its backend, which
+        other groups may share (see `set_cache_backend`). Memory is reported
+        in bytes, as estimated when the results were stored.
+
+    Raises
+    ------
+    ValueError
+        If `group` is unknown.
+
+    """
+    groups: dict[str, CacheInfo] = {}
+    functions: dict[str, CacheInfo] = {}
+    for name in CACHE_GROUPS if group is None else [group]:
+        cache_group = get_cache_group(name)
+        backend = cache_group.backend
+        sizes = list(backend.sizes())
+
+        # One pass over the entries for all functions of the group
+        entries: Counter[str] = Counter()
+        nbytes: Counter[str] = Counter()
+        for key, size in sizes:
+            entries[key[0]] += 1
+            nbytes[key[0]] += size
+
+        maxsize = getattr(backend, "maxsize", None)
+        hits = misses = 0
+        for func in cache_group.functions:
+            owner = func._cache_owner  # type: ignore
+            func_hits, func_misses = func._cache_stats()  # type: ignore
+            functions[func.__name__] = CacheInfo(
+                func_hits, func_misses, maxsize, entries[owner], nbytes[owner]
+            )
+            hits += func_hits
+            misses += func_misses
+
+        groups[name] = CacheInfo(
+            hits, misses, maxsize, len(sizes), sum(size for _, size in sizes)
+        )
+
+    return {"groups": groups, "functions": functions}
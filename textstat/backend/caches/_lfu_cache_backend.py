@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Hashable
+
+from ._bounded_cache_backend import BoundedCacheBackend
+
+
+class LFUCacheBackend(BoundedCacheBackend):
+    """In-memory cache backend evicting the least frequently used entries, and
+    the oldest of those in case of a tie.
+
+    Parameters
+    ----------
+    maxsize : int or None, optional
+        Maximum number of entries. Unbounded if None.
+    max_bytes : int or None, optional
+        Maximum total size of the entries in bytes. Unbounded if None.
+
+    """
+
+    def __init__(self, maxsize: int | None = None, max_bytes: int | None = None):
+        super().__init__(maxsize, max_bytes)
+        self._counts: dict[Hashable, int] = {}
+        # Keys by number of uses, in insertion order
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = {}
+
+    def _victim(self) -> Hashable:
+        return next(iter(self._buckets[min(self._buckets)]))
+
+    def _touch(self, key: Hashable) -> None:
+        count = self._counts[key]
+        self._discard(key)
+        self._add(key, count + 1)
+
+    def _insert(self, key: Hashable) -> None:
+        self._add(key, 1)
+
+    def _discard(self, key: Hashable) -> None:
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def _add(self, key: Hashable, count: int) -> None:
+        self._counts[key] = count
+        self._buckets.setdefault(count, OrderedDict())[key] = None
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Hashable
+
+from ._bounded_cache_backend import BoundedCacheBackend
+
+
+class LRUCacheBackend(BoundedCacheBackend):
+    """In-memory cache backend evicting the least recently used entries.
+
+    Parameters
+    ----------
+    maxsize : int or None, optional
+        Maximum number of entries. Unbounded if None.
+    max_bytes : int or None, optional
+        Maximum total size of the entries in bytes. Unbounded if None.
+
+    """
+
+    def _touch(self, key: Hashable) -> None:
+        self._entries.move_to_end(key)
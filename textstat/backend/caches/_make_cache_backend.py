@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from ._cache_backend import CacheBackend
+from ._lfu_cache_backend import LFUCacheBackend
+from ._lru_cache_backend import LRUCacheBackend
+from ._null_cache_backend import NullCacheBackend
+from ._ttl_cache_backend import TTLCacheBackend
+
+
+def make_cache_backend(
+    policy: str,
+    maxsize: int | None = None,
+    max_bytes: int | None = None,
+    ttl: float | None = None,
+) -> CacheBackend:
+    """Create one of the built-in cache backends.
+
+    Parameters
+    ----------
+    policy : str
+        One of "lru" (least recently used), "lfu" (least frequently used),
+        "ttl" (time to live) or "none" (caching disabled).
+    maxsize : int or None, optional
+        Maximum number of entries. Unbounded if None.
+    max_bytes : int or None, optional
+        Maximum total size of the entries in bytes. Unbounded if None.
+    ttl : float or None, optional
+        Lifetime of the entries in seconds. Required for the "ttl" policy.
+
+    Returns
+    -------
+    CacheBackend
+        The cache backend.
+
+    Raises
+    ------
+    ValueError
+        If `policy` is unknown, or `ttl` is missing for the "ttl" policy.
+
+    """
+    if policy == "lru":
+        return LRUCacheBackend(maxsize, max_bytes)
+    if policy == "lfu":
+        return LFUCacheBackend(maxsize, max_bytes)
+    if policy == "ttl":
+        if ttl is None:
+            raise ValueError("The 'ttl' cache policy requires a ttl")
+        return TTLCacheBackend(ttl, maxsize, max_bytes)
+    if policy == "none":
+        return NullCacheBackend()
+    raise ValueError(
+        f"Unknown cache policy '{policy}', expected 'lru', 'lfu', 'ttl' or 'none'"
+    )
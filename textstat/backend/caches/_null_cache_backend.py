@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any, Hashable
+
+
+class NullCacheBackend:
+    """Cache backend that never stores anything, to disable caching."""
+
+    maxsize = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return default
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        pass
+
+    def delete(self, key: Hashable) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def sizes(self) -> list[tuple[Hashable, int]]:
+        return []
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from ..utils.constants import CACHE_GROUPS
+from ._get_cache_group import get_cache_group
+
+
+def reset_cache_info(group: str | None = None, clear: bool = False) -> None:
+    """Reset the hit and miss counters of the cached functions.
+
+    Parameters
+    ----------
+    group : str or None, optional
+        Only reset the functions of this cache group, or all if None.
+    clear : bool, default False
+        Also drop the cached results.
+
+    Raises
+    ------
+    ValueError
+        If `group` is unknown.
+
+    """
+    for name in CACHE_GROUPS if group is None else [group]:
+        for func in get_cache_group(name).functions:
+            if clear:
+                func.cache_clear()  # type: ignore
+            else:
+                func.cache_reset()  # type: ignore
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from ..utils.constants import CACHE_GROUPS
+from ._cache_backend import CacheBackend
+from ._get_cache_group import get_cache_group
+
+
+def set_cache_backend(backend: CacheBackend, group: str | None = None) -> None:
+    """Install a cache backend, e.g. a custom implementation of the
+    `CacheBackend` protocol or one made by `make_cache_backend`.
+
+    The group's admission rule is kept, and entries cached by the previous
+    backend are dropped.
+
+    Parameters
+    ----------
+    backend : CacheBackend
+        The backend to install.
+    group : str or None, optional
+        The cache group using the backend, or None for all groups. Keys
+        include the name of the cached function, so groups can share a
+        backend.
+
+    Raises
+    ------
+    TypeError
+        If `backend` does not implement the `CacheBackend` protocol.
+    ValueError
+        If `group` is unknown.
+
+    """
+    if not isinstance(backend, CacheBackend):
+        raise TypeError(
+            f"{type(backend).__name__} does not implement the CacheBackend protocol"
+        )
+    for name in CACHE_GROUPS if group is None else [group]:
+        get_cache_group(name).install(backend)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Hashable
+
+from ._bounded_cache_backend import BoundedCacheBackend
+
+
+class TTLCacheBackend(BoundedCacheBackend):
+    """In-memory cache backend whose entries expire `ttl` seconds after they
+    were stored. The oldest entries are evicted first when a bound is reached.
+
+    Parameters
+    ----------
+    ttl : float
+        Lifetime of the entries in seconds.
+    maxsize : int or None, optional
+        Maximum number of entries. Unbounded if None.
+    max_bytes : int or None, optional
+        Maximum total size of the entries in bytes. Unbounded if None.
+    timer : Callable, optional
+        Function returning the current time in seconds.
+
+    Raises
+    ------
+    ValueError
+        If `ttl` or a bound is negative.
+
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int | None = None,
+        max_bytes: int | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if ttl < 0:
+            raise ValueError(f"ttl must be non-negative, got {ttl}")
+        super().__init__(maxsize, max_bytes)
+        self.ttl = ttl
+        self._timer = timer
+        self._expiry: dict[Hashable, float] = {}
+
+    def _insert(self, key: Hashable) -> None:
+        self._expiry[key] = self._timer() + self.ttl
+
+    def _discard(self, key: Hashable) -> None:
+        del self._expiry[key]
+
+    def _expired(self, key: Hashable) -> bool:
+        return self._expiry[key] <= self._timer()
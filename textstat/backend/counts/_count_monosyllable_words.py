@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import Counter
+
 from ..utils._typed_cache import typed_cache
-from ._count_syllables import count_syllables
+from ._count_word_syllables import count_word_syllables
 from ..selections._list_words import list_words
 
 
@@ -21,4 +23,8 @@ def count_monosyllable_words(text: str, lang: str) -> int:
     int
     Number of monosyllable words in the text.
     """
-    return len([w for w in list_words(text) if count_syllables(w, lang) == 1])
+    return sum(
+        n
+        for w, n in Counter(list_words(text)).items()
+        if count_word_syllables(w.lower(), lang) == 1
+    )
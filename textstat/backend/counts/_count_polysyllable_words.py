@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import Counter
+
 from ..utils._typed_cache import typed_cache
-from ._count_syllables import count_syllables
+from ._count_word_syllables import count_word_syllables
 from ..selections._list_words import list_words
 
 
@@ -23,4 +25,8 @@ def count_polysyllable_words(text: str, lang: str) -> int:
         Number of words with three or more syllables.
 
     """
-    return len([w for w in list_words(text) if count_syllables(w, lang) >= 3])
+    return sum(
+        n
+        for w, n in Counter(list_words(text)).items()
+        if count_word_syllables(w.lower(), lang) >= 3
+    )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 
 from ..utils._typed_cache import typed_cache
+from ..utils.constants import RE_SENTENCE
 from ._count_words import count_words
 
 
@@ -25,7 +26,7 @@ def count_sentences(text: str) -> int:
         return 0
 
     ignore_count = 0
-    sentences = re.findall(r"\b[^.!?]+[.!?]*", text, re.UNICODE)
+    sentences = re.findall(RE_SENTENCE, text, re.UNICODE)
     for sentence in sentences:
         if count_words(sentence) <= 2:
             ignore_count += 1
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections import Counter
+
 from ..selections._list_words import list_words
-from ..utils._get_cmudict import get_cmudict
-from ..utils._get_pyphen import get_pyphen
 from ..utils._typed_cache import typed_cache
+from ._count_word_syllables import count_word_syllables
 
 
 @typed_cache
@@ -22,13 +23,8 @@ def count_syllables(text: str, lang: str) -> int:
     """
     if not text:
         return 0
-    cmu_dict = get_cmudict(lang)
-    pyphen = get_pyphen(lang)
-    count = 0
-    for word in list_words(text, lowercase=True):
-        try:
-            cmu_phones = cmu_dict[word][0]
-            count += sum(1 for p in cmu_phones if p[-1].isdigit())
-        except (TypeError, IndexError, KeyError):
-            count += len(pyphen.positions(word)) + 1
-    return count
+    # Look up each distinct word once
+    return sum(
+        count_word_syllables(word, lang) * n
+        for word, n in Counter(list_words(text, lowercase=True)).items()
+    )
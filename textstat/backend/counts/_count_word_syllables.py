@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from ..utils._get_cmudict import get_cmudict
+from ..utils._get_pyphen import get_pyphen
+from ..utils._get_syllable_store import get_syllable_store
+from ..utils._get_syllable_table import get_syllable_table
+from ..utils._word_cache import word_cache
+
+
+@word_cache
+def count_word_syllables(word: str, lang: str) -> int:
+    """Estimate the number of syllables in a single word.
+
+    The word is expected to be normalized the way `selections.list_words` does
+    with `lowercase=True`, i.e. lowercased and without punctuation, but
+    surrounding whitespace is ignored like `list_words` ignores it. Results are
+    kept in the word-level cache, which is separate from the document-level
+    caches. Words are looked up in the precomputed syllable table of the
+    language (see `utils.get_syllable_table`), or in cmudict for languages
+    without one. Other words are counted with pyphen, and also looked up in,
+    and added to, the persistent syllable store if one is set (see
+    `utils.set_syllable_store`).
+
+    Parameters
+    ----------
+    word : str
+        A lowercase word without punctuation.
+    lang : str
+        The language of the word.
+
+    Returns
+    -------
+    int
+        Number of syllables in the word.
+    """
+    word = word.strip()
+    if not word:
+        return 0
+    table = get_syllable_table(lang)
+    if table is not None:
+        count = table.get(word)
+        if count is not None:
+            return count
+    else:
+        try:
+            cmu_phones = get_cmudict(lang)[word][0]  # type: ignore
+            return sum(1 for p in cmu_phones if p[-1].isdigit())
+        except (TypeError, IndexError, KeyError):
+            pass
+
+    store = get_syllable_store()
+    if store is None:
+        return len(get_pyphen(lang).positions(word)) + 1
+    count = store.get(lang, word)
+    if count is None:
+        count = len(get_pyphen(lang).positions(word)) + 1
+        store.add(lang, word, count)
+    return count
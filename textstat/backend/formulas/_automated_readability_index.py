@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def automated_readability_index(
+    chars: Any,
+    raw_words: Any,
+    words: Any,
+    sentences: Any,
+) -> Any:
+    """The formula of `metrics.automated_readability_index`.
+
+    Parameters
+    ----------
+    chars : int, float or array_like
+        Number of characters, see `counts.count_chars`.
+    raw_words : int, float or array_like
+        Number of words, punctuation-only tokens included, see
+        `counts.count_words` with `rm_punctuation=False`.
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    a = div(chars, raw_words)
+    b = div(words, sentences)
+    return where((a == 0) | (b == 0), 0.0, (4.71 * a) + (0.5 * b) - 21.43)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div
+
+
+def chars_per_word(
+    chars: Any,
+    raw_words: Any,
+) -> Any:
+    """The formula of `metrics.chars_per_word`.
+
+    Parameters
+    ----------
+    chars : int, float or array_like
+        Number of characters, see `counts.count_chars`.
+    raw_words : int, float or array_like
+        Number of words, punctuation-only tokens included, see
+        `counts.count_words` with `rm_punctuation=False`.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return div(chars, raw_words)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def coleman_liau_index(
+    letters: Any,
+    words: Any,
+    sentences: Any,
+) -> Any:
+    """The formula of `metrics.coleman_liau_index`.
+
+    Parameters
+    ----------
+    letters : int, float or array_like
+        Number of letters.
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    letters = div(letters, words) * 100
+    sentences = div(sentences, words) * 100
+    return where(
+        (letters == 0) | (sentences == 0),
+        0.0,
+        (0.058 * letters) - (0.296 * sentences) - 15.8,
+    )
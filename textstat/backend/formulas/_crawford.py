@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def crawford(
+    sentences: Any,
+    words: Any,
+    syllables: Any,
+) -> Any:
+    """The formula of `metrics.crawford`.
+
+    Parameters
+    ----------
+    sentences : int, float or array_like
+        Number of sentences.
+    words : int, float or array_like
+        Number of words.
+    syllables : int, float or array_like
+        Number of syllables.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    sentences_per_words = 100 * div(sentences, words)
+    syllables_per_words = 100 * div(syllables, words)
+    return where(
+        (sentences_per_words == 0) | (syllables_per_words == 0),
+        0.0,
+        -0.205 * sentences_per_words + 0.049 * syllables_per_words - 3.407,
+    )
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def dale_chall_readability_score(
+    words: Any,
+    sentences: Any,
+    dale_chall_difficult_words: Any,
+) -> Any:
+    """The formula of `metrics.dale_chall_readability_score`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    dale_chall_difficult_words : int, float or array_like
+        Number of words that are not in the easy word list, see
+        `counts.count_difficult_words` with `syllable_threshold=0`.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    per_difficult_words = div(100 * dale_chall_difficult_words, words)
+    score = (0.1579 * per_difficult_words) + (0.0496 * div(words, sentences))
+    score = where(per_difficult_words > 5, score + 3.6365, score)
+    return where(words == 0, 0.0, score)
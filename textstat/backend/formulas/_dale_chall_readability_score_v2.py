@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def dale_chall_readability_score_v2(
+    words: Any,
+    sentences: Any,
+    difficult_words: Any,
+) -> Any:
+    """The formula of `metrics.dale_chall_readability_score_v2`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    difficult_words : int, float or array_like
+        Number of difficult words, see `counts.count_difficult_words`.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    asl = div(words, sentences)
+    pdw = div(100 * difficult_words, words)
+    raw_score = 0.1579 * (pdw) + 0.0496 * asl
+    adjusted_score = where(raw_score > 0.05, raw_score + 3.6365, raw_score)
+    return where(words == 0, 0.0, adjusted_score)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def fernandez_huerta(
+    words: Any,
+    sentences: Any,
+    syllables: Any,
+) -> Any:
+    """The formula of `metrics.fernandez_huerta`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    syllables : int, float or array_like
+        Number of syllables.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    sentence_length = div(words, sentences)
+    syllables = div(syllables, words)
+    return where(
+        (sentence_length == 0) | (syllables == 0),
+        0.0,
+        206.84 - (60 * syllables) - (1.02 * sentence_length),
+    )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def flesch_kincaid_grade(
+    words: Any,
+    sentences: Any,
+    syllables: Any,
+) -> Any:
+    """The formula of `metrics.flesch_kincaid_grade`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    syllables : int, float or array_like
+        Number of syllables.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    sentence_length = div(words, sentences)
+    syllables = div(syllables, words)
+    return where(
+        (sentence_length == 0) | (syllables == 0),
+        0.0,
+        (0.39 * sentence_length) + (11.8 * syllables) - 15.59,
+    )
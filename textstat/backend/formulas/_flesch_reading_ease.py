@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..utils._get_lang_cfg import get_lang_cfg
+from ..utils._get_lang_root import get_lang_root
+from ._ops import div, where
+
+
+def flesch_reading_ease(
+    words: Any,
+    sentences: Any,
+    syllables: Any,
+    lang: str = "en_US",
+) -> Any:
+    """The formula of `metrics.flesch_reading_ease`, with the constants of the
+    language from `utils.constants.LANG_CONFIGS`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    syllables : int, float or array_like
+        Number of syllables.
+    lang : str, optional
+        The language of the texts. The default is "en_US".
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    lang_root = get_lang_root(lang)
+    sentence_length = div(words, sentences)
+    syllables = div(syllables, words)
+    empty = (sentence_length == 0) | (syllables == 0)
+    if empty is True:
+        # A single empty text scores 0.0 even in languages without constants
+        return 0.0
+    return where(
+        empty,
+        0.0,
+        get_lang_cfg(lang_root, "fre_base")
+        - get_lang_cfg(lang_root, "fre_sentence_length") * sentence_length
+        - get_lang_cfg(lang_root, "fre_syll_per_word") * syllables,
+    )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def gulpease_index(
+    sentences: Any,
+    words: Any,
+    chars: Any,
+    raw_words: Any,
+) -> Any:
+    """The formula of `metrics.gulpease_index`.
+
+    Parameters
+    ----------
+    sentences : int, float or array_like
+        Number of sentences.
+    words : int, float or array_like
+        Number of words.
+    chars : int, float or array_like
+        Number of characters, see `counts.count_chars`.
+    raw_words : int, float or array_like
+        Number of words, punctuation-only tokens included, see
+        `counts.count_words` with `rm_punctuation=False`.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    spw = div(sentences, words)
+    cpw = div(chars, raw_words)
+    return where((spw == 0) | (cpw == 0), 0.0, (300 * spw) - (10 * cpw) + 89)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def gunning_fog(
+    words: Any,
+    sentences: Any,
+    gunning_fog_difficult_words: Any,
+) -> Any:
+    """The formula of `metrics.gunning_fog`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    gunning_fog_difficult_words : int, float or array_like
+        Number of difficult words with the syllable threshold of the
+        language, see `metrics.gunning_fog`.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    per_diff_words = div(100 * gunning_fog_difficult_words, words)
+    return where(
+        words == 0, 0.0, 0.4 * (div(words, sentences) + per_diff_words)
+    )
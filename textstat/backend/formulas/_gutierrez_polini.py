@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def gutierrez_polini(
+    letters: Any,
+    words: Any,
+    sentences: Any,
+) -> Any:
+    """The formula of `metrics.gutierrez_polini`.
+
+    Parameters
+    ----------
+    letters : int, float or array_like
+        Number of letters.
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    lpw = div(letters, words)
+    wps = div(words, sentences)
+    return where((lpw == 0) | (wps == 0), 0.0, 95.2 - 9.7 * lpw - 0.35 * wps)
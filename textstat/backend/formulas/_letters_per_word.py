@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div
+
+
+def letters_per_word(
+    letters: Any,
+    words: Any,
+) -> Any:
+    """The formula of `metrics.letters_per_word`.
+
+    Parameters
+    ----------
+    letters : int, float or array_like
+        Number of letters.
+    words : int, float or array_like
+        Number of words.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return div(letters, words)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def linsear_write_formula(
+    linsear_words: Any,
+    linsear_easy_words: Any,
+    linsear_difficult_words: Any,
+    linsear_sentences: Any,
+    strict_lower: bool = False,
+) -> Any:
+    """The formula of `metrics.linsear_write_formula` with `strict_upper=True`,
+    i.e. on the first 100 words of the texts.
+
+    Parameters
+    ----------
+    linsear_words : int, float or array_like
+        Number of words in the first 100 words.
+    linsear_easy_words : int, float or array_like
+        Number of words with one or two syllables in the first 100 words.
+    linsear_difficult_words : int, float or array_like
+        Number of words with three syllables or more in the first 100
+        words.
+    linsear_sentences : int, float or array_like
+        Number of sentences in the first 100 words.
+    strict_lower : bool, optional
+        Return 0 for texts with less than 100 words. The default is
+        False.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    number = div(
+        linsear_easy_words * 1 + linsear_difficult_words * 3, linsear_sentences
+    )
+    number = where(number <= 20, number - 2, number)
+    score = where(linsear_sentences == 0, 0.0, number / 2)
+    if strict_lower:
+        score = where(linsear_words < 100, 0.0, score)
+    return score
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def lix(
+    words: Any,
+    sentences: Any,
+    long_words: Any,
+) -> Any:
+    """The formula of `metrics.lix`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    long_words : int, float or array_like
+        Number of words with more than six letters.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    per_long_words = div(100 * long_words, words)
+    return where(words == 0, 0.0, div(words, sentences) + per_long_words)
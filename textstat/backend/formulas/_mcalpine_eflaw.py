@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div
+
+
+def mcalpine_eflaw(
+    words: Any,
+    miniwords: Any,
+    sentences: Any,
+) -> Any:
+    """The formula of `metrics.mcalpine_eflaw`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    miniwords : int, float or array_like
+        Number of words with three letters or less.
+    sentences : int, float or array_like
+        Number of sentences.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return div(words + miniwords, sentences)
@@ -0,0 +1,68 @@
+"""Operations of the formulas, for NumPy arrays, or for the numbers of a
+single text, as used by the metrics, the profiles and the vectorized formulas
+without NumPy. The formulas only use arithmetic operators, comparisons, `&`,
+`|` and these functions, so that the same code runs in both cases and gives
+the same results.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Any
+
+from ..utils._get_numpy import get_numpy
+
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, (bool, int, float))
+
+
+def div(a: Any, b: Any) -> Any:
+    """`a / b`, or 0.0 where `b` is 0, like the ZeroDivisionError guards of the
+    scalar formulas."""
+    if _is_scalar(b):
+        return a / b if b != 0 else 0.0
+    np = get_numpy()
+    a, b = np.broadcast_arrays(a, b)
+    return np.divide(a, b, out=np.zeros(b.shape), where=b != 0)
+
+
+def where(condition: Any, a: Any, b: Any) -> Any:
+    """`a` where `condition` is true, else `b`."""
+    if _is_scalar(condition):
+        return a if condition else b
+    return get_numpy().where(condition, a, b)
+
+
+def floor(value: Any) -> Any:
+    if _is_scalar(value):
+        return math.floor(value)
+    return get_numpy().floor(value)
+
+
+def ceil(value: Any) -> Any:
+    if _is_scalar(value):
+        return math.ceil(value)
+    return get_numpy().ceil(value)
+
+
+def round_half_even(value: Any) -> Any:
+    """Round to the nearest integer like the builtin `round`."""
+    if _is_scalar(value):
+        return round(value)
+    return get_numpy().round(value)
+
+
+def most_common(*candidates: Any) -> Any:
+    """The most common candidate, the first one to appear in case of a tie,
+    like `collections.Counter.most_common`. NaN candidates are ignored.
+    """
+    if all(map(_is_scalar, candidates)):
+        counter = Counter(c for c in candidates if not math.isnan(c))
+        return float(counter.most_common(1)[0][0])
+    np = get_numpy()
+    table = np.stack(np.broadcast_arrays(*candidates), axis=-1)
+    counts = (table[..., :, None] == table[..., None, :]).sum(axis=-1)
+    best = np.argmax(counts, axis=-1)[..., None]
+    return np.take_along_axis(table, best, axis=-1)[..., 0]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def osman(
+    words: Any,
+    sentences: Any,
+    complex_arabic_words: Any,
+    arabic_long_words: Any,
+    arabic_syllables: Any,
+    faseeh: Any,
+) -> Any:
+    """The formula of `metrics.osman`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    complex_arabic_words : int, float or array_like
+        Number of complex arabic words, see
+        `counts.count_complex_arabic_words`.
+    arabic_long_words : int, float or array_like
+        Number of long arabic words, see `counts.count_arabic_long_words`.
+    arabic_syllables : int, float or array_like
+        Number of arabic syllables, see `counts.count_arabic_syllables`.
+    faseeh : int, float or array_like
+        Number of faseeh words, see `counts.count_faseeh`.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    complex_word_rate = div(complex_arabic_words, words)
+    long_word_rate = div(arabic_long_words, words)
+    syllables_per_word = div(arabic_syllables, words)
+    faseeh_per_word = div(faseeh, words)
+    score = (
+        200.791
+        - (1.015 * div(words, sentences))
+        - (
+            24.181
+            * (
+                complex_word_rate
+                + syllables_per_word
+                + faseeh_per_word
+                + long_word_rate
+            )
+        )
+    )
+    return where(words == 0, 0.0, score)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import ceil, floor, most_common, round_half_even, where
+
+# Grades of the ranges of ten Flesch Reading Ease points, 13 for the others
+_READING_EASE_GRADES = (
+    (90, 5),
+    (80, 6),
+    (70, 7),
+    (60, 8),
+    (50, 10),
+    (40, 11),
+    (30, 12),
+)
+
+
+def _reading_ease_grade(score: Any) -> Any:
+    grade = 13.0
+    for lower, value in _READING_EASE_GRADES:
+        grade = where((score < lower + 10) & (score >= lower), float(value), grade)
+    return grade
+
+
+def readability_consensus(
+    flesch_kincaid_grade: Any,
+    flesch_reading_ease: Any,
+    smog_index: Any,
+    coleman_liau_index: Any,
+    automated_readability_index: Any,
+    dale_chall_readability_score: Any,
+    linsear_write_formula: Any,
+    gunning_fog: Any,
+) -> Any:
+    """The grade that most of the metrics agree on, see `metrics.text_standard`.
+
+    Every score counts for its floor, its ceiling and its rounded value,
+    except the Flesch Reading Ease, which counts for the grade of its range.
+    Ties go to the grade that comes first.
+
+    Parameters
+    ----------
+    flesch_kincaid_grade : float or array_like
+        The Flesch-Kincaid Grade.
+    flesch_reading_ease : float or array_like
+        The Flesch Reading Ease.
+    smog_index : float or array_like
+        The SMOG Index.
+    coleman_liau_index : float or array_like
+        The Coleman-Liau Index.
+    automated_readability_index : float or array_like
+        The Automated Readability Index.
+    dale_chall_readability_score : float or array_like
+        The Dale-Chall Readability Score.
+    linsear_write_formula : float or array_like
+        The Linsear Write Formula on the first 100 words.
+    gunning_fog : float or array_like
+        The Gunning Fog Index.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The grade for the scores of a text, or for every text if the scores
+        are arrays.
+
+    """
+    score = flesch_kincaid_grade
+    grades = [floor(score), ceil(score), round_half_even(score)]
+
+    # Scores from 60 to 70 count for grades 8 and 9
+    score = flesch_reading_ease
+    grades.append(_reading_ease_grade(score))
+    grades.append(where((score < 70) & (score >= 60), 9.0, float("nan")))
+
+    for score in (
+        smog_index,
+        coleman_liau_index,
+        automated_readability_index,
+        dale_chall_readability_score,
+        linsear_write_formula,
+        gunning_fog,
+    ):
+        grades.extend([floor(score), ceil(score), round_half_even(score)])
+
+    return most_common(*grades)
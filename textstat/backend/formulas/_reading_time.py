@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def reading_time(
+    chars: Any,
+    ms_per_char: float = 14.69,
+) -> Any:
+    """The formula of `metrics.reading_time`.
+
+    Parameters
+    ----------
+    chars : int, float or array_like
+        Number of characters, see `counts.count_chars`.
+    ms_per_char : float, optional
+        Milliseconds per character. The default is 14.69.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return ms_per_char * chars / 1000
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div
+
+
+def rix(
+    long_words: Any,
+    sentences: Any,
+) -> Any:
+    """The formula of `metrics.rix`.
+
+    Parameters
+    ----------
+    long_words : int, float or array_like
+        Number of words with more than six letters.
+    sentences : int, float or array_like
+        Number of sentences.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return div(long_words, sentences)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div
+
+
+def sentences_per_word(
+    sentences: Any,
+    words: Any,
+) -> Any:
+    """The formula of `metrics.sentences_per_word`.
+
+    Parameters
+    ----------
+    sentences : int, float or array_like
+        Number of sentences.
+    words : int, float or array_like
+        Number of words.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return div(sentences, words)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def smog_index(
+    polysyllable_words: Any,
+    sentences: Any,
+) -> Any:
+    """The formula of `metrics.smog_index`.
+
+    Parameters
+    ----------
+    polysyllable_words : int, float or array_like
+        Number of words with three syllables or more.
+    sentences : int, float or array_like
+        Number of sentences.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    score = (1.043 * (30 * div(polysyllable_words, sentences)) ** 0.5) + 3.1291
+    return where(sentences == 0, 0.0, score)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def spache_readability(
+    words: Any,
+    sentences: Any,
+    difficult_words: Any,
+) -> Any:
+    """The formula of `metrics.spache_readability`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    difficult_words : int, float or array_like
+        Number of difficult words, see `counts.count_difficult_words`.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    asl = div(words, sentences)
+    pdw = div(100 * difficult_words, words)
+    return where(words == 0, 0.0, (0.141 * asl) + (0.086 * pdw) + 0.839)
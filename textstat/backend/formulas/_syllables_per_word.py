@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div
+
+
+def syllables_per_word(
+    syllables: Any,
+    words: Any,
+) -> Any:
+    """The formula of `metrics.syllables_per_word`.
+
+    Parameters
+    ----------
+    syllables : int, float or array_like
+        Number of syllables.
+    words : int, float or array_like
+        Number of words.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return div(syllables, words)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..utils._get_lang_cfg import get_lang_cfg
+from ._ops import div, where
+
+
+def szigriszt_pazos(
+    words: Any,
+    sentences: Any,
+    syllables: Any,
+    lang: str = "en_US",
+) -> Any:
+    """The formula of `metrics.szigriszt_pazos`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    syllables : int, float or array_like
+        Number of syllables.
+    lang : str, optional
+        The language of the texts. The default is "en_US".
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    score = (
+        get_lang_cfg(lang, "fre_base")
+        - 62.3 * div(syllables, words)
+        - div(words, sentences)
+    )
+    return where((words == 0) | (sentences == 0), 0.0, score)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._automated_readability_index import automated_readability_index
+from ._coleman_liau_index import coleman_liau_index
+from ._dale_chall_readability_score import dale_chall_readability_score
+from ._flesch_kincaid_grade import flesch_kincaid_grade
+from ._flesch_reading_ease import flesch_reading_ease
+from ._gunning_fog import gunning_fog
+from ._linsear_write_formula import linsear_write_formula
+from ._readability_consensus import readability_consensus
+from ._smog_index import smog_index
+
+
+def text_standard(
+    chars: Any,
+    raw_words: Any,
+    letters: Any,
+    words: Any,
+    sentences: Any,
+    syllables: Any,
+    polysyllable_words: Any,
+    dale_chall_difficult_words: Any,
+    gunning_fog_difficult_words: Any,
+    linsear_words: Any,
+    linsear_easy_words: Any,
+    linsear_difficult_words: Any,
+    linsear_sentences: Any,
+    lang: str = "en_US",
+) -> Any:
+    """The formula of `metrics.text_standard`.
+
+    The scores of the other formulas are combined with
+    `readability_consensus`.
+
+    Parameters
+    ----------
+    chars : int, float or array_like
+        Number of characters, see `counts.count_chars`.
+    raw_words : int, float or array_like
+        Number of words, punctuation-only tokens included, see
+        `counts.count_words` with `rm_punctuation=False`.
+    letters : int, float or array_like
+        Number of letters.
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    syllables : int, float or array_like
+        Number of syllables.
+    polysyllable_words : int, float or array_like
+        Number of words with three syllables or more.
+    dale_chall_difficult_words : int, float or array_like
+        Number of words that are not in the easy word list, see
+        `counts.count_difficult_words` with `syllable_threshold=0`.
+    gunning_fog_difficult_words : int, float or array_like
+        Number of difficult words with the syllable threshold of the
+        language, see `metrics.gunning_fog`.
+    linsear_words : int, float or array_like
+        Number of words in the first 100 words.
+    linsear_easy_words : int, float or array_like
+        Number of words with one or two syllables in the first 100 words.
+    linsear_difficult_words : int, float or array_like
+        Number of words with three syllables or more in the first 100
+        words.
+    linsear_sentences : int, float or array_like
+        Number of sentences in the first 100 words.
+    lang : str, optional
+        The language of the texts. The default is "en_US".
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return readability_consensus(
+        flesch_kincaid_grade(words, sentences, syllables),
+        flesch_reading_ease(words, sentences, syllables, lang),
+        smog_index(polysyllable_words, sentences),
+        coleman_liau_index(letters, words, sentences),
+        automated_readability_index(chars, raw_words, words, sentences),
+        dale_chall_readability_score(words, sentences, dale_chall_difficult_words),
+        linsear_write_formula(
+            linsear_words,
+            linsear_easy_words,
+            linsear_difficult_words,
+            linsear_sentences,
+        ),
+        gunning_fog(words, sentences, gunning_fog_difficult_words),
+    )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div, where
+
+
+def wiener_sachtextformel(
+    words: Any,
+    sentences: Any,
+    polysyllable_words: Any,
+    long_words: Any,
+    monosyllable_words: Any,
+    variant: int,
+) -> Any:
+    """The formula of `metrics.wiener_sachtextformel`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+    polysyllable_words : int, float or array_like
+        Number of words with three syllables or more.
+    long_words : int, float or array_like
+        Number of words with more than six letters.
+    monosyllable_words : int, float or array_like
+        Number of words with one syllable.
+    variant : int
+        The variant of the formula, from 1 to 4.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    Raises
+    ------
+    ValueError
+        If `variant` is not between 1 and 4.
+
+    """
+    ms = div(100 * polysyllable_words, words)
+    sl = div(words, sentences)
+    iw = div(100 * long_words, words)
+    es = div(100 * monosyllable_words, words)
+
+    if variant == 1:
+        score = (0.1935 * ms) + (0.1672 * sl) + (0.1297 * iw) - (0.0327 * es) - 0.875
+    elif variant == 2:
+        score = (0.2007 * ms) + (0.1682 * sl) + (0.1373 * iw) - 2.779
+    elif variant == 3:
+        score = (0.2963 * ms) + (0.1905 * sl) - 1.1144
+    elif variant == 4:
+        score = (0.2744 * ms) + (0.2656 * sl) - 1.693
+    else:
+        raise ValueError("variant can only be an integer between 1 and 4")
+    return where(words == 0, 0.0, score)
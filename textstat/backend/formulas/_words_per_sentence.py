@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._ops import div
+
+
+def words_per_sentence(
+    words: Any,
+    sentences: Any,
+) -> Any:
+    """The formula of `metrics.words_per_sentence`.
+
+    Parameters
+    ----------
+    words : int, float or array_like
+        Number of words.
+    sentences : int, float or array_like
+        Number of sentences.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value for the counts of a text, or for every text if the counts
+        are arrays.
+
+    """
+    return div(words, sentences)
@@ -0,0 +1,15 @@
+from ._observed_call import observed_call
+from ._observed_call_info import ObservedCallInfo
+from ._observed_metric import observed_metric
+from ._profile import profile
+from ._profiler import Profiler
+from ._set_trace_callbacks import set_trace_callbacks
+
+__all__ = [
+    "observed_call",
+    "observed_metric",
+    "profile",
+    "set_trace_callbacks",
+    "ObservedCallInfo",
+    "Profiler",
+]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Callable
+
+from ._observed_call_info import ObservedCallInfo
+
+# The active observers, e.g. profilers, see `observed_call`
+OBSERVERS: list[Any] = []
+
+
+def observed_call(
+    name: str,
+    parameters: tuple[str, ...],
+    lookup: Callable[[tuple[Any, ...], dict[str, Any]], tuple[Any, bool]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Call a cached function and report the call to the active observers.
+
+    Observers have a `start(call)` method, called before the call, and an
+    `end(call, started)` method, called after it even if it raised, with the
+    `ObservedCallInfo` of the call and the return value of `start`. The cached
+    functions only call this while `OBSERVERS` is not empty, so that
+    instrumentation costs nothing when it is not used.
+
+    Parameters
+    ----------
+    name : str
+        The name of the function, e.g. "counts.count_sentences".
+    parameters : tuple[str, ...]
+        The names of the parameters of the function.
+    lookup : Callable
+        Returns the result of the call and whether it came from the cache.
+    args : tuple
+        The positional arguments of the call.
+    kwargs : dict
+        The keyword arguments of the call.
+
+    Returns
+    -------
+    Any
+        The result of the call.
+
+    """
+    arguments = dict(zip(parameters, args), **kwargs)
+    text = arguments.get("text", arguments.get("word"))
+    call = ObservedCallInfo(
+        name,
+        len(text) if isinstance(text, str) else None,
+        arguments.get("lang"),
+    )
+    return observe(call, lambda: lookup(args, kwargs))
+
+
+def observe(call: ObservedCallInfo, lookup: Callable[[], tuple[Any, bool]]) -> Any:
+    """Make `call` between the `start` and `end` of the active observers, see
+    `observed_call`."""
+    started = []
+    try:
+        for observer in tuple(OBSERVERS):
+            started.append((observer, observer.start(call)))
+        start = perf_counter()
+        try:
+            value, call.cached = lookup()
+        finally:
+            call.elapsed = perf_counter() - start
+        return value
+    finally:
+        for observer, state in reversed(started):
+            observer.end(call, state)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ObservedCallInfo:
+    """A call of a cached backend function, as seen by the observers (see
+    `observed_call`).
+
+    Attributes
+    ----------
+    name : str
+        The name of the function, e.g. "counts.count_sentences".
+    text_length : int or None
+        The length of the text, or word, the function was called with, or None
+        if it has no text argument (e.g. the loading of language resources).
+    lang : str or None
+        The language the function was called with, or None if it has no
+        language argument.
+    cached : bool
+        Whether the result came from the cache. Only known when the call ends.
+    elapsed : float
+        The wall time of the call in seconds. Only known when the call ends.
+
+    """
+
+    name: str
+    text_length: int | None
+    lang: str | None
+    cached: bool = False
+    elapsed: float = 0.0
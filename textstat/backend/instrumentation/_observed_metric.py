@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from ._observed_call import OBSERVERS, observe
+from ._observed_call_info import ObservedCallInfo
+
+
+def observed_metric(
+    name: str, text_length: int, lang: str, compute: Callable[[], Any]
+) -> Any:
+    """Derive a metric from the counts of a text and report it to the active
+    observers, like `observed_call` reports the cached functions.
+
+    `analyze`, `evaluate`, the windows and `batch` derive their metrics from a
+    `profiles.TextProfile` instead of calling the cached metrics, so they report
+    every metric with this function. Nothing is reported while `OBSERVERS` is
+    empty.
+
+    Parameters
+    ----------
+    name : str
+        The name of the metric, e.g. "analyze.flesch_reading_ease".
+    text_length : int
+        The length of the text the counts are from.
+    lang : str
+        The language of the text.
+    compute : Callable
+        Returns the value of the metric.
+
+    Returns
+    -------
+    Any
+        The value of the metric.
+
+    """
+    if not OBSERVERS:
+        return compute()
+    call = ObservedCallInfo(name, text_length, lang)
+    return observe(call, lambda: (compute(), False))
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from ._profiler import Profiler
+
+
+def profile() -> Profiler:
+    """Profile the backend functions called in a `with` block.
+
+    Instrumentation is only enabled while a profiler is active, and costs next
+    to nothing otherwise.
+
+    Returns
+    -------
+    Profiler
+        A new profiler, to use as a context manager.
+
+    Examples
+    --------
+    >>> with textstat.profile() as profiler:
+    ...     textstat.text_standard(text)
+    >>> profiler.as_dict()["counts.count_sentences"]["calls"]
+    1
+    >>> print(profiler)
+
+    """
+    return Profiler()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from ._observed_call import OBSERVERS
+from ._observed_call_info import ObservedCallInfo
+
+_COLUMNS = ("calls", "hits", "misses", "total_time", "own_time")
+
+
+class Profiler:
+    """Record the calls of the cached backend functions while it is active.
+
+    Every function of `backend.counts`, `metrics`, `selections` and
+    `transformations` is recorded, as well as the loading of language
+    resources, with its number of calls, cache hits and misses, and wall time.
+    The metrics that `analyze`, `evaluate`, the windows and `batch` derive from
+    the counts of a text are recorded as "analyze.<name>", next to the
+    building of the counts, "profiles.get_text_profile". These are never
+    cached, and only count as misses. The total time of a function includes
+    the functions it calls, its own time does not. A profiler is active in a
+    `with` block, and can be entered again to add to its records, but not while
+    it is active. Calls from all threads are recorded, but not the calls in the
+    worker processes of `batch`, which is best profiled with ``n_jobs=1``.
+
+    Examples
+    --------
+    >>> with Profiler() as profiler:
+    ...     textstat.flesch_reading_ease(text)
+    >>> print(profiler.format_table())
+
+    """
+
+    def __init__(self) -> None:
+        self.__records: dict[str, list[Any]] = {}
+        self.__lock = threading.Lock()
+        # Time spent in the nested calls of the calls in progress, by thread
+        self.__local = threading.local()
+
+    def __enter__(self) -> Profiler:
+        if self in OBSERVERS:
+            raise RuntimeError("The profiler is already active")
+        OBSERVERS.append(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        OBSERVERS.remove(self)
+
+    def start(self, call: ObservedCallInfo) -> None:
+        stack = self.__local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+
+    def end(self, call: ObservedCallInfo, started: None) -> None:
+        stack = self.__local.stack
+        nested = stack.pop()
+        if stack:
+            stack[-1] += call.elapsed
+        with self.__lock:
+            record = self.__records.setdefault(call.name, [0, 0, 0, 0.0, 0.0])
+            record[0] += 1
+            record[1 if call.cached else 2] += 1
+            record[3] += call.elapsed
+            record[4] += call.elapsed - nested
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Get the records.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            The "calls", "hits", "misses", "total_time" and "own_time" (in
+            seconds) of every called function, by name (e.g.
+            "counts.count_sentences"), from the longest own time to the
+            shortest.
+
+        """
+        with self.__lock:
+            records = sorted(self.__records.items(), key=lambda item: -item[1][4])
+            return {name: dict(zip(_COLUMNS, record)) for name, record in records}
+
+    def format_table(self, limit: int | None = None) -> str:
+        """Format the records as a table, from the longest own time to the
+        shortest.
+
+        Parameters
+        ----------
+        limit : int or None, optional
+            The maximum number of functions to show, or None to show them all.
+            Default: None
+
+        Returns
+        -------
+        str
+            The table, with times in milliseconds.
+
+        """
+        records = list(self.as_dict().items())[:limit]
+        width = max([len("function")] + [len(name) for name, _ in records])
+        lines = [
+            f"{'function':<{width}}  {'calls':>8}  {'hits':>8}  {'misses':>8}  "
+            f"{'total ms':>10}  {'own ms':>10}  {'own ms/call':>11}"
+        ]
+        for name, record in records:
+            lines.append(
+                f"{name:<{width}}  {record['calls']:>8}  {record['hits']:>8}  "
+                f"{record['misses']:>8}  {record['total_time'] * 1e3:>10.3f}  "
+                f"{record['own_time'] * 1e3:>10.3f}  "
+                f"{record['own_time'] * 1e3 / record['calls']:>11.4f}"
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format_table()
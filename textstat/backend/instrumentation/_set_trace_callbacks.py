@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import warnings
+from typing import Any, Callable
+
+from ._observed_call import OBSERVERS
+from ._observed_call_info import ObservedCallInfo
+
+
+class _Tracer:
+    """Observer calling the trace callbacks, see `set_trace_callbacks`."""
+
+    def __init__(
+        self,
+        on_start: Callable[[ObservedCallInfo], Any] | None,
+        on_end: Callable[[ObservedCallInfo, Any], Any] | None,
+    ) -> None:
+        self.on_start = on_start
+        self.on_end = on_end
+
+    def start(self, call: ObservedCallInfo) -> Any:
+        if self.on_start is not None:
+            try:
+                return self.on_start(call)
+            except Exception as error:
+                _warn("on_start", call, error)
+        return None
+
+    def end(self, call: ObservedCallInfo, started: Any) -> None:
+        if self.on_end is not None:
+            try:
+                self.on_end(call, started)
+            except Exception as error:
+                _warn("on_end", call, error)
+
+
+def _warn(callback: str, call: ObservedCallInfo, error: Exception) -> None:
+    # A broken tracer must not break the traced call
+    warnings.warn(
+        f"The {callback} trace callback failed for {call.name}: {error!r}", Warning
+    )
+
+
+# The observer calling the current callbacks, if any
+_STATE: dict[str, _Tracer | None] = {}
+
+
+def set_trace_callbacks(
+    on_start: Callable[[ObservedCallInfo], Any] | None = None,
+    on_end: Callable[[ObservedCallInfo, Any], Any] | None = None,
+) -> None:
+    """Set the functions called around every call of a cached backend function,
+    e.g. to record the calls as spans of a tracer.
+
+    Every function of `backend.counts`, `metrics`, `selections` and
+    `transformations`, and the loading of language resources, is traced, and
+    so is every metric that `analyze`, `evaluate`, the windows and `batch`
+    derive from the counts of a text, as "analyze.<name>" (see
+    `observed_metric`). Calls are traced in the thread that makes them, with
+    nested calls starting and ending within their caller. Setting new
+    callbacks replaces the previous ones, and tracing costs next to nothing
+    when no callback is set. An exception raised by a callback is turned into
+    a warning, so that it does not interrupt the traced call.
+
+    Parameters
+    ----------
+    on_start : Callable or None, optional
+        Called before every call with its `ObservedCallInfo`, holding the name
+        of the function (e.g. "metrics.flesch_reading_ease"), the length of the
+        text and the language. Its return value, e.g. a span, is passed to
+        `on_end`. Default: None
+    on_end : Callable or None, optional
+        Called after every call, even if it raised, with the same
+        `ObservedCallInfo`, now also holding whether the result was cached and
+        the elapsed time, and the return value of `on_start` (or None).
+        Default: None
+
+    Examples
+    --------
+    >>> spans = []
+    >>> set_trace_callbacks(
+    ...     on_start=lambda call: time.time_ns(),
+    ...     on_end=lambda call, start: spans.append((call, start, time.time_ns())),
+    ... )
+    >>> textstat.flesch_reading_ease("Short text.")
+    >>> set_trace_callbacks()  # stop tracing
+
+    """
+    previous = _STATE.get("tracer")
+    if previous is not None:
+        OBSERVERS.remove(previous)
+
+    tracer = None
+    if on_start is not None or on_end is not None:
+        tracer = _Tracer(on_start, on_end)
+        OBSERVERS.append(tracer)
+    _STATE["tracer"] = tracer
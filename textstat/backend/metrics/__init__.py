@@ -1,3 +1,4 @@
+from ._analyze import analyze
 from ._automated_readability_index import automated_readability_index
 from ._chars_per_word import chars_per_word
 from ._coleman_liau_index import coleman_liau_index
@@ -28,6 +29,7 @@ from ._words_per_sentence import words_per_sentence
 
 
 __all__ = [
+    "analyze",
     "automated_readability_index",
     "chars_per_word",
     "coleman_liau_index",
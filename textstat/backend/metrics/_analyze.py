@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import inspect
+from typing import Any, Iterable, Mapping
+
+from ..utils._get_metric_specs import get_metric_specs
+from ..profiles._get_text_profile import get_text_profile
+from ..profiles._text_profile import TextProfile
+
+METRIC_NAMES = frozenset(
+    name
+    for name in dir(TextProfile)
+    if not name.startswith("_")
+    and callable(getattr(TextProfile, name))
+    and name != "merge"
+)
+
+
+def analyze(
+    text: str,
+    lang: str,
+    metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+) -> dict[str, Any]:
+    """Calculate several metrics for `text` at once.
+
+    The text is tokenized and syllabified a single time (see
+    `profiles.get_text_profile`) and every metric is derived from the shared
+    counts, so asking for more metrics costs next to nothing.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+    metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+        Names of functions from `backend.metrics` or `backend.counts`, without
+        the `text` and `lang` arguments. Use a mapping to pass other
+        arguments, e.g. ``{"wiener_sachtextformel": {"variant": 1}}``.
+
+    Returns
+    -------
+    dict[str, Any]
+        The value of every requested metric, by name.
+
+    Raises
+    ------
+    ValueError
+        If a metric is unknown, if its arguments don't match the function, or
+        if it can't be derived from the counts, e.g. `count_difficult_words`
+        with `unique=True`.
+
+    """
+    specs = get_metric_specs(metrics)
+    for name, kwargs in specs:
+        if name not in METRIC_NAMES:
+            raise ValueError(f"Unknown metric {name}")
+        try:
+            inspect.signature(getattr(TextProfile, name)).bind(None, **kwargs)
+        except TypeError as error:
+            raise ValueError(f"Invalid arguments for {name}: {error}") from None
+
+    profile = get_text_profile(text, lang)
+    return {name: getattr(profile, name)(**kwargs) for name, kwargs in specs}
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from ._words_per_sentence import words_per_sentence
-from ._chars_per_word import chars_per_word
-
+from .. import formulas
 from ..utils._typed_cache import typed_cache
+from ..counts._count_chars import count_chars
+from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
 
 
 @typed_cache
@@ -29,10 +30,9 @@ def automated_readability_index(text: str) -> float:
         (4.71*n\ characters/n\ words)+(0.5*n\ words/n\ sentences)-21.43
 
     """
-    a = chars_per_word(text)
-    b = words_per_sentence(text)
-
-    if a == 0 or b == 0:
-        return 0.0
-
-    return (4.71 * a) + (0.5 * b) - 21.43
+    return formulas.automated_readability_index(
+        count_chars(text, ignore_spaces=True),
+        count_words(text, rm_punctuation=False),
+        count_words(text),
+        count_sentences(text),
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_chars import count_chars
 from ..counts._count_words import count_words
@@ -26,9 +27,7 @@ def chars_per_word(text: str, ignore_spaces: bool = True) -> float:
 
     """
     # We count puntuation-words as words because those characters get counted
-    try:
-        return count_chars(text, ignore_spaces=ignore_spaces) / count_words(
-            text, rm_punctuation=False
-        )
-    except ZeroDivisionError:
-        return 0.0
+    return formulas.chars_per_word(
+        count_chars(text, ignore_spaces=ignore_spaces),
+        count_words(text, rm_punctuation=False),
+    )
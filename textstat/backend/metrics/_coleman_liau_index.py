@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ._letters_per_word import letters_per_word
-from ._sentences_per_word import sentences_per_word
+from ..counts._count_letters import count_letters
+from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
 
 
 @typed_cache
@@ -28,10 +30,6 @@ def coleman_liau_index(text: str) -> float:
         (0.058*n\ letters/n\ words)-(0.296*n\ sentences/n\ words)-15.8
 
     """
-    letters = letters_per_word(text) * 100
-    sentences = sentences_per_word(text) * 100
-
-    if letters == 0 or sentences == 0:
-        return 0.0
-
-    return (0.058 * letters) - (0.296 * sentences) - 15.8
+    return formulas.coleman_liau_index(
+        count_letters(text), count_words(text), count_sentences(text)
+    )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
 from ..counts._count_difficult_words import count_difficult_words
-from ._words_per_sentence import words_per_sentence
 
 
 @typed_cache
@@ -41,16 +42,8 @@ def dale_chall_readability_score(text: str, lang: str) -> float:
     If the percentage of difficult words is > 5, 3.6365 is added to the
     score.
     """
-    word_count = count_words(text)
-    hard_count = count_difficult_words(text, lang, syllable_threshold=0)
-
-    try:
-        per_difficult_words = 100 * hard_count / word_count
-    except ZeroDivisionError:
-        return 0.0
-
-    score = (0.1579 * per_difficult_words) + (0.0496 * words_per_sentence(text))
-
-    if per_difficult_words > 5:
-        score += 3.6365
-    return score
+    return formulas.dale_chall_readability_score(
+        count_words(text),
+        count_sentences(text),
+        count_difficult_words(text, lang, syllable_threshold=0),
+    )
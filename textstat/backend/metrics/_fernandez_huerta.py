@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ._words_per_sentence import words_per_sentence
-from ._syllables_per_word import syllables_per_word
+from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
+from ..counts._count_syllables import count_syllables
 
 
 @typed_cache
@@ -22,10 +24,6 @@ def fernandez_huerta(text: str, lang: str) -> float:
     float
         The Fernandez Huerta readability score for `text`
     """
-    sentence_length = words_per_sentence(text)
-    syllables = syllables_per_word(text, lang)
-
-    if sentence_length == 0 or syllables == 0:
-        return 0.0
-
-    return 206.84 - (60 * syllables) - (1.02 * sentence_length)
+    return formulas.fernandez_huerta(
+        count_words(text), count_sentences(text), count_syllables(text, lang)
+    )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ._words_per_sentence import words_per_sentence
-from ._syllables_per_word import syllables_per_word
+from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
+from ..counts._count_syllables import count_syllables
 
 
 @typed_cache
@@ -30,10 +32,6 @@ def flesch_kincaid_grade(text: str, lang: str) -> float:
         (.39*avg\ sentence\ length)+(11.8*avg\ syllables\ per\ word)-15.59
 
     """
-    sentence_length = words_per_sentence(text)
-    syllables = syllables_per_word(text, lang)
-
-    if sentence_length == 0 or syllables == 0:
-        return 0.0
-
-    return (0.39 * sentence_length) + (11.8 * syllables) - 15.59
+    return formulas.flesch_kincaid_grade(
+        count_words(text), count_sentences(text), count_syllables(text, lang)
+    )
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ..utils._get_lang_root import get_lang_root
-from ..utils._get_lang_cfg import get_lang_cfg
-from ._syllables_per_word import syllables_per_word
-from ._words_per_sentence import words_per_sentence
+from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
+from ..counts._count_syllables import count_syllables
 
 
 @typed_cache
@@ -23,15 +23,6 @@ def flesch_reading_ease(text: str, lang: str) -> float:
     float
         The Flesch Reading Ease for `text`.
     """
-    lang_root = get_lang_root(lang)
-    sentence_length = words_per_sentence(text)
-    syllables = syllables_per_word(text, lang)
-
-    if sentence_length == 0 or syllables == 0:
-        return 0.0
-
-    return (
-        get_lang_cfg(lang_root, "fre_base")
-        - get_lang_cfg(lang_root, "fre_sentence_length") * sentence_length
-        - get_lang_cfg(lang_root, "fre_syll_per_word") * syllables
+    return formulas.flesch_reading_ease(
+        count_words(text), count_sentences(text), count_syllables(text, lang), lang
     )
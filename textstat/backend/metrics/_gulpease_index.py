@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ._sentences_per_word import sentences_per_word
-from ._chars_per_word import chars_per_word
+from ..counts._count_sentences import count_sentences
+from ..counts._count_words import count_words
+from ..counts._count_chars import count_chars
 
 
 @typed_cache
@@ -20,10 +22,9 @@ def gulpease_index(text: str) -> float:
     float
         The Gulpease Index for `text`
     """
-    spw = sentences_per_word(text)
-    cpw = chars_per_word(text)
-
-    if spw == 0 or cpw == 0:
-        return 0.0
-
-    return (300 * spw) - (10 * cpw) + 89
+    return formulas.gulpease_index(
+        count_sentences(text),
+        count_words(text),
+        count_chars(text, ignore_spaces=True),
+        count_words(text, rm_punctuation=False),
+    )
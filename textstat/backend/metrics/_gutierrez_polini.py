@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ._letters_per_word import letters_per_word
-from ._words_per_sentence import words_per_sentence
+from ..counts._count_letters import count_letters
+from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
 
 
 @typed_cache
@@ -21,10 +22,6 @@ def gutierrez_polini(text: str) -> float:
     float
         The Gutierrez de Polini index for `text`
     """
-    lpw = letters_per_word(text)
-    wps = words_per_sentence(text)
-
-    if lpw == 0 or wps == 0:
-        return 0.0
-
-    return 95.2 - 9.7 * lpw - 0.35 * wps
+    return formulas.gutierrez_polini(
+        count_letters(text), count_words(text), count_sentences(text)
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_letters import count_letters
 from ..counts._count_words import count_words
@@ -23,7 +24,4 @@ def letters_per_word(text: str) -> float:
         The average number of letters per word.
 
     """
-    try:
-        return count_letters(text) / count_words(text)
-    except ZeroDivisionError:
-        return 0.0
+    return formulas.letters_per_word(count_letters(text), count_words(text))
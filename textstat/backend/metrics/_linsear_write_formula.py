@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ..counts._count_syllables import count_syllables
+from ..counts._count_word_syllables import count_word_syllables
 from ..counts._count_sentences import count_sentences
 from ..selections._list_words import list_words
 from ..transformations._remove_punctuation import remove_punctuation
@@ -58,13 +58,10 @@ def linsear_write_formula(
         words_list = list_words(text, rm_punctuation=True)
         i_text = len(text_list)
 
-    if strict_lower and len(words_list) < 100:
-        return 0.0
-
     easy_word = 0
     difficult_word = 0
     for word in words_list:
-        n_syll = count_syllables(word, lang)
+        n_syll = count_word_syllables(word.lower(), lang)
         if n_syll >= 3:
             difficult_word += 1
         elif n_syll > 0:
@@ -72,12 +69,10 @@ def linsear_write_formula(
 
     text = " ".join(text_list[:i_text])
 
-    try:
-        number = float((easy_word * 1 + difficult_word * 3) / count_sentences(text))
-    except ZeroDivisionError:
-        return 0.0
-
-    if number <= 20:
-        number -= 2
-
-    return number / 2
+    return formulas.linsear_write_formula(
+        len(words_list),
+        easy_word,
+        difficult_word,
+        count_sentences(text),
+        strict_lower,
+    )
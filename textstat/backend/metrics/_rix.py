@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_long_words import count_long_words
 from ..counts._count_sentences import count_sentences
@@ -37,10 +38,4 @@ def rix(text: str) -> float:
     hyphenated sequences and abbreviations count as single words.
 
     """
-    long_words_count = count_long_words(text)
-    sentences_count = count_sentences(text)
-
-    try:
-        return long_words_count / sentences_count
-    except ZeroDivisionError:
-        return 0.0
+    return formulas.rix(count_long_words(text), count_sentences(text))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_sentences import count_sentences
 from ..counts._count_words import count_words
@@ -22,7 +23,4 @@ def sentences_per_word(text: str) -> float:
         Number of sentences per word.
 
     """
-    try:
-        return count_sentences(text) / count_words(text)
-    except ZeroDivisionError:
-        return 0.0
+    return formulas.sentences_per_word(count_sentences(text), count_words(text))
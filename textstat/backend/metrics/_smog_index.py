@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
-from ..counts._count_sentences import count_sentences
 from ..counts._count_polysyllable_words import count_polysyllable_words
+from ..counts._count_sentences import count_sentences
 
 
 @typed_cache
@@ -31,10 +32,6 @@ def smog_index(text: str, lang: str) -> float:
 
     Polysyllabic words are defined as words with more than 3 syllables.
     """
-    sentences = count_sentences(text)
-
-    poly_syllab = count_polysyllable_words(text, lang)
-    try:
-        return (1.043 * (30 * (poly_syllab / sentences)) ** 0.5) + 3.1291
-    except ZeroDivisionError:
-        return 0.0
+    return formulas.smog_index(
+        count_polysyllable_words(text, lang), count_sentences(text)
+    )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_words import count_words
+from ..counts._count_sentences import count_sentences
 from ..counts._count_difficult_words import count_difficult_words
-from ._words_per_sentence import words_per_sentence
 
 
 @typed_cache
@@ -22,10 +23,6 @@ def spache_readability(text: str, lang: str) -> float:
     float
         The SPACHE readability score for `text`
     """
-    total_no_of_words = count_words(text)
-    asl = words_per_sentence(text)
-    try:
-        pdw = 100 * count_difficult_words(text, lang) / total_no_of_words
-    except ZeroDivisionError:
-        return 0.0
-    return (0.141 * asl) + (0.086 * pdw) + 0.839
+    return formulas.spache_readability(
+        count_words(text), count_sentences(text), count_difficult_words(text, lang)
+    )
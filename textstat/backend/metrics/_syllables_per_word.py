@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_syllables import count_syllables
 from ..counts._count_words import count_words
@@ -22,7 +23,6 @@ def syllables_per_word(text: str, lang: str) -> float:
         The average number of syllables per word.
 
     """
-    try:
-        return count_syllables(text, lang) / count_words(text)
-    except ZeroDivisionError:
-        return 0.0
+    return formulas.syllables_per_word(
+        count_syllables(text, lang), count_words(text)
+    )
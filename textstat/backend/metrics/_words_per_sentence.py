@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .. import formulas
 from ..utils._typed_cache import typed_cache
 from ..counts._count_words import count_words
 from ..counts._count_sentences import count_sentences
@@ -23,7 +24,4 @@ def words_per_sentence(text: str) -> float:
         The average number of words per sentence.
 
     """
-    try:
-        return count_words(text) / count_sentences(text)
-    except ZeroDivisionError:
-        return 0.0
+    return formulas.words_per_sentence(count_words(text), count_sentences(text))
@@ -0,0 +1,17 @@
+from ._get_sentence_index import get_sentence_index
+from ._get_sentence_profiles import get_sentence_profiles
+from ._get_stream_profile import get_stream_profile
+from ._get_text_profile import get_text_profile
+from ._merge_text_profiles import merge_text_profiles
+from ._sentence_index import SentenceIndex
+from ._text_profile import TextProfile
+
+__all__ = [
+    "get_sentence_index",
+    "get_sentence_profiles",
+    "get_stream_profile",
+    "get_text_profile",
+    "merge_text_profiles",
+    "SentenceIndex",
+    "TextProfile",
+]
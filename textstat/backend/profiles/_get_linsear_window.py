@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence
+
+from ..counts._count_sentences import count_sentences
+from ..counts._count_word_syllables import count_word_syllables
+from ..transformations._remove_punctuation import remove_punctuation
+
+
+def get_linsear_window(
+    raw_words: Sequence[str],
+    n_raw_words: int,
+    lang: str,
+    words: int,
+    syllable_histogram: Sequence[int] | None,
+    sentences: int,
+    word_syllables: Mapping[str, int] | None = None,
+) -> dict[str, Any]:
+    """Count the words and sentences in the window `metrics.linsear_write_formula`
+    looks at with `strict_upper=True`, which is the first 100 words of texts
+    with more than 100 tokens, and the whole text otherwise.
+
+    Parameters
+    ----------
+    raw_words : Sequence[str]
+        The whitespace separated tokens of the text, or at least the ones up
+        to the end of the window.
+    n_raw_words : int
+        Number of whitespace separated tokens in the text.
+    lang : str
+        The language of the text.
+    words : int
+        Number of words in the text.
+    syllable_histogram : Sequence[int] or None
+        Number of words in the text with `i` syllables at index `i`, or None
+        if the syllables of the language can't be counted, in which case the
+        easy and difficult words of the window are None too.
+    sentences : int
+        Number of sentence candidates in the text that are long enough to count.
+    word_syllables : Mapping[str, int] or None, optional
+        Syllable counts of words that are already known.
+
+    Returns
+    -------
+    dict[str, Any]
+        The `linsear_*` fields of a `TextProfile`.
+
+    """
+    if n_raw_words <= 100:
+        return dict(
+            linsear_words=words,
+            linsear_easy_words=(
+                None if syllable_histogram is None else sum(syllable_histogram[1:3])
+            ),
+            linsear_difficult_words=(
+                None if syllable_histogram is None else sum(syllable_histogram[3:])
+            ),
+            linsear_sentences=max(1, sentences) if raw_words else 0,
+            linsear_head=tuple(raw_words),
+        )
+
+    word_syllables = word_syllables or {}
+    window = []
+    i_text = 0
+    while (i_text < len(raw_words)) and (len(window) < 100):
+        word = remove_punctuation(raw_words[i_text], rm_apostrophe=False)
+        i_text += 1
+        if len(word) > 0:
+            window.append(word)
+    easy_words = difficult_words = None
+    if syllable_histogram is not None:
+        window_syllables = [
+            word_syllables[word] if word in word_syllables
+            else count_word_syllables(word.lower(), lang)
+            for word in window
+        ]
+        easy_words = sum(1 for n in window_syllables if 0 < n < 3)
+        difficult_words = sum(1 for n in window_syllables if n >= 3)
+    return dict(
+        linsear_words=len(window),
+        linsear_easy_words=easy_words,
+        linsear_difficult_words=difficult_words,
+        linsear_sentences=count_sentences(" ".join(raw_words[:i_text])),
+        linsear_head=tuple(raw_words[:i_text]),
+    )
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from ..utils._typed_cache import typed_cache
+from ._sentence_index import SentenceIndex
+
+
+@typed_cache
+def get_sentence_index(text: str, lang: str) -> SentenceIndex:
+    """Index the counts of every sentence of a text, to get the profile of any
+    range of sentences in constant time.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    SentenceIndex
+        The index of `text`.
+
+    """
+    return SentenceIndex(text, lang)
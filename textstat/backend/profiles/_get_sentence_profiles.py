@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import re
+
+from ..utils._typed_cache import typed_cache
+from ..utils.constants import RE_SENTENCE
+from ._profile_text import profile_text
+from ._text_profile import TextProfile
+
+
+@typed_cache
+def get_sentence_profiles(text: str, lang: str) -> list[tuple[int, int, TextProfile]]:
+    """Split a text into sentences and gather the counts of every sentence, in a
+    single pass over the text.
+
+    Sentences are found with the rules of `counts.count_sentences`: sentence
+    candidates with two words or less are not sentences, and are kept with the
+    next sentence (or with the last one at the end of the text). Words are
+    only syllabified once for the whole text.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    list[tuple[int, int, TextProfile]]
+        The position in the text where every sentence starts and ends, and its
+        counts.
+
+    """
+    word_syllables: dict[str, int] = {}
+    sentences: list[tuple[int, int, TextProfile]] = []
+    start = None
+    end = 0
+    for match in re.finditer(RE_SENTENCE, text, re.UNICODE):
+        end = match.end()
+        profile = profile_text(match.group(), lang, word_syllables)
+        if start is None:
+            start = match.start()
+        elif profile.words > 2:
+            # Short candidates before the sentence
+            profile = profile_text(text[start:end], lang, word_syllables)
+        if profile.words > 2:
+            sentences.append((start, end, profile))
+            start = None
+
+    if start is not None:
+        # Short candidates at the end of the text
+        if sentences:
+            start = sentences.pop()[0]
+        sentences.append(
+            (start, end, profile_text(text[start:end], lang, word_syllables))
+        )
+    return sentences
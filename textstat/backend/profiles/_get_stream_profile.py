@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from ..utils.constants import (
+    RE_SENTENCE_BOUNDARY,
+    RE_WORD_BOUNDARY,
+    STREAM_BLOCK_SIZE,
+    STREAM_MAX_BUFFER_SIZE,
+)
+from ._merge_text_profiles import merge_text_profiles
+from ._profile_text import profile_text
+from ._text_profile import TextProfile
+
+_RE_SENTENCE_BOUNDARY = re.compile(RE_SENTENCE_BOUNDARY)
+_RE_WORD_BOUNDARY = re.compile(RE_WORD_BOUNDARY)
+
+
+def _find_cut(text: str, max_buffer_size: int) -> int:
+    """Find the last position of `text` where it can be cut, or 0."""
+    cut = 0
+    for match in _RE_SENTENCE_BOUNDARY.finditer(text):
+        cut = match.end()
+    if cut == 0 and len(text) >= max_buffer_size:
+        for match in _RE_WORD_BOUNDARY.finditer(text):
+            cut = match.end()
+    return cut
+
+
+def _iter_profiles(
+    chunks: Iterable[str], lang: str, block_size: int, max_buffer_size: int
+) -> Iterable[TextProfile]:
+    buffer: list[str] = []
+    size = 0
+    # The blocks are profiled without the document-level cache, which they
+    # would only fill, but they share the syllable counts of their words
+    word_syllables: dict[str, int] = {}
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer.append(chunk)
+        size += len(chunk)
+        if size < block_size:
+            continue
+
+        text = "".join(buffer)
+        cut = _find_cut(text, max_buffer_size)
+        if cut:
+            yield profile_text(text[:cut], lang, word_syllables)
+            text = text[cut:]
+        buffer = [text]
+        size = len(text)
+    yield profile_text("".join(buffer), lang, word_syllables)
+
+
+def get_stream_profile(
+    chunks: Iterable[str],
+    lang: str,
+    block_size: int = STREAM_BLOCK_SIZE,
+    max_buffer_size: int = STREAM_MAX_BUFFER_SIZE,
+) -> TextProfile:
+    """Gather the counts of a text read piece by piece, without holding all of
+    it in memory.
+
+    The chunks are buffered until there are at least `block_size` characters,
+    and the buffer is profiled up to the end of its last complete sentence
+    (see `merge_text_profiles`), so the chunks can be cut anywhere, even in the
+    middle of a word. The profile is the same as the one of the concatenated
+    chunks, unless a sentence is longer than `max_buffer_size` characters, in
+    which case it is cut between two words and may be counted as two
+    sentences.
+
+    Parameters
+    ----------
+    chunks : Iterable[str]
+        The pieces of the text, in order.
+    lang : str
+        The language of the text.
+    block_size : int, optional
+        The minimum number of characters profiled at once. The default is
+        `utils.constants.STREAM_BLOCK_SIZE`.
+    max_buffer_size : int, optional
+        The number of characters after which a sentence is cut between words.
+        The default is `utils.constants.STREAM_MAX_BUFFER_SIZE`.
+
+    Returns
+    -------
+    TextProfile
+        The counts of the whole text.
+
+    """
+    return merge_text_profiles(
+        _iter_profiles(chunks, lang, block_size, max_buffer_size)
+    )
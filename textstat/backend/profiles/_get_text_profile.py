@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from ..utils._typed_cache import typed_cache
+from ._profile_text import profile_text
+from ._text_profile import TextProfile
+
+
+@typed_cache
+def get_text_profile(text: str, lang: str) -> TextProfile:
+    """Gather all counts needed by the readability metrics in a single pass over
+    the text. Every word is tokenized and syllabified once, and the resulting
+    profile can evaluate any metric without looking at `text` again.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    TextProfile
+        The counts of `text`.
+
+    """
+    return profile_text(text, lang)
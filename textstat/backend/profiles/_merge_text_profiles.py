@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from ._text_profile import TextProfile
+
+
+def merge_text_profiles(profiles: Iterable[TextProfile]) -> TextProfile:
+    """Combine the profiles of consecutive parts of a text into the profile of
+    the whole text, see `TextProfile.merge`.
+
+    Parameters
+    ----------
+    profiles : Iterable[TextProfile]
+        The profiles of the parts of the text, in order, all for the same
+        language.
+
+    Returns
+    -------
+    TextProfile
+        The profile of the whole text.
+
+    Raises
+    ------
+    ValueError
+        If there are no profiles, or if they are for different languages.
+
+    """
+    merged = None
+    for profile in profiles:
+        merged = profile if merged is None else merged.merge(profile)
+    if merged is None:
+        raise ValueError("No profiles to merge")
+    return merged
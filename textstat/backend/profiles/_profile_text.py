@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any
+
+from ..utils._get_lang_easy_words import get_lang_easy_words
+from ..utils._has_pyphen import has_pyphen
+from ..utils.constants import (
+    ARABIC_LONG_VOWELS,
+    ARABIC_SHORT_VOWELS,
+    RE_SENTENCE,
+)
+from ..counts._count_arabic_long_words import count_arabic_long_words
+from ..counts._count_arabic_syllables import count_arabic_syllables
+from ..counts._count_word_syllables import count_word_syllables
+from ..counts._count_words import count_words
+from ..selections._list_words import list_words
+from ..transformations._remove_punctuation import remove_punctuation
+from ._get_linsear_window import get_linsear_window
+from ._text_profile import TextProfile
+
+_RE_ARABIC_HARAKAT = re.compile("[\u064e\u064b\u064f\u064c\u0650\u064d\u0651]")
+_RE_FASEEH_SINGLE = re.compile(r"[\u0626\u0621\u0624\u0630\u0638]")
+_RE_FASEEH_DOUBLE = re.compile(r"(\u0648\u0627|\u0648\u0646)")
+_RE_TASHKEEL = re.compile(
+    r"\u064E|\u064B|\u064F|\u064C|\u0650|\u064D|\u0651|\u0652|\u0653|\u0657|\u0658"
+)
+# Characters a word needs to be complex or faseeh
+_RE_ARABIC_MARKERS = re.compile(
+    "[\u064e\u064b\u064f\u064c\u0650\u064d\u0651"
+    "\u0626\u0621\u0624\u0630\u0638\u0648]"
+)
+_RE_ARABIC_SHORT_VOWEL = re.compile("[" + "".join(ARABIC_SHORT_VOWELS) + "]")
+_RE_ARABIC_STRESS = re.compile(r"[\u064B\u064C\u064D\u0651]")
+_RE_ARABIC_FALLBACK = re.compile(r"[\u0627\u0649\?\.\!\,\s*]")
+
+
+def _histogram(counter: Counter[int]) -> tuple[int, ...]:
+    if not counter:
+        return ()
+    return tuple(counter[i] for i in range(max(counter) + 1))
+
+
+def _get_arabic_syllables(text: str, bare_words: list[str]) -> dict[str, Any]:
+    """The parts of `counts.count_arabic_syllables`, kept apart so that they can
+    be added up for concatenated texts.
+    """
+    chars = "".join(bare_words)
+    short_syllables = 0
+    long_syllables = 0
+    for match in _RE_ARABIC_SHORT_VOWEL.finditer(chars):
+        if chars[match.end():match.end() + 1] in ARABIC_LONG_VOWELS:
+            long_syllables += 1
+        else:
+            short_syllables += 1
+    return dict(
+        arabic_short_syllables=short_syllables,
+        arabic_long_syllables=long_syllables,
+        arabic_stress_syllables=len(_RE_ARABIC_STRESS.findall(text)),
+        arabic_fallback_chars=len(_RE_ARABIC_FALLBACK.sub("", text)),
+        arabic_edges=chars[:1] + chars[-1:],
+    )
+
+
+def profile_text(
+    text: str, lang: str, word_syllables: dict[str, int] | None = None
+) -> TextProfile:
+    """The uncached single pass of `get_text_profile`, for callers that profile
+    many small texts, e.g. every sentence of a document.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+    word_syllables : dict[str, int] or None, optional
+        Syllable counts of words, which is filled with the words of `text` and
+        can be shared by several calls for the same language.
+
+    Returns
+    -------
+    TextProfile
+        The counts of `text`.
+
+    """
+    raw_words = list_words(text, rm_punctuation=False)
+    words = list_words(text)
+    easy_words = get_lang_easy_words(lang)
+
+    syllables = 0
+    syllable_histogram: Counter[int] = Counter()
+    difficult_histogram: Counter[int] = Counter()
+    if word_syllables is None:
+        word_syllables = {}
+    # Without a pyphen dictionary (e.g. for arabic) syllables are not counted,
+    # and only the metrics that don't need them are available. A text without
+    # words has no syllables in any language.
+    counts_syllables = has_pyphen(lang) or not words
+    for word in words if counts_syllables else ():
+        n_syll = word_syllables.get(word)
+        if n_syll is None:
+            n_syll = word_syllables[word] = count_word_syllables(word.lower(), lang)
+        syllables += n_syll
+        syllable_histogram[n_syll] += 1
+        if word.lower() not in easy_words:
+            difficult_histogram[n_syll] += 1
+
+    bare_words = list_words(text, rm_apostrophe=True)
+    length_histogram = Counter(map(len, bare_words))
+    complex_arabic_words = 0
+    faseeh = 0
+    # See `counts.count_complex_arabic_words` and `counts.count_faseeh`
+    for word in bare_words if _RE_ARABIC_MARKERS.search(text) else ():
+        if len(_RE_ARABIC_HARAKAT.findall(word)) > 5:
+            complex_arabic_words += 1
+        if (
+            _RE_FASEEH_SINGLE.search(word) or _RE_FASEEH_DOUBLE.search(word)
+        ) and count_arabic_syllables(word) > 5:
+            faseeh += 1
+
+    # Without tashkeel the words are the same as the ones counted above
+    if _RE_TASHKEEL.search(text):
+        arabic_long_words = count_arabic_long_words(text)
+    else:
+        arabic_long_words = sum(n for size, n in length_histogram.items() if size > 5)
+
+    segments = re.findall(RE_SENTENCE, text, re.UNICODE)
+    short_segments = sum(1 for segment in segments if count_words(segment) <= 2)
+
+    no_spaces = re.sub(r"\s", "", text)
+    histogram = _histogram(syllable_histogram) if counts_syllables else None
+    linsear = get_linsear_window(
+        raw_words,
+        len(raw_words),
+        lang,
+        len(words),
+        histogram,
+        len(segments) - short_segments,
+        word_syllables,
+    )
+
+    return TextProfile(
+        lang=lang,
+        chars=len(no_spaces),
+        chars_with_spaces=len(text),
+        letters=len(remove_punctuation(no_spaces, rm_apostrophe=True)),
+        words=len(words),
+        raw_words=len(raw_words),
+        sentence_segments=len(segments),
+        short_segments=short_segments,
+        syllables=syllables if counts_syllables else None,
+        syllable_histogram=histogram,
+        difficult_histogram=(
+            _histogram(difficult_histogram) if counts_syllables else None
+        ),
+        length_histogram=_histogram(length_histogram),
+        **linsear,
+        complex_arabic_words=complex_arabic_words,
+        arabic_long_words=arabic_long_words,
+        **_get_arabic_syllables(text, bare_words),
+        faseeh=faseeh,
+    )
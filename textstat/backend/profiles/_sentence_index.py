@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import re
+from itertools import accumulate
+from typing import Any, Iterator
+
+from ..counts._count_sentences import count_sentences
+from ..counts._count_word_syllables import count_word_syllables
+from ..transformations._remove_punctuation import remove_punctuation
+from ..utils._has_pyphen import has_pyphen
+from ..utils.constants import (
+    ARABIC_LONG_VOWELS,
+    ARABIC_SHORT_VOWELS,
+    RE_SENTENCE_BOUNDARY,
+)
+from ._get_linsear_window import get_linsear_window
+from ._profile_text import profile_text
+from ._text_profile import (
+    ADDITIVE_FIELDS,
+    HISTOGRAM_FIELDS,
+    SYLLABLE_FIELDS,
+    TextProfile,
+)
+
+_RE_SENTENCE_BOUNDARY = re.compile(RE_SENTENCE_BOUNDARY)
+
+
+def _prefix_sums(values: list[int]) -> list[int]:
+    return list(accumulate(values, initial=0))
+
+
+class SentenceIndex:
+    """Prefix sums of the counts of the sentences of a text, which give the
+    profile of any range of consecutive sentences in constant time (see
+    `profiles.get_sentence_index`).
+
+    The text is cut after the whitespace that follows the end of a sentence,
+    and parts that don't contain a sentence as counted by
+    `counts.count_sentences` (e.g. "Mr. ") are joined to the next one, so
+    the profile of a range of sentences is the same as the one of the
+    corresponding slice of the text. Sentences that are not followed by
+    whitespace stay with the next one, so there can be fewer sentences than
+    `counts.count_sentences` finds.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+
+    Attributes
+    ----------
+    lang : str
+        The language of the text.
+    offsets : tuple[int, ...]
+        The position in the text where every sentence starts, followed by the
+        length of the text.
+    """
+
+    def __init__(self, text: str, lang: str) -> None:
+        self.lang = lang
+
+        cuts = [0]
+        cuts.extend(match.end() for match in _RE_SENTENCE_BOUNDARY.finditer(text))
+        if text:
+            cuts.append(len(text))
+        # The parts are not stored in the cache of `get_text_profile`, which is
+        # meant for whole documents, and share the syllable counts of their words
+        word_syllables: dict[str, int] = {}
+        parts = [
+            profile_text(text[start:end], lang, word_syllables)
+            for start, end in zip(cuts, cuts[1:])
+        ]
+
+        # Sentences end with the first part that contains one, parts after the
+        # last sentence are joined to it
+        sentence_parts = [0]
+        counted = 0
+        for i, part in enumerate(parts, 1):
+            counted += part.sentence_segments - part.short_segments
+            if counted > 0:
+                sentence_parts.append(i)
+                counted = 0
+        if parts and len(sentence_parts) == 1:
+            sentence_parts.append(len(parts))
+        sentence_parts[-1] = len(parts)
+        self.__sentence_parts = tuple(sentence_parts)
+        self.offsets = tuple(cuts[i] for i in sentence_parts)
+
+        # Syllables are not counted without a pyphen dictionary
+        self.__counts_syllables = has_pyphen(lang)
+        missing = () if self.__counts_syllables else SYLLABLE_FIELDS
+        self.__sums = {
+            name: _prefix_sums([getattr(part, name) for part in parts])
+            for name in ADDITIVE_FIELDS
+            if name not in missing
+        }
+        self.__histogram_sums = {}
+        for name in HISTOGRAM_FIELDS:
+            if name in missing:
+                continue
+            histograms = [getattr(part, name) for part in parts]
+            size = max(map(len, histograms), default=0)
+            self.__histogram_sums[name] = [
+                _prefix_sums([h[i] if i < len(h) else 0 for h in histograms])
+                for i in range(size)
+            ]
+
+        # A short arabic vowel at the end of a part is long if the next part
+        # that has words starts with an alef, a waw or a yaa
+        self.__edges = [part.arabic_edges for part in parts]
+        previous = -1
+        self.__previous_edges: list[int] = []
+        adjustments = []
+        for i, edges in enumerate(self.__edges):
+            self.__previous_edges.append(previous)
+            adjustments.append(
+                previous >= 0
+                and self.__edges[previous][-1:] in ARABIC_SHORT_VOWELS
+                and edges[:1] in ARABIC_LONG_VOWELS
+            )
+            if edges:
+                previous = i
+        self.__previous_edges.append(previous)
+        self.__adjustments = _prefix_sums(adjustments)
+        self.__next_edges = [len(parts)] * (len(parts) + 1)
+        for i in reversed(range(len(parts))):
+            self.__next_edges[i] = i if self.__edges[i] else self.__next_edges[i + 1]
+
+        # The tokens, to find the window of `metrics.linsear_write_formula`
+        self.__tokens = text.split()
+        self.__part_tokens = _prefix_sums([part.raw_words for part in parts])
+        token_syllables: dict[str, int] = {}
+        for token in set(self.__tokens):
+            word = remove_punctuation(token, rm_apostrophe=False)
+            if not word:
+                token_syllables[token] = -1
+            elif self.__counts_syllables:
+                n_syll = word_syllables.get(word)
+                if n_syll is None:
+                    n_syll = count_word_syllables(word.lower(), lang)
+                token_syllables[token] = n_syll
+            else:
+                token_syllables[token] = 0
+        syllables = [token_syllables[token] for token in self.__tokens]
+        self.__word_tokens = [i for i, n in enumerate(syllables) if n >= 0]
+        self.__token_words = _prefix_sums([n >= 0 for n in syllables])
+        self.__token_easy_words = _prefix_sums([0 < n < 3 for n in syllables])
+        self.__token_difficult_words = _prefix_sums([n >= 3 for n in syllables])
+
+    def __len__(self) -> int:
+        """Number of sentences."""
+        return len(self.__sentence_parts) - 1
+
+    def span(self, start: int, stop: int) -> tuple[int, int]:
+        """The positions in the text where a range of sentences starts and
+        ends.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first sentence.
+        stop : int
+            The index after the last sentence.
+
+        Returns
+        -------
+        tuple[int, int]
+            The start and end of the slice of the text.
+
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return self.offsets[start], self.offsets[max(start, stop)]
+
+    def profile(self, start: int, stop: int) -> TextProfile:
+        """The profile of a range of sentences.
+
+        All counts are read from prefix sums, except for the sentences in the
+        window of `metrics.linsear_write_formula`, which is 100 words at most.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first sentence.
+        stop : int
+            The index after the last sentence.
+
+        Returns
+        -------
+        TextProfile
+            The same as `get_text_profile` on the slice of the text given by
+            `span(start, stop)`.
+
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        first = self.__sentence_parts[start]
+        last = self.__sentence_parts[max(start, stop)]
+
+        fields: dict[str, Any] = dict.fromkeys(SYLLABLE_FIELDS)
+        fields.update(
+            (name, sums[last] - sums[first]) for name, sums in self.__sums.items()
+        )
+        for name, bins in self.__histogram_sums.items():
+            histogram = [sums[last] - sums[first] for sums in bins]
+            while histogram and not histogram[-1]:
+                histogram.pop()
+            fields[name] = tuple(histogram)
+        if not self.__counts_syllables and not fields["words"]:
+            # Like `profile_text`, a range without words has no syllables
+            fields.update(syllables=0, syllable_histogram=(), difficult_histogram=())
+
+        first_edges = self.__next_edges[first]
+        last_edges = self.__previous_edges[last]
+        if first_edges < last:
+            adjustment = (
+                self.__adjustments[last] - self.__adjustments[first_edges + 1]
+            )
+            fields["arabic_short_syllables"] -= adjustment
+            fields["arabic_long_syllables"] += adjustment
+            fields["arabic_edges"] = (
+                self.__edges[first_edges][:1] + self.__edges[last_edges][-1:]
+            )
+        else:
+            fields["arabic_edges"] = ""
+
+        first_token = self.__part_tokens[first]
+        last_token = self.__part_tokens[last]
+        if last_token - first_token <= 100:
+            fields.update(
+                get_linsear_window(
+                    self.__tokens[first_token:last_token],
+                    last_token - first_token,
+                    self.lang,
+                    fields["words"],
+                    fields["syllable_histogram"],
+                    fields["sentence_segments"] - fields["short_segments"],
+                )
+            )
+        else:
+            # The window ends with the 100th word of the range
+            end_token = last_token
+            i_word = self.__token_words[first_token] + 99
+            if i_word < len(self.__word_tokens):
+                end_token = min(end_token, self.__word_tokens[i_word] + 1)
+            head = self.__tokens[first_token:end_token]
+            fields.update(
+                linsear_words=(
+                    self.__token_words[end_token] - self.__token_words[first_token]
+                ),
+                linsear_easy_words=(
+                    self.__token_easy_words[end_token]
+                    - self.__token_easy_words[first_token]
+                    if self.__counts_syllables
+                    else None
+                ),
+                linsear_difficult_words=(
+                    self.__token_difficult_words[end_token]
+                    - self.__token_difficult_words[first_token]
+                    if self.__counts_syllables
+                    else None
+                ),
+                linsear_sentences=count_sentences(" ".join(head)),
+                linsear_head=tuple(head),
+            )
+        return TextProfile(lang=self.lang, **fields)
+
+    def windows(
+        self, size: int, step: int = 1
+    ) -> Iterator[tuple[int, int, TextProfile]]:
+        """The profiles of every range of `size` consecutive sentences.
+
+        Parameters
+        ----------
+        size : int
+            Number of sentences in a window.
+        step : int, optional
+            Number of sentences between the starts of two windows. The default
+            is 1.
+
+        Returns
+        -------
+        Iterator[tuple[int, int, TextProfile]]
+            For every window, the indices of its first sentence and of the
+            sentence after its last one, and its profile. Texts with fewer
+            than `size` sentences have a single window.
+
+        Raises
+        ------
+        ValueError
+            If `size` or `step` are not positive.
+
+        """
+        if size < 1 or step < 1:
+            raise ValueError("size and step must be positive")
+        n_sentences = len(self)
+        return (
+            (start, min(start + size, n_sentences), self.profile(start, start + size))
+            for start in range(0, max(n_sentences - size, 0) + 1, step)
+        )
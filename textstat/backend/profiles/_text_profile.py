@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import zip_longest
+from typing import Any
+
+from .. import formulas
+from ..utils._get_lang_cfg import get_lang_cfg
+from ..utils.constants import ARABIC_LONG_VOWELS, ARABIC_SHORT_VOWELS
+from ._get_linsear_window import get_linsear_window
+
+# Counts of the concatenation of texts that are the sum of their counts
+ADDITIVE_FIELDS = (
+    "chars",
+    "chars_with_spaces",
+    "letters",
+    "words",
+    "raw_words",
+    "sentence_segments",
+    "short_segments",
+    "syllables",
+    "complex_arabic_words",
+    "arabic_long_words",
+    "arabic_short_syllables",
+    "arabic_long_syllables",
+    "arabic_stress_syllables",
+    "arabic_fallback_chars",
+    "faseeh",
+)
+HISTOGRAM_FIELDS = (
+    "syllable_histogram",
+    "difficult_histogram",
+    "length_histogram",
+)
+# Fields that are None for languages without syllable counts
+SYLLABLE_FIELDS = ("syllables", "syllable_histogram", "difficult_histogram")
+
+
+@dataclass(frozen=True)
+class TextProfile:
+    """The counts every readability metric is derived from, gathered in a single
+    pass over a text (see `profiles.get_text_profile`).
+
+    The methods mirror the functions in `backend.counts` and `backend.metrics`
+    and return the same values, but only apply the `backend.formulas` to the
+    stored counts.
+    Profiles of consecutive parts of a text can be merged, with `merge` or
+    `+`, into the profile of the whole text, and they can be pickled, so the
+    parts of a corpus can be profiled on different machines.
+
+    Attributes
+    ----------
+    lang : str
+        The language the syllable and difficult word counts were made for.
+    chars : int
+        Number of characters, ignoring whitespace.
+    chars_with_spaces : int
+        Number of characters, including whitespace.
+    letters : int
+        Number of letters, as counted by `counts.count_letters`.
+    words : int
+        Number of words, as counted by `counts.count_words`.
+    raw_words : int
+        Number of whitespace separated tokens, punctuation-only tokens included.
+    sentence_segments : int
+        Number of sentence candidates found in the text.
+    short_segments : int
+        Number of sentence candidates with two words or less, which are not
+        counted as sentences.
+    syllables : int or None
+        Number of syllables, as counted by `counts.count_syllables`. The
+        syllable counts are None for languages pyphen has no dictionary for
+        (see `utils.has_pyphen`), and the methods that need them raise a
+        KeyError like the functions they mirror.
+    syllable_histogram : tuple[int, ...] or None
+        Number of words with `i` syllables at index `i`.
+    difficult_histogram : tuple[int, ...] or None
+        Number of words that are not in the easy word list with `i` syllables
+        at index `i`.
+    length_histogram : tuple[int, ...]
+        Number of words (apostrophes removed) with `i` letters at index `i`.
+    linsear_words : int
+        Number of words in the window used by `metrics.linsear_write_formula`
+        with `strict_upper=True`.
+    linsear_easy_words : int or None
+        Number of words with one or two syllables in that window.
+    linsear_difficult_words : int or None
+        Number of words with three or more syllables in that window.
+    linsear_sentences : int
+        Number of sentences in that window.
+    linsear_head : tuple[str, ...]
+        The whitespace separated tokens up to the end of that window, which
+        are needed to find the window of concatenated texts.
+    complex_arabic_words : int
+        Number of complex arabic words.
+    arabic_long_words : int
+        Number of long arabic words.
+    arabic_short_syllables : int
+        Number of short arabic syllables.
+    arabic_long_syllables : int
+        Number of long arabic syllables.
+    arabic_stress_syllables : int
+        Number of stressed arabic syllables.
+    arabic_fallback_chars : int
+        Number of characters that `counts.count_arabic_syllables` counts
+        instead of syllables when there are no short syllables.
+    arabic_edges : str
+        The first and last characters of the words, without spaces, which
+        decide whether a short syllable becomes long when texts are
+        concatenated.
+    faseeh : int
+        Number of faseeh.
+    """
+
+    lang: str
+    chars: int
+    chars_with_spaces: int
+    letters: int
+    words: int
+    raw_words: int
+    sentence_segments: int
+    short_segments: int
+    syllables: int | None
+    syllable_histogram: tuple[int, ...] | None
+    difficult_histogram: tuple[int, ...] | None
+    length_histogram: tuple[int, ...]
+    linsear_words: int
+    linsear_easy_words: int | None
+    linsear_difficult_words: int | None
+    linsear_sentences: int
+    linsear_head: tuple[str, ...]
+    complex_arabic_words: int
+    arabic_long_words: int
+    arabic_short_syllables: int
+    arabic_long_syllables: int
+    arabic_stress_syllables: int
+    arabic_fallback_chars: int
+    arabic_edges: str
+    faseeh: int
+
+    @property
+    def sentences(self) -> int:
+        """Number of sentences, as counted by `counts.count_sentences`."""
+        if self.chars_with_spaces == 0:
+            return 0
+        return max(1, self.sentence_segments - self.short_segments)
+
+    @property
+    def arabic_syllables(self) -> int:
+        """Number of arabic syllables, as counted by
+        `counts.count_arabic_syllables`.
+        """
+        short_syllables = self.arabic_short_syllables
+        if short_syllables == 0:
+            short_syllables = self.arabic_fallback_chars - 2
+        return short_syllables + 2 * (
+            self.arabic_long_syllables + self.arabic_stress_syllables
+        )
+
+    def merge(self, *others: TextProfile) -> TextProfile:
+        """Combine this profile with the profiles of the next parts of a text.
+
+        The parts must be cut after the whitespace that follows the end of a
+        sentence, so that no word or sentence is split, in which case the
+        result is the same as the profile of the concatenated parts. Parts
+        cut elsewhere between two words only change the sentence counts.
+        Independent documents are merged as if each of them ended with a
+        complete sentence.
+
+        Parameters
+        ----------
+        *others : TextProfile
+            The profiles of the next parts of the text, in order.
+
+        Returns
+        -------
+        TextProfile
+            The profile of the whole text.
+
+        Raises
+        ------
+        ValueError
+            If the profiles are for different languages.
+
+        """
+        merged = self
+        for other in others:
+            merged = merged.__merge(other)
+        return merged
+
+    def __merge(self, other: TextProfile) -> TextProfile:
+        if self.lang != other.lang:
+            raise ValueError(
+                f"Cannot merge profiles of different languages: {self.lang} and "
+                f"{other.lang}"
+            )
+        fields: dict[str, Any] = {}
+        for name in ADDITIVE_FIELDS + HISTOGRAM_FIELDS:
+            first, second = getattr(self, name), getattr(other, name)
+            if first is None or second is None:
+                # Syllable counts, missing for the language
+                fields[name] = None
+            elif name in HISTOGRAM_FIELDS:
+                fields[name] = tuple(
+                    a + b for a, b in zip_longest(first, second, fillvalue=0)
+                )
+            else:
+                fields[name] = first + second
+
+        # A short vowel at the end of the first text is long if the second
+        # text starts with an alef, a waw or a yaa
+        if (
+            self.arabic_edges[-1:] in ARABIC_SHORT_VOWELS
+            and other.arabic_edges[:1] in ARABIC_LONG_VOWELS
+        ):
+            fields["arabic_short_syllables"] -= 1
+            fields["arabic_long_syllables"] += 1
+        edges = self.arabic_edges + other.arabic_edges
+        fields["arabic_edges"] = edges[:1] + edges[-1:]
+
+        # The head of the first text ends with its window, if it is full
+        head = self.linsear_head
+        if self.raw_words <= 100 or self.linsear_words < 100:
+            head += other.linsear_head
+        fields.update(
+            get_linsear_window(
+                head,
+                fields["raw_words"],
+                self.lang,
+                fields["words"],
+                fields["syllable_histogram"],
+                fields["sentence_segments"] - fields["short_segments"],
+            )
+        )
+
+        return TextProfile(lang=self.lang, **fields)
+
+    def __add__(self, other: TextProfile) -> TextProfile:
+        if not isinstance(other, TextProfile):
+            return NotImplemented
+        return self.merge(other)
+
+    def __radd__(self, other: object) -> TextProfile:
+        # The start value of `sum`
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __require_syllables(self) -> None:
+        if self.syllables is None:
+            raise KeyError(
+                f"Syllables can't be counted for {self.lang}, pyphen has no "
+                "dictionary for it"
+            )
+
+    # Counts
+
+    def count_chars(self, ignore_spaces: bool = True) -> int:
+        """See `counts.count_chars`."""
+        return self.chars if ignore_spaces else self.chars_with_spaces
+
+    def count_letters(self) -> int:
+        """See `counts.count_letters`."""
+        return self.letters
+
+    def count_words(self, rm_punctuation: bool = True) -> int:
+        """See `counts.count_words`."""
+        return self.words if rm_punctuation else self.raw_words
+
+    def count_sentences(self) -> int:
+        """See `counts.count_sentences`."""
+        return self.sentences
+
+    def count_syllables(self) -> int:
+        """See `counts.count_syllables`."""
+        self.__require_syllables()
+        return self.syllables
+
+    def count_polysyllable_words(self) -> int:
+        """See `counts.count_polysyllable_words`."""
+        self.__require_syllables()
+        return sum(self.syllable_histogram[3:])
+
+    def count_monosyllable_words(self) -> int:
+        """See `counts.count_monosyllable_words`."""
+        self.__require_syllables()
+        return sum(self.syllable_histogram[1:2])
+
+    def count_long_words(self, threshold: int = 6) -> int:
+        """See `counts.count_long_words`."""
+        return sum(self.length_histogram[threshold + 1:])
+
+    def count_miniwords(self, max_size: int = 3) -> int:
+        """See `counts.count_miniwords`."""
+        return sum(self.length_histogram[: max_size + 1])
+
+    def count_difficult_words(
+        self, syllable_threshold: int = 2, unique: bool = False
+    ) -> int:
+        """See `counts.count_difficult_words`. Only non-unique counts are
+        available from a profile, `unique=True` raises a ValueError.
+        """
+        if unique:
+            raise ValueError(
+                "Unique difficult words can't be counted from a TextProfile, "
+                "use counts.count_difficult_words on the text"
+            )
+        self.__require_syllables()
+        return sum(self.difficult_histogram[max(0, syllable_threshold):])
+
+    def count_complex_arabic_words(self) -> int:
+        """See `counts.count_complex_arabic_words`."""
+        return self.complex_arabic_words
+
+    def count_arabic_long_words(self) -> int:
+        """See `counts.count_arabic_long_words`."""
+        return self.arabic_long_words
+
+    def count_arabic_syllables(self) -> int:
+        """See `counts.count_arabic_syllables`."""
+        return self.arabic_syllables
+
+    def count_faseeh(self) -> int:
+        """See `counts.count_faseeh`."""
+        return self.faseeh
+
+    # Metrics
+
+    def chars_per_word(self, ignore_spaces: bool = True) -> float:
+        """See `metrics.chars_per_word`."""
+        return formulas.chars_per_word(self.count_chars(ignore_spaces), self.raw_words)
+
+    def letters_per_word(self) -> float:
+        """See `metrics.letters_per_word`."""
+        return formulas.letters_per_word(self.letters, self.words)
+
+    def sentences_per_word(self) -> float:
+        """See `metrics.sentences_per_word`."""
+        return formulas.sentences_per_word(self.sentences, self.words)
+
+    def syllables_per_word(self) -> float:
+        """See `metrics.syllables_per_word`."""
+        return formulas.syllables_per_word(self.count_syllables(), self.words)
+
+    def words_per_sentence(self) -> float:
+        """See `metrics.words_per_sentence`."""
+        return formulas.words_per_sentence(self.words, self.sentences)
+
+    def automated_readability_index(self) -> float:
+        """See `metrics.automated_readability_index`."""
+        return formulas.automated_readability_index(
+            self.chars, self.raw_words, self.words, self.sentences
+        )
+
+    def coleman_liau_index(self) -> float:
+        """See `metrics.coleman_liau_index`."""
+        return formulas.coleman_liau_index(self.letters, self.words, self.sentences)
+
+    def crawford(self) -> float:
+        """See `metrics.crawford`."""
+        return formulas.crawford(self.sentences, self.words, self.count_syllables())
+
+    def dale_chall_readability_score(self) -> float:
+        """See `metrics.dale_chall_readability_score`."""
+        return formulas.dale_chall_readability_score(
+            self.words,
+            self.sentences,
+            self.count_difficult_words(syllable_threshold=0),
+        )
+
+    def dale_chall_readability_score_v2(self) -> float:
+        """See `metrics.dale_chall_readability_score_v2`."""
+        return formulas.dale_chall_readability_score_v2(
+            self.words, self.sentences, self.count_difficult_words()
+        )
+
+    def fernandez_huerta(self) -> float:
+        """See `metrics.fernandez_huerta`."""
+        return formulas.fernandez_huerta(
+            self.words, self.sentences, self.count_syllables()
+        )
+
+    def flesch_kincaid_grade(self) -> float:
+        """See `metrics.flesch_kincaid_grade`."""
+        return formulas.flesch_kincaid_grade(
+            self.words, self.sentences, self.count_syllables()
+        )
+
+    def flesch_reading_ease(self) -> float:
+        """See `metrics.flesch_reading_ease`."""
+        return formulas.flesch_reading_ease(
+            self.words, self.sentences, self.count_syllables(), self.lang
+        )
+
+    def gulpease_index(self) -> float:
+        """See `metrics.gulpease_index`."""
+        return formulas.gulpease_index(
+            self.sentences, self.words, self.chars, self.raw_words
+        )
+
+    def gunning_fog(self) -> float:
+        """See `metrics.gunning_fog`."""
+        syllable_threshold = int(get_lang_cfg(self.lang, "syllable_threshold"))
+        return formulas.gunning_fog(
+            self.words, self.sentences, self.count_difficult_words(syllable_threshold)
+        )
+
+    def gutierrez_polini(self) -> float:
+        """See `metrics.gutierrez_polini`."""
+        return formulas.gutierrez_polini(self.letters, self.words, self.sentences)
+
+    def linsear_write_formula(
+        self, strict_lower: bool = False, strict_upper: bool = True
+    ) -> float:
+        """See `metrics.linsear_write_formula`."""
+        self.__require_syllables()
+        if strict_upper:
+            return formulas.linsear_write_formula(
+                self.linsear_words,
+                self.linsear_easy_words,
+                self.linsear_difficult_words,
+                self.linsear_sentences,
+                strict_lower,
+            )
+        return formulas.linsear_write_formula(
+            self.words,
+            sum(self.syllable_histogram[1:3]),
+            sum(self.syllable_histogram[3:]),
+            self.sentences if self.raw_words else 0,
+            strict_lower,
+        )
+
+    def lix(self) -> float:
+        """See `metrics.lix`."""
+        return formulas.lix(self.words, self.sentences, self.count_long_words())
+
+    def mcalpine_eflaw(self) -> float:
+        """See `metrics.mcalpine_eflaw`."""
+        return formulas.mcalpine_eflaw(
+            self.words, self.count_miniwords(max_size=3), self.sentences
+        )
+
+    def osman(self) -> float:
+        """See `metrics.osman`."""
+        return formulas.osman(
+            self.words,
+            self.sentences,
+            self.complex_arabic_words,
+            self.arabic_long_words,
+            self.arabic_syllables,
+            self.faseeh,
+        )
+
+    def reading_time(self, ms_per_char: float = 14.69) -> float:
+        """See `metrics.reading_time`."""
+        return formulas.reading_time(self.chars, ms_per_char)
+
+    def rix(self) -> float:
+        """See `metrics.rix`."""
+        return formulas.rix(self.count_long_words(), self.sentences)
+
+    def smog_index(self) -> float:
+        """See `metrics.smog_index`."""
+        return formulas.smog_index(self.count_polysyllable_words(), self.sentences)
+
+    def spache_readability(self) -> float:
+        """See `metrics.spache_readability`."""
+        return formulas.spache_readability(
+            self.words, self.sentences, self.count_difficult_words()
+        )
+
+    def szigriszt_pazos(self) -> float:
+        """See `metrics.szigriszt_pazos`."""
+        return formulas.szigriszt_pazos(
+            self.words, self.sentences, self.count_syllables(), self.lang
+        )
+
+    def text_standard(self) -> float:
+        """See `metrics.text_standard`."""
+        return formulas.readability_consensus(
+            self.flesch_kincaid_grade(),
+            self.flesch_reading_ease(),
+            self.smog_index(),
+            self.coleman_liau_index(),
+            self.automated_readability_index(),
+            self.dale_chall_readability_score(),
+            self.linsear_write_formula(strict_lower=False, strict_upper=True),
+            self.gunning_fog(),
+        )
+
+    def wiener_sachtextformel(self, variant: int) -> float:
+        """See `metrics.wiener_sachtextformel`."""
+        return formulas.wiener_sachtextformel(
+            self.words,
+            self.sentences,
+            self.count_polysyllable_words(),
+            self.count_long_words(),
+            self.count_monosyllable_words(),
+            variant,
+        )
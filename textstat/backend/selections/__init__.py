@@ -1,3 +1,5 @@
+# counts imports this subpackage, it must be initialized first
+from .. import counts  # noqa: F401
 from ._list_difficult_words import list_difficult_words
 from ._set_difficult_words import set_difficult_words
 from ._list_words import list_words
@@ -27,7 +27,9 @@ def list_difficult_words(text: str, syllable_threshold: int, lang: str) -> list[
 
     """
     words = list_words(text)
-    diff_words = [
-        word for word in words if is_difficult_word(word, syllable_threshold, lang)
-    ]
+    # Look up each distinct word once
+    verdicts = {
+        word: is_difficult_word(word, syllable_threshold, lang) for word in set(words)
+    }
+    diff_words = [word for word in words if verdicts[word]]
     return diff_words
@@ -3,7 +3,11 @@ from __future__ import annotations
 import re
 
 from ..utils._typed_cache import typed_cache
-from ..utils.constants import RE_NONCONTRACTION_APOSTROPHE
+from ..utils.constants import (
+    RE_NONCONTRACTION_APOSTROPHE,
+    RE_PUNCTUATION,
+    RE_PUNCTUATION_EXCEPT_APOSTROPHE,
+)
 
 
 @typed_cache
@@ -32,12 +36,12 @@ def remove_punctuation(
     """
     if rm_apostrophe:
         # remove all punctuation
-        punctuation_regex = r"[^\w\s]"
+        punctuation_regex = RE_PUNCTUATION
     else:
         # remove non-apostrophe single quotation marks
         text = re.sub(RE_NONCONTRACTION_APOSTROPHE, "", text)
         # remove all punctuation except apostrophes
-        punctuation_regex = r"[^\w\s\']"
+        punctuation_regex = RE_PUNCTUATION_EXCEPT_APOSTROPHE
 
     text = re.sub(punctuation_regex, "", text)
     return text
@@ -1,19 +1,47 @@
+from ._build_syllable_table import build_syllable_table
+from ._configure_cmudict import configure_cmudict
 from ._get_cmudict import get_cmudict
 from ._get_grade_suffix import get_grade_suffix
 from ._get_lang_cfg import get_lang_cfg
 from ._get_lang_easy_words import get_lang_easy_words
 from ._get_lang_root import get_lang_root
+from ._get_metric_specs import get_metric_specs
+from ._get_numpy import get_numpy
 from ._get_pyphen import get_pyphen
+from ._get_syllable_store import get_syllable_store
+from ._get_syllable_table import get_syllable_table
+from ._has_pyphen import has_pyphen
+from ._open_syllable_table import open_syllable_table
+from ._resource_cache import resource_cache
+from ._set_syllable_store import set_syllable_store
+from ._set_syllable_table_dir import set_syllable_table_dir
+from ._syllable_store import SyllableStore
+from ._syllable_table import SyllableTable
 from ._typed_cache import typed_cache
+from ._word_cache import word_cache
 from . import constants
 
 __all__ = [
+    "build_syllable_table",
+    "configure_cmudict",
     "get_cmudict",
     "get_grade_suffix",
     "get_lang_cfg",
     "get_lang_easy_words",
     "get_lang_root",
+    "get_metric_specs",
+    "get_numpy",
     "get_pyphen",
+    "get_syllable_store",
+    "get_syllable_table",
+    "has_pyphen",
+    "open_syllable_table",
+    "resource_cache",
+    "set_syllable_store",
+    "set_syllable_table_dir",
     "typed_cache",
+    "word_cache",
+    "SyllableStore",
+    "SyllableTable",
     "constants",
 ]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+from typing import Iterable
+
+from ._get_cmudict import get_cmudict
+from ._syllable_store import SyllableStore
+from ._syllable_table import SyllableTable
+
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+
+def _read_cmudict(lang: str) -> dict[str, int]:
+    cmudict = get_cmudict(lang)
+    if cmudict is None:
+        raise ValueError(f"There is no pronunciation dictionary for {lang}")
+    return {
+        word: sum(1 for p in phones[0] if p[-1].isdigit())
+        for word, phones in cmudict.items()
+        if phones
+    }
+
+
+def _read_word_list(path: str, lang: str) -> dict[str, int]:
+    # Imported here, counts depend on utils
+    from ..counts._count_word_syllables import count_word_syllables
+
+    with open(path, encoding="utf-8") as f:
+        words = {line.strip().lower() for line in f}
+    words.discard("")
+    return {word: count_word_syllables(word, lang) for word in words}
+
+
+def build_syllable_table(
+    path: str | os.PathLike[str],
+    lang: str = "en_US",
+    sources: Iterable[str | os.PathLike[str]] = ("cmudict",),
+) -> int:
+    """Generate a syllable table, see `SyllableTable`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Where to write the table.
+    lang : str, optional
+        The language of the table.
+    sources : Iterable, optional
+        Where to take the words from, in order of precedence:
+
+        - "cmudict": the stressed phonemes of the first pronunciation of every
+          word in cmudict (English only).
+        - the path of a syllable store (see `SyllableStore`): its counts for
+          `lang`.
+        - the path of any other file: a word list, one word per line, counted
+          the way `counts.count_word_syllables` does.
+
+    Returns
+    -------
+    int
+        Number of words in the table.
+
+    Raises
+    ------
+    ValueError
+        If cmudict is a source but there is no pronunciation dictionary for
+        the language.
+
+    """
+    counts: dict[str, int] = {}
+    for source in sources:
+        if source == "cmudict":
+            source_counts = _read_cmudict(lang)
+        else:
+            source = os.fspath(source)
+            with open(source, "rb") as f:
+                is_store = f.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+            if is_store:
+                store = SyllableStore(source)
+                source_counts = store.counts(lang)
+                store.close()
+            else:
+                source_counts = _read_word_list(source, lang)
+        for word, count in source_counts.items():
+            counts.setdefault(word, count)
+
+    with open(path, "wb") as f:
+        f.write(SyllableTable.build(counts))
+    return len(counts)
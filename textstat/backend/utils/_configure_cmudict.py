@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+
+from ._get_cmudict import _CMUDICT_OPTIONS, get_cmudict
+
+
+def configure_cmudict(
+    offline: bool | None = None, data_path: str | os.PathLike[str] | None = None
+) -> None:
+    """Configure how `get_cmudict` finds the nltk cmudict corpus.
+
+    The defaults are read from the `TEXTSTAT_OFFLINE` and `TEXTSTAT_NLTK_DATA`
+    environment variables. Syllable counts of English words come from the
+    syllable table shipped with textstat, so the corpus is only needed to
+    rebuild that table, or for direct calls to `get_cmudict`.
+
+    Parameters
+    ----------
+    offline : bool or None, optional
+        Never download the corpus, and raise a LookupError when it is missing
+        instead. Unchanged if None.
+    data_path : str, os.PathLike or None, optional
+        Directory searched first for the corpus, and where it is downloaded.
+        Unchanged if None.
+
+    """
+    if offline is not None:
+        _CMUDICT_OPTIONS["offline"] = offline
+    if data_path is not None:
+        _CMUDICT_OPTIONS["data_path"] = os.fspath(data_path)
+    get_cmudict.cache_clear()  # type: ignore
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-import nltk
-from ._typed_cache import typed_cache
+import os
+
+from .constants import CMUDICT_DATA_PATH_ENV, CMUDICT_OFFLINE_ENV
+from ._resource_cache import resource_cache
 from ._get_lang_root import get_lang_root
 
+_CMUDICT_OPTIONS: dict[str, bool | str | None] = {
+    "offline": os.environ.get(CMUDICT_OFFLINE_ENV, "").lower()
+    not in ("", "0", "false", "no"),
+    "data_path": os.environ.get(CMUDICT_DATA_PATH_ENV) or None,
+}
+
 
-@typed_cache
+@resource_cache
 def get_cmudict(lang: str) -> dict[str, list[list[str]]] | None:
     """Get a cmudict object for the given language. Currently only English is supported.
+
+    nltk is only imported on the first call for English. The corpus is
+    downloaded if it is missing, unless offline mode is on (see
+    `configure_cmudict`).
+
     Parameters
     ----------
     lang : str
@@ -17,12 +30,29 @@ def get_cmudict(lang: str) -> dict[str, list[list[str]]] | None:
     dict[str, list[list[str]]] | None
         A cmudict object for the given language (or None if the language is not
         supported).
+
+    Raises
+    ------
+    LookupError
+        If the corpus is missing in offline mode.
     """
-    if get_lang_root(lang) == "en":
-        try:
-            nltk.data.find("corpora/cmudict")
-        except LookupError:
-            nltk.download('cmudict', quiet=True)
-        return nltk.corpus.cmudict.dict()
-    else:
+    if get_lang_root(lang) != "en":
         return None
+
+    # Importing nltk takes most of the time of importing textstat
+    import nltk
+
+    data_path = _CMUDICT_OPTIONS["data_path"]
+    if data_path is not None and data_path not in nltk.data.path:
+        nltk.data.path.insert(0, data_path)
+    try:
+        nltk.data.find("corpora/cmudict")
+    except LookupError:
+        if _CMUDICT_OPTIONS["offline"]:
+            raise LookupError(
+                "The nltk cmudict corpus is not installed and textstat is in "
+                "offline mode. Install it with nltk.download('cmudict'), or set "
+                "its location with utils.configure_cmudict(data_path=...)."
+            ) from None
+        nltk.download("cmudict", download_dir=data_path, quiet=True)
+    return nltk.corpus.cmudict.dict()
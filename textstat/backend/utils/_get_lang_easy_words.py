@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 
-from ._typed_cache import typed_cache
+from ._resource_cache import resource_cache
 from ._get_lang_root import get_lang_root
 import sys
 
@@ -28,7 +28,7 @@ else:
             return {ln.strip() for ln in f}
 
 
-@typed_cache
+@resource_cache
 def get_lang_easy_words(lang: str) -> set[str]:
     """Get the easy words for a given language. If the language is not supported,
     the easy words for english are returned.
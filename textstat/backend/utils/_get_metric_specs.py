@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping
+
+
+def get_metric_specs(
+    metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Normalize a selection of metrics into (name, keyword arguments) pairs.
+
+    Metrics can be given as an iterable of names, which are computed with their
+    default arguments, or as a mapping from names to keyword arguments, e.g.
+    ``{"flesch_reading_ease": None, "wiener_sachtextformel": {"variant": 1}}``.
+
+    Parameters
+    ----------
+    metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+        The selected metrics.
+
+    Returns
+    -------
+    list[tuple[str, dict[str, Any]]]
+        The name and keyword arguments of every selected metric.
+    """
+    if isinstance(metrics, str):
+        raise TypeError("metrics must be an iterable of metric names, not a str")
+    if isinstance(metrics, Mapping):
+        return [(name, dict(kwargs or {})) for name, kwargs in metrics.items()]
+    return [(name, {}) for name in metrics]
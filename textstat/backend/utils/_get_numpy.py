@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from types import ModuleType
+
+# The numpy module, or None if it is not installed. Set on the first call
+_STATE: dict[str, ModuleType | None] = {}
+
+
+def get_numpy() -> ModuleType | None:
+    """Import NumPy, which is an optional dependency.
+
+    The import is only attempted on the first call, and its result, including
+    a failure, is kept for the later calls, which are dict lookups.
+
+    Returns
+    -------
+    ModuleType or None
+        The numpy module, or None if it is not installed.
+
+    """
+    if "numpy" not in _STATE:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _STATE["numpy"] = numpy
+    return _STATE["numpy"]
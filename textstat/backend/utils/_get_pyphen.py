@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from pyphen import Pyphen  # type: ignore
 
-from ._typed_cache import typed_cache
+from ._resource_cache import resource_cache
 
 
-@typed_cache
+@resource_cache
 def get_pyphen(lang: str) -> Pyphen:
     """Get a pyphen object for the given language.
 
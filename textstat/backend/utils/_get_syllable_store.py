@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import atexit
+import os
+
+from .constants import SYLLABLE_STORE_ENV
+from ._syllable_store import SyllableStore
+
+# The current store, if any. Loaded from the environment on first use
+_STATE: dict[str, SyllableStore | None] = {}
+
+
+def get_syllable_store() -> SyllableStore | None:
+    """Get the persistent syllable store used by `counts.count_word_syllables`.
+
+    Unless one was set with `set_syllable_store`, the store at the path in the
+    `TEXTSTAT_SYLLABLE_STORE` environment variable is used, if it is set.
+
+    Returns
+    -------
+    SyllableStore or None
+        The syllable store, or None if there is none.
+
+    """
+    if "store" not in _STATE:
+        path = os.environ.get(SYLLABLE_STORE_ENV)
+        store = SyllableStore(path) if path else None
+        if store is not None:
+            atexit.register(store.close)
+        _STATE["store"] = store
+    return _STATE["store"]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+
+from .constants import SYLLABLE_TABLE_DIR_ENV
+from ._get_lang_root import get_lang_root
+from ._open_syllable_table import open_syllable_table
+from ._resource_cache import resource_cache
+from ._syllable_table import SyllableTable
+
+# Directory searched for syllable tables before the shipped ones
+_SYLLABLE_TABLE_DIR: dict[str, str | None] = {
+    "path": os.environ.get(SYLLABLE_TABLE_DIR_ENV) or None
+}
+
+if sys.version_info < (3, 9):
+    import pkg_resources
+
+    def _load_table(lang_root: str) -> SyllableTable:
+        return SyllableTable(
+            pkg_resources.resource_string(
+                "textstat", f"resources/{lang_root}/syllables.bin"
+            )
+        )
+else:
+    import importlib.resources as importlib_resources
+
+    def _load_table(lang_root: str) -> SyllableTable:
+        ref = importlib_resources.files("textstat").joinpath(
+            f"resources/{lang_root}/syllables.bin"
+        )
+        if isinstance(ref, pathlib.Path):
+            return open_syllable_table(ref)
+        # e.g. installed as a zip file
+        return SyllableTable(ref.read_bytes())
+
+
+@resource_cache
+def get_syllable_table(lang: str) -> SyllableTable | None:
+    """Get the precomputed syllable counts for the given language.
+
+    The table is first searched for as `<lang>.bin`, then `<lang root>.bin`, in
+    the directory set with `set_syllable_table_dir` or the
+    `TEXTSTAT_SYLLABLE_TABLE_DIR` environment variable. Otherwise the table
+    shipped with textstat is used. Currently only English has one, with the
+    counts of the first pronunciation of every word in cmudict. Tables on disk
+    are memory-mapped, so processes share them.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    SyllableTable | None
+        The syllable counts (or None if the language has none).
+
+    """
+    lang_root = get_lang_root(lang)
+    directory = _SYLLABLE_TABLE_DIR["path"]
+    if directory is not None:
+        for name in dict.fromkeys([lang, lang_root]):
+            path = os.path.join(directory, f"{name}.bin")
+            if os.path.isfile(path):
+                return open_syllable_table(path)
+
+    try:
+        return _load_table(lang_root)
+    except FileNotFoundError:
+        return None
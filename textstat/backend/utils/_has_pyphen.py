@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pyphen import language_fallback  # type: ignore
+
+
+def has_pyphen(lang: str) -> bool:
+    """Whether pyphen has a dictionary for the given language.
+
+    Without one, `counts.count_word_syllables` raises a KeyError for words
+    that are not in a syllable table, so text profiles of the language have no
+    syllable counts (see `profiles.TextProfile`).
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    bool
+        True if `get_pyphen` can load a dictionary for `lang`.
+    """
+    return language_fallback(lang) is not None
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import mmap
+import os
+
+from ._syllable_table import SyllableTable
+
+
+def open_syllable_table(path: str | os.PathLike[str]) -> SyllableTable:
+    """Memory-map a syllable table file read-only.
+
+    The table is looked up in place, without being read into memory, so all
+    processes mapping the same file share its pages through the OS page cache.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of a table written by `build_syllable_table`.
+
+    Returns
+    -------
+    SyllableTable
+        The mapped table.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a syllable table.
+
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Not a syllable table: {os.fspath(path)} is empty")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return SyllableTable(data)  # type: ignore[arg-type]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Callable, TYPE_CHECKING
+
+from ..caches._cached import cached
+
+if TYPE_CHECKING:
+    from .constants import T, P
+
+
+def resource_cache(func: Callable[P, T]) -> Callable[P, T]:
+    """Decorator to cache loaded language resources without losing type info.
+
+    Language resources (dictionaries, hyphenators, word lists) are large and
+    expensive to load, so they are kept by language in the "resource" cache
+    group, an LRU of `CACHE_SIZE` entries apart from the document-level
+    results, which can't evict them. `caches.configure_cache` only changes it
+    when the group is named.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to cache.
+
+    Returns
+    -------
+    Callable
+        The cache-wrapped function.
+
+    """
+    return cached("resource")(func)
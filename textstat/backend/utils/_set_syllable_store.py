@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import atexit
+import os
+
+from .constants import SYLLABLE_STORE_BATCH_SIZE
+from ._get_syllable_store import _STATE
+from ._syllable_store import SyllableStore
+
+
+def set_syllable_store(
+    path: str | os.PathLike[str] | None,
+    batch_size: int = SYLLABLE_STORE_BATCH_SIZE,
+) -> SyllableStore | None:
+    """Use a persistent store for the syllable counts of words that are not in
+    the pronunciation dictionary, which are the slowest to count. Counts are
+    looked up in the store before being computed, and stored once computed, so
+    processes sharing a store only count each word once.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or None
+        Path of the SQLite database, created if it does not exist, or None to
+        stop using a store.
+    batch_size : int, optional
+        Number of new counts to collect before writing them.
+
+    Returns
+    -------
+    SyllableStore or None
+        The new syllable store.
+
+    """
+    previous = _STATE.get("store")
+    if previous is not None:
+        atexit.unregister(previous.close)
+        previous.close()
+
+    store = None if path is None else SyllableStore(path, batch_size)
+    if store is not None:
+        atexit.register(store.close)
+    _STATE["store"] = store
+    return store
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+
+from ..caches._reset_cache_info import reset_cache_info
+from ._get_syllable_table import _SYLLABLE_TABLE_DIR, get_syllable_table
+
+
+def set_syllable_table_dir(path: str | os.PathLike[str] | None) -> None:
+    """Set the directory searched first for syllable tables, see
+    `get_syllable_table`. Tables are built with `build_syllable_table` or
+    `python -m textstat build-syllable-table`. Cached syllable counts are
+    dropped.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or None
+        The directory, or None to only use the tables shipped with textstat.
+
+    """
+    _SYLLABLE_TABLE_DIR["path"] = None if path is None else os.fspath(path)
+    get_syllable_table.cache_clear()  # type: ignore
+    reset_cache_info("word", clear=True)
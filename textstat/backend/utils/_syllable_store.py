@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import warnings
+
+from .constants import SYLLABLE_STORE_BATCH_SIZE, SYLLABLE_STORE_TIMEOUT
+
+
+class SyllableStore:
+    """Persistent word to syllable count store, keyed by language, in a SQLite
+    database that any number of processes can share.
+
+    The database is opened in WAL mode so readers never block each other or
+    the writer. New counts are kept in memory and written in batches of
+    `batch_size`, and the rest when the store is flushed or closed. Every
+    process opens its own connection, also after a fork. A store that can't
+    be read or written is skipped with a warning.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of the database file, created if it does not exist.
+    batch_size : int, optional
+        Number of new counts to collect before writing them.
+    timeout : float, optional
+        Seconds to wait for another process holding the write lock.
+
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        batch_size: int = SYLLABLE_STORE_BATCH_SIZE,
+        timeout: float = SYLLABLE_STORE_TIMEOUT,
+    ):
+        self.path = os.fspath(path)
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._pending: dict[tuple[str, str], int] = {}
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        # Failed reads are only warned about once
+        self._read_failed = False
+
+    def get(self, lang: str, word: str) -> int | None:
+        """Get the stored syllable count of `word`, or None if it is unknown."""
+        with self._lock:
+            count = self._pending.get((lang, word))
+            if count is not None:
+                return count
+            try:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT count FROM syllables WHERE lang = ? AND word = ?",
+                        (lang, word),
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error as error:
+                # Counts are a cache, the word is counted again instead
+                if not self._read_failed:
+                    self._read_failed = True
+                    warnings.warn(
+                        f"Could not read from the syllable store {self.path}: "
+                        f"{error}",
+                        Warning,
+                    )
+                return None
+        return None if row is None else row[0]
+
+    def add(self, lang: str, word: str, count: int) -> None:
+        """Store the syllable count of `word`, in the next batch."""
+        with self._lock:
+            self._pending[(lang, word)] = count
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write the pending counts."""
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Write the pending counts and close the connection."""
+        with self._lock:
+            self._flush()
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def counts(self, lang: str) -> dict[str, int]:
+        """Get all stored syllable counts of a language."""
+        with self._lock:
+            self._flush()
+            rows = self._connect().execute(
+                "SELECT word, count FROM syllables WHERE lang = ?", (lang,)
+            )
+            return dict(rows.fetchall())
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            cursor = self._connect().execute("SELECT COUNT(*) FROM syllables")
+            return cursor.fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS syllables ("
+                "lang TEXT NOT NULL, word TEXT NOT NULL, count INTEGER NOT NULL, "
+                "PRIMARY KEY (lang, word)) WITHOUT ROWID"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        rows = [(lang, word, count) for (lang, word), count in self._pending.items()]
+        # Counts are a cache, a batch that can't be written is not retried
+        self._pending.clear()
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO syllables VALUES (?, ?, ?)", rows
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as error:
+            warnings.warn(
+                f"Could not write to the syllable store {self.path}: {error}",
+                Warning,
+            )
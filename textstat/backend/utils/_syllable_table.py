@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import struct
+from array import array
+import sys
+from typing import Iterable, Mapping
+
+_MAGIC = b"TSSYLL01"
+_HEADER = struct.Struct("<8sII")
+
+
+class SyllableTable:
+    """Compact, read-only mapping of words to syllable counts.
+
+    The words are stored as one sorted UTF-8 blob with an array of offsets
+    into it, and the counts as one byte per word, so a table takes a few bytes
+    per word and is looked up by binary search. The serialized layout is:
+
+    - header: magic number, number of words N and blob length (little-endian)
+    - N + 1 uint32 offsets of the words in the blob
+    - N uint8 syllable counts
+    - the blob of sorted words
+
+    Parameters
+    ----------
+    data : bytes-like
+        A serialized table, see `SyllableTable.build`. Any object supporting
+        the buffer protocol and slicing to bytes works, e.g. an mmap.
+
+    Raises
+    ------
+    ValueError
+        If `data` is not a serialized table.
+
+    """
+
+    def __init__(self, data: bytes):
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a syllable table: too short")
+        magic, n_words, blob_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a syllable table: bad magic number")
+        start = _HEADER.size
+        counts_start = start + 4 * (n_words + 1)
+        blob_start = counts_start + n_words
+        if len(data) != blob_start + blob_size:
+            raise ValueError("Not a syllable table: bad size")
+
+        view = memoryview(data)  # type: ignore[arg-type]
+        if sys.byteorder == "little":
+            self._offsets = view[start:counts_start].cast("I")
+        else:
+            offsets = array("I", view[start:counts_start].tobytes())
+            offsets.byteswap()
+            self._offsets = memoryview(offsets)
+        self._counts = view[counts_start:blob_start]
+        self._blob_start = blob_start
+        self._data = data
+        self._size = n_words
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.get(word) is not None
+
+    def _key(self, i: int) -> bytes:
+        start = self._blob_start
+        return self._data[start + self._offsets[i]:start + self._offsets[i + 1]]
+
+    def get(self, word: str) -> int | None:
+        """Get the syllable count of `word`, or None if it is not in the table."""
+        key = word.encode("utf-8", "surrogatepass")
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._size and self._key(lo) == key:
+            return self._counts[lo]
+        return None
+
+    def words(self) -> Iterable[str]:
+        """Iterate over the words in sorted order."""
+        for i in range(self._size):
+            yield self._key(i).decode("utf-8", "surrogatepass")
+
+    @staticmethod
+    def build(counts: Mapping[str, int]) -> bytes:
+        """Serialize a mapping of words to syllable counts.
+
+        Parameters
+        ----------
+        counts : Mapping[str, int]
+            Syllable counts by word, between 0 and 255.
+
+        Returns
+        -------
+        bytes
+            The serialized table.
+
+        Raises
+        ------
+        ValueError
+            If a count does not fit in a byte.
+
+        """
+        keys = sorted(word.encode("utf-8", "surrogatepass") for word in counts)
+        offsets = [0]
+        for key in keys:
+            offsets.append(offsets[-1] + len(key))
+        blob = b"".join(keys)
+        try:
+            packed_counts = bytes(
+                counts[key.decode("utf-8", "surrogatepass")] for key in keys
+            )
+        except ValueError:
+            raise ValueError("Syllable counts must be between 0 and 255") from None
+        return b"".join(
+            [
+                _HEADER.pack(_MAGIC, len(keys), len(blob)),
+                struct.pack(f"<{len(offsets)}I", *offsets),
+                packed_counts,
+                blob,
+            ]
+        )
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Callable, TYPE_CHECKING
 
-from .constants import CACHE_SIZE
+from ..caches._cached import cached
 
 if TYPE_CHECKING:
     from .constants import T, P
@@ -12,6 +11,11 @@ if TYPE_CHECKING:
 def typed_cache(func: Callable[P, T]) -> Callable[P, T]:
     """Decorator to cache function results without losing type info.
 
+    Results are stored in the "document" cache group, which is bounded by the
+    approximate size of the stored results. Long texts are keyed by a digest
+    of their content, and results for very long texts are never stored (see
+    `caches.configure_cache`).
+
     Parameters
     ----------
     func : Callable
@@ -23,4 +27,4 @@ def typed_cache(func: Callable[P, T]) -> Callable[P, T]:
         The cache-wrapped function.
 
     """
-    return lru_cache(maxsize=CACHE_SIZE)(func)  # type: ignore
+    return cached("document")(func)
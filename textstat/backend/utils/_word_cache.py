@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Callable, TYPE_CHECKING
+
+from ..caches._cached import cached
+
+if TYPE_CHECKING:
+    from .constants import T, P
+
+
+def word_cache(func: Callable[P, T]) -> Callable[P, T]:
+    """Decorator to cache the results of word-level functions without losing
+    type info.
+
+    Word-level results (e.g. syllable counts) are cheap to store and are looked
+    up for every word of every text, so they are stored in a separate and much
+    larger "word" cache group than the document-level functions decorated with
+    `typed_cache`.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to cache.
+
+    Returns
+    -------
+    Callable
+        The cache-wrapped function.
+
+    """
+    return cached("word")(func)
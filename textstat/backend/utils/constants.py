@@ -67,5 +67,63 @@ LANG_CONFIGS: dict[str, dict[str, float]] = {
 RE_CONTRACTION_ENDINGS = r"[tsd]|ve|ll|re"
 RE_CONTRACTION_APOSTROPHE = r"\'(?=" + RE_CONTRACTION_ENDINGS + ")"
 RE_NONCONTRACTION_APOSTROPHE = r"\'(?!" + RE_CONTRACTION_ENDINGS + ")"
+# Removed by `transformations.remove_punctuation`, with and without the
+# apostrophes of contractions
+RE_PUNCTUATION = r"[^\w\s]"
+RE_PUNCTUATION_EXCEPT_APOSTROPHE = r"[^\w\s\']"
+RE_SENTENCE = r"\b[^.!?]+[.!?]*"
+# Where a text can be cut without changing its sentences: after the whitespace
+# following the end of a sentence
+RE_SENTENCE_BOUNDARY = r"[.!?]\s+(?=\S)"
+RE_WORD_BOUNDARY = r"\s+(?=\S)"
+
+# fatha, damma and kasra, which make a long syllable when followed by an alef,
+# a waw or a yaa
+ARABIC_SHORT_VOWELS = frozenset("\u064e\u064f\u0650")
+ARABIC_LONG_VOWELS = frozenset("\u0627\u0648\u064a")
+
+STREAM_BLOCK_SIZE = 2**16
+STREAM_MAX_BUFFER_SIZE = 2**20
+ARROW_BATCH_SIZE = 2**10
 
 CACHE_SIZE = 128
+WORD_CACHE_SIZE = 2**16
+CACHE_MAX_BYTES = 64 * 2**20
+CACHE_MAX_TEXT_LENGTH = 2**20
+CACHE_DIGEST_MIN_LENGTH = 256
+
+# Default settings of each cache group, see `caches.configure_cache`
+CACHE_GROUPS: dict[str, dict[str, typing.Any]] = {
+    "document": {
+        "policy": "lru",
+        "maxsize": None,
+        "max_bytes": CACHE_MAX_BYTES,
+        "ttl": None,
+        "max_text_length": CACHE_MAX_TEXT_LENGTH,
+    },
+    "word": {
+        "policy": "lru",
+        "maxsize": WORD_CACHE_SIZE,
+        "max_bytes": None,
+        "ttl": None,
+        "max_text_length": None,
+    },
+    "resource": {
+        "policy": "lru",
+        "maxsize": CACHE_SIZE,
+        "max_bytes": None,
+        "ttl": None,
+        "max_text_length": None,
+    },
+}
+
+SYLLABLE_STORE_BATCH_SIZE = 1000
+SYLLABLE_STORE_TIMEOUT = 30.0
+# Path of the persistent syllable store used when none is set explicitly
+SYLLABLE_STORE_ENV = "TEXTSTAT_SYLLABLE_STORE"
+
+# Settings of `utils.get_cmudict`, see `utils.configure_cmudict`
+CMUDICT_OFFLINE_ENV = "TEXTSTAT_OFFLINE"
+CMUDICT_DATA_PATH_ENV = "TEXTSTAT_NLTK_DATA"
+# Directory of syllable tables named <lang>.bin, see `utils.get_syllable_table`
+SYLLABLE_TABLE_DIR_ENV = "TEXTSTAT_SYLLABLE_TABLE_DIR"
@@ -1,3 +1,5 @@
+# counts imports this subpackage, it must be initialized first
+from .. import counts  # noqa: F401
 from ._is_difficult_word import is_difficult_word
 
 __all__ = ["is_difficult_word"]
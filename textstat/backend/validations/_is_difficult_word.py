@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from ..utils._typed_cache import typed_cache
+import re
+
+from ..utils._word_cache import word_cache
 from ..utils._get_lang_easy_words import get_lang_easy_words
-from ..counts._count_syllables import count_syllables
+from ..utils.constants import (
+    RE_NONCONTRACTION_APOSTROPHE,
+    RE_PUNCTUATION_EXCEPT_APOSTROPHE,
+)
+from ..counts._count_word_syllables import count_word_syllables
 
 
-@typed_cache
+@word_cache
 def is_difficult_word(word: str, syllable_threshold: int, lang: str) -> bool:
     """Return True if `word` is a difficult word.
 
@@ -38,14 +44,18 @@ def is_difficult_word(word: str, syllable_threshold: int, lang: str) -> bool:
     easy_word_set = get_lang_easy_words(lang)
 
     # easy set is all lowercase
-    word = word.lower()
-
     # Not hard
-    if word in easy_word_set:
+    if word.lower() in easy_word_set:
         return False
 
+    # Normalize like `list_words(word, lowercase=True)`, with the patterns of
+    # `remove_punctuation`, but without adding the word to the document-level
+    # caches
+    word = re.sub(RE_NONCONTRACTION_APOSTROPHE, "", word)
+    word = re.sub(RE_PUNCTUATION_EXCEPT_APOSTROPHE, "", word).strip()
+
     # Too short
-    if count_syllables(word, lang) < syllable_threshold:
+    if count_word_syllables(word.lower(), lang) < syllable_threshold:
         return False
 
     return True
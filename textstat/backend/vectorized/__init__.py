@@ -0,0 +1,61 @@
+from ._automated_readability_index import automated_readability_index
+from ._chars_per_word import chars_per_word
+from ._coleman_liau_index import coleman_liau_index
+from ._crawford import crawford
+from ._dale_chall_readability_score import dale_chall_readability_score
+from ._dale_chall_readability_score_v2 import dale_chall_readability_score_v2
+from ._fernandez_huerta import fernandez_huerta
+from ._flesch_kincaid_grade import flesch_kincaid_grade
+from ._flesch_reading_ease import flesch_reading_ease
+from ._gulpease_index import gulpease_index
+from ._gunning_fog import gunning_fog
+from ._gutierrez_polini import gutierrez_polini
+from ._letters_per_word import letters_per_word
+from ._linsear_write_formula import linsear_write_formula
+from ._lix import lix
+from ._mcalpine_eflaw import mcalpine_eflaw
+from ._osman import osman
+from ._reading_time import reading_time
+from ._rix import rix
+from ._sentences_per_word import sentences_per_word
+from ._smog_index import smog_index
+from ._spache_readability import spache_readability
+from ._syllables_per_word import syllables_per_word
+from ._szigriszt_pazos import szigriszt_pazos
+from ._text_standard import text_standard
+from ._wiener_sachtextformel import wiener_sachtextformel
+from ._words_per_sentence import words_per_sentence
+from ._evaluate import evaluate
+from ._get_count_arrays import get_count_arrays
+
+__all__ = [
+    "automated_readability_index",
+    "chars_per_word",
+    "coleman_liau_index",
+    "crawford",
+    "dale_chall_readability_score",
+    "dale_chall_readability_score_v2",
+    "evaluate",
+    "fernandez_huerta",
+    "flesch_kincaid_grade",
+    "flesch_reading_ease",
+    "get_count_arrays",
+    "gulpease_index",
+    "gunning_fog",
+    "gutierrez_polini",
+    "letters_per_word",
+    "linsear_write_formula",
+    "lix",
+    "mcalpine_eflaw",
+    "osman",
+    "reading_time",
+    "rix",
+    "sentences_per_word",
+    "smog_index",
+    "spache_readability",
+    "syllables_per_word",
+    "szigriszt_pazos",
+    "text_standard",
+    "wiener_sachtextformel",
+    "words_per_sentence",
+]
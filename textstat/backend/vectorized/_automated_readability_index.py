@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+automated_readability_index = vectorize(formulas.automated_readability_index)
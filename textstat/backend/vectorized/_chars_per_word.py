@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+chars_per_word = vectorize(formulas.chars_per_word)
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+coleman_liau_index = vectorize(formulas.coleman_liau_index)
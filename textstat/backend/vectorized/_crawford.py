@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+crawford = vectorize(formulas.crawford)
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+dale_chall_readability_score = vectorize(formulas.dale_chall_readability_score)
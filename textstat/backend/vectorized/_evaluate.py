@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import inspect
+from typing import Any, Callable, Iterable, Mapping
+
+from ..utils._get_metric_specs import get_metric_specs
+from ._automated_readability_index import automated_readability_index
+from ._chars_per_word import chars_per_word
+from ._coleman_liau_index import coleman_liau_index
+from ._crawford import crawford
+from ._dale_chall_readability_score import dale_chall_readability_score
+from ._dale_chall_readability_score_v2 import dale_chall_readability_score_v2
+from ._fernandez_huerta import fernandez_huerta
+from ._flesch_kincaid_grade import flesch_kincaid_grade
+from ._flesch_reading_ease import flesch_reading_ease
+from ._gulpease_index import gulpease_index
+from ._gunning_fog import gunning_fog
+from ._gutierrez_polini import gutierrez_polini
+from ._letters_per_word import letters_per_word
+from ._linsear_write_formula import linsear_write_formula
+from ._lix import lix
+from ._mcalpine_eflaw import mcalpine_eflaw
+from ._osman import osman
+from ._reading_time import reading_time
+from ._rix import rix
+from ._sentences_per_word import sentences_per_word
+from ._smog_index import smog_index
+from ._spache_readability import spache_readability
+from ._syllables_per_word import syllables_per_word
+from ._szigriszt_pazos import szigriszt_pazos
+from ._text_standard import text_standard
+from ._wiener_sachtextformel import wiener_sachtextformel
+from ._words_per_sentence import words_per_sentence
+
+VECTORIZED_METRICS: dict[str, Callable[..., Any]] = {
+    func.__name__: func
+    for func in (
+        automated_readability_index,
+        chars_per_word,
+        coleman_liau_index,
+        crawford,
+        dale_chall_readability_score,
+        dale_chall_readability_score_v2,
+        fernandez_huerta,
+        flesch_kincaid_grade,
+        flesch_reading_ease,
+        gulpease_index,
+        gunning_fog,
+        gutierrez_polini,
+        letters_per_word,
+        linsear_write_formula,
+        lix,
+        mcalpine_eflaw,
+        osman,
+        reading_time,
+        rix,
+        sentences_per_word,
+        smog_index,
+        spache_readability,
+        syllables_per_word,
+        szigriszt_pazos,
+        text_standard,
+        wiener_sachtextformel,
+        words_per_sentence,
+    )
+}
+
+
+def evaluate(
+    counts: Mapping[str, Any],
+    metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+    lang: str = "en_US",
+) -> dict[str, Any]:
+    """Calculate several metrics for many texts at once from their counts.
+
+    Parameters
+    ----------
+    counts : Mapping[str, array_like]
+        The counts of the texts, by name, see `get_count_arrays`.
+    metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+        Names of functions from `backend.vectorized`. Use a mapping to pass
+        other arguments, e.g. ``{"wiener_sachtextformel": {"variant": 1}}``.
+    lang : str, optional
+        The language of the texts, for the metrics that depend on it. The
+        default is "en_US".
+
+    Returns
+    -------
+    dict[str, numpy.ndarray or list[float]]
+        The values of every requested metric, by name.
+
+    Raises
+    ------
+    ValueError
+        If a metric is unknown, or if one of the counts it needs is missing.
+
+    """
+    specs = get_metric_specs(metrics)
+    calls = []
+    for name, kwargs in specs:
+        if name not in VECTORIZED_METRICS:
+            raise ValueError(f"Unknown metric {name}")
+        func = VECTORIZED_METRICS[name]
+        arguments = dict(kwargs)
+        for param in inspect.signature(func).parameters.values():
+            if param.name in arguments:
+                continue
+            if param.name == "lang":
+                arguments["lang"] = lang
+            elif param.default is param.empty:
+                if param.name not in counts:
+                    raise ValueError(f"{name} needs the {param.name} counts")
+                arguments[param.name] = counts[param.name]
+        calls.append((name, func, arguments))
+    return {name: func(**arguments) for name, func, arguments in calls}
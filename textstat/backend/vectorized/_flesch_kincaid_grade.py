@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+flesch_kincaid_grade = vectorize(formulas.flesch_kincaid_grade)
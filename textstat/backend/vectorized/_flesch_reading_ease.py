@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+flesch_reading_ease = vectorize(formulas.flesch_reading_ease)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from ..profiles._text_profile import TextProfile
+from ..utils._get_lang_cfg import get_lang_cfg
+from ..utils._get_numpy import get_numpy
+
+# The counts that need the syllables of the words
+_SYLLABLE_COLUMNS = (
+    "syllables",
+    "polysyllable_words",
+    "monosyllable_words",
+    "difficult_words",
+    "dale_chall_difficult_words",
+    "gunning_fog_difficult_words",
+    "linsear_easy_words",
+    "linsear_difficult_words",
+)
+
+
+def get_count_arrays(profiles: Iterable[TextProfile]) -> dict[str, Any]:
+    """Gather the counts of several texts into one array per count, named
+    after the parameters of the vectorized metrics.
+
+    Parameters
+    ----------
+    profiles : Iterable[TextProfile]
+        The profiles of the texts, see `profiles.get_text_profile`.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray or list[int]]
+        The counts of every text, by name, in lists if NumPy is not installed.
+        The counts of the difficult words of `metrics.gunning_fog` are left
+        out if one of the languages has no syllable threshold, and the counts
+        that need syllables if one of the profiles has none (see
+        `utils.has_pyphen`).
+
+    """
+    profiles = list(profiles)
+    columns: dict[str, list[int]] = {
+        name: []
+        for name in (
+            "chars",
+            "letters",
+            "words",
+            "raw_words",
+            "sentences",
+            "syllables",
+            "polysyllable_words",
+            "monosyllable_words",
+            "long_words",
+            "miniwords",
+            "difficult_words",
+            "dale_chall_difficult_words",
+            "gunning_fog_difficult_words",
+            "linsear_words",
+            "linsear_easy_words",
+            "linsear_difficult_words",
+            "linsear_sentences",
+            "complex_arabic_words",
+            "arabic_long_words",
+            "arabic_syllables",
+            "faseeh",
+        )
+    }
+
+    thresholds: dict[str, int | None] = {}
+    for profile in profiles:
+        if profile.lang not in thresholds:
+            try:
+                thresholds[profile.lang] = int(
+                    get_lang_cfg(profile.lang, "syllable_threshold")
+                )
+            except ValueError:
+                thresholds[profile.lang] = None
+    if None in thresholds.values():
+        del columns["gunning_fog_difficult_words"]
+    if any(profile.syllables is None for profile in profiles):
+        for name in _SYLLABLE_COLUMNS:
+            columns.pop(name, None)
+
+    for profile in profiles:
+        for name, column in columns.items():
+            if name == "gunning_fog_difficult_words":
+                value = profile.count_difficult_words(thresholds[profile.lang])
+            elif name == "dale_chall_difficult_words":
+                value = profile.count_difficult_words(syllable_threshold=0)
+            elif name == "raw_words" or name.startswith("linsear_"):
+                value = getattr(profile, name)
+            else:
+                value = getattr(profile, f"count_{name}")()
+            column.append(value)
+
+    np = get_numpy()
+    if np is None:
+        return columns
+    return {name: np.asarray(column) for name, column in columns.items()}
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+linsear_write_formula = vectorize(formulas.linsear_write_formula)
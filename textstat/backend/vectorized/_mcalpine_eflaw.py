@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+mcalpine_eflaw = vectorize(formulas.mcalpine_eflaw)
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+szigriszt_pazos = vectorize(formulas.szigriszt_pazos)
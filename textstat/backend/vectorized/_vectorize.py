@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import inspect
+from functools import wraps
+from typing import Any, Callable
+
+from ..utils._get_numpy import get_numpy
+
+
+def vectorize(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Turn one of the `formulas`, written with the operations of
+    `formulas._ops`, into a function of count arrays.
+
+    The parameters of `func` without a default value are counts, and the
+    other ones are options that are the same for all the documents. With
+    NumPy, the counts are converted to float arrays and the formula is
+    evaluated once. Without it, the formula is evaluated for every document
+    and a list is returned.
+
+    Parameters
+    ----------
+    func : Callable
+        The formula.
+
+    Returns
+    -------
+    Callable
+        The vectorized formula.
+
+    """
+    signature = inspect.signature(func)
+    count_names = [
+        name
+        for name, param in signature.parameters.items()
+        if param.default is param.empty
+    ]
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        arguments = signature.bind(*args, **kwargs).arguments
+        counts = [arguments.pop(name) for name in count_names]
+
+        np = get_numpy()
+        if np is not None:
+            return func(*(np.asarray(c, dtype=float) for c in counts), **arguments)
+
+        columns = [
+            [float(c)] if isinstance(c, (int, float)) else [float(v) for v in c]
+            for c in counts
+        ]
+        size = max(map(len, columns), default=0)
+        columns = [column * size if len(column) == 1 else column for column in columns]
+        if any(len(column) != size for column in columns):
+            raise ValueError("The count arrays must have the same length")
+        return [func(*row, **arguments) for row in zip(*columns)]
+
+    return wrapper
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+wiener_sachtextformel = vectorize(formulas.wiener_sachtextformel)
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .. import formulas
+from ._vectorize import vectorize
+
+words_per_sentence = vectorize(formulas.words_per_sentence)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Any, NoReturn
+
+from .textstat import textstatistics
+
+
+class Engine(textstatistics):
+    """Immutable textstat configuration with all the textstat methods.
+
+    Unlike the shared `textstat` instance, an engine's settings are fixed when
+    it is created, so its methods can be called from many threads at once,
+    and engines for different languages can be used side by side. Creating an
+    engine is cheap: language resources are loaded and cached on first use
+    and shared by all engines.
+
+    Parameters
+    ----------
+    lang : str, optional
+        A locale ID. Default: "en_US"
+    rm_apostrophe : bool, optional
+        Whether to remove the apostrophe in contractions when removing
+        punctuation, see `textstatistics.set_rm_apostrophe`. Default: True
+    round_points : int or None, optional
+        The number of decimals to round outputs to, or None to not round them.
+        Default: None
+
+    Examples
+    --------
+    >>> es = Engine(lang="es_ES", rm_apostrophe=False)
+    >>> es.replace(round_points=2).lang
+    'es_ES'
+
+    """
+
+    def __init__(
+        self,
+        lang: str = "en_US",
+        rm_apostrophe: bool = True,
+        round_points: int | None = None,
+    ):
+        textstatistics.set_lang(self, lang)
+        textstatistics.set_rm_apostrophe(self, rm_apostrophe)
+        textstatistics.set_rounding_points(self, round_points)
+        self.__settings = (lang, rm_apostrophe, round_points)
+
+    @property
+    def lang(self) -> str:
+        """The locale ID of the texts."""
+        return self.__settings[0]
+
+    @property
+    def rm_apostrophe(self) -> bool:
+        """Whether apostrophes in contractions are removed with punctuation."""
+        return self.__settings[1]
+
+    @property
+    def round_points(self) -> int | None:
+        """The number of decimals outputs are rounded to, if any."""
+        return self.__settings[2]
+
+    def replace(self, **changes: Any) -> Engine:
+        """Get a new engine with some settings changed.
+
+        Parameters
+        ----------
+        **changes
+            New values of `lang`, `rm_apostrophe` or `round_points`.
+
+        Returns
+        -------
+        Engine
+            The new engine.
+
+        """
+        settings = {
+            "lang": self.lang,
+            "rm_apostrophe": self.rm_apostrophe,
+            "round_points": self.round_points,
+        }
+        unknown = set(changes) - set(settings)
+        if unknown:
+            raise TypeError(f"Unknown Engine settings: {', '.join(sorted(unknown))}")
+        return Engine(**{**settings, **changes})
+
+    def set_lang(self, lang: str) -> NoReturn:
+        raise AttributeError("Engine is immutable, use replace(lang=...) instead")
+
+    def set_rm_apostrophe(self, rm_apostrophe: bool) -> NoReturn:
+        raise AttributeError(
+            "Engine is immutable, use replace(rm_apostrophe=...) instead"
+        )
+
+    def set_rounding_points(self, points: int | None) -> NoReturn:
+        raise AttributeError(
+            "Engine is immutable, use replace(round_points=...) instead"
+        )
+
+    def set_rounding(self, rounding: bool, points: int | None = None) -> NoReturn:
+        raise AttributeError(
+            "Engine is immutable, use replace(round_points=...) instead"
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if "_Engine__settings" in self.__dict__:
+            raise AttributeError("Engine is immutable, use replace() instead")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Engine is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Engine):
+            return NotImplemented
+        return self.__settings == other.__settings
+
+    def __hash__(self) -> int:
+        return hash(self.__settings)
+
+    def __repr__(self) -> str:
+        return (
+            f"Engine(lang={self.lang!r}, rm_apostrophe={self.rm_apostrophe!r}, "
+            f"round_points={self.round_points!r})"
+        )
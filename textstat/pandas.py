@@ -0,0 +1,78 @@
+"""The `textstat` accessor of pandas Series, registered when this module is
+imported:
+
+>>> import textstat.pandas
+>>> df["body"].textstat.analyze(["flesch_reading_ease", "smog_index"])
+
+pandas is an optional dependency, it is not imported by `textstat` itself.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping
+
+import pandas as pd
+
+from .backend.utils import get_metric_specs
+from .textstat import textstat, textstatistics
+
+
+@pd.api.extensions.register_series_accessor("textstat")
+class TextstatAccessor:
+    """Readability metrics for a Series of texts.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        The texts. Missing values (None or NaN) are allowed.
+
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        self.__series = series
+
+    def analyze(
+        self,
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+        n_jobs: int | None = 1,
+        engine: textstatistics | None = None,
+    ) -> pd.DataFrame:
+        """Calculate several metrics for every text of the Series.
+
+        Each distinct text is scored once with `textstatistics.batch`, which
+        tokenizes and syllabifies it a single time for all the metrics.
+
+        Parameters
+        ----------
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `textstatistics.analyze`.
+        n_jobs : int or None, optional
+            Number of worker processes, all CPUs if None. Default: 1
+        engine : textstatistics or None, optional
+            The instance whose settings are used, e.g. an `Engine` for another
+            language. Default: the shared `textstat` instance.
+
+        Returns
+        -------
+        pandas.DataFrame
+            A column for every metric, with the index of the Series. The rows
+            of missing values are NaN.
+
+        Raises
+        ------
+        TypeError
+            If a value is neither a string nor missing.
+
+        """
+        if engine is None:
+            engine = textstat
+        codes, texts = pd.factorize(self.__series)
+        for text in texts:
+            if not isinstance(text, str):
+                raise TypeError(f"Expected str values, got {type(text).__name__}")
+
+        specs = dict(get_metric_specs(metrics))
+        results = engine.batch(list(texts), specs, n_jobs=n_jobs)
+        frame = pd.DataFrame.from_records(results, columns=list(specs))
+        # Missing values have the code -1, which is not in the index
+        return frame.reindex(codes).set_axis(self.__series.index)
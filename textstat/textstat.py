@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import functools
+import inspect
+import os
 import warnings
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping
 
-from .backend import transformations, validations, selections, counts, metrics, utils
+from . import backend
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 
 class textstatistics:
@@ -34,6 +41,55 @@ class textstatistics:
         Default: True
     """
 
+    # textstatistics methods that `analyze` derives from a TextProfile, with the
+    # profile method they correspond to and whether the result is rounded
+    __profile_methods = {
+        "char_count": ("count_chars", False),
+        "letter_count": ("count_letters", False),
+        "miniword_count": ("count_miniwords", False),
+        "syllable_count": ("count_syllables", False),
+        "sentence_count": ("count_sentences", False),
+        "polysyllabcount": ("count_polysyllable_words", False),
+        "monosyllabcount": ("count_monosyllable_words", False),
+        "long_word_count": ("count_long_words", False),
+        "count_complex_arabic_words": ("count_complex_arabic_words", False),
+        "count_arabic_syllables": ("count_arabic_syllables", False),
+        "count_faseeh": ("count_faseeh", False),
+        "count_arabic_long_words": ("count_arabic_long_words", False),
+        "avg_character_per_word": ("chars_per_word", True),
+        "avg_letter_per_word": ("letters_per_word", True),
+        "avg_sentence_per_word": ("sentences_per_word", True),
+        "words_per_sentence": ("words_per_sentence", True),
+        "flesch_reading_ease": ("flesch_reading_ease", True),
+        "flesch_kincaid_grade": ("flesch_kincaid_grade", True),
+        "smog_index": ("smog_index", True),
+        "coleman_liau_index": ("coleman_liau_index", True),
+        "automated_readability_index": ("automated_readability_index", True),
+        "linsear_write_formula": ("linsear_write_formula", True),
+        "dale_chall_readability_score": ("dale_chall_readability_score", True),
+        "dale_chall_readability_score_v2": ("dale_chall_readability_score_v2", True),
+        "gunning_fog": ("gunning_fog", True),
+        "lix": ("lix", True),
+        "rix": ("rix", True),
+        "reading_time": ("reading_time", True),
+        "fernandez_huerta": ("fernandez_huerta", True),
+        "szigriszt_pazos": ("szigriszt_pazos", True),
+        "gutierrez_polini": ("gutierrez_polini", True),
+        "crawford": ("crawford", True),
+        "osman": ("osman", True),
+        "gulpease_index": ("gulpease_index", True),
+        "wiener_sachtextformel": ("wiener_sachtextformel", True),
+        "mcalpine_eflaw": ("mcalpine_eflaw", True),
+    }
+    # textstatistics methods that `analyze` handles separately
+    __special_methods = (
+        "avg_syllables_per_word",
+        "difficult_words",
+        "lexicon_count",
+        "spache_readability",
+        "text_standard",
+    )
+
     __lang = "en_US"
     __easy_word_sets = {}
     __round_outputs = None
@@ -188,6 +244,393 @@ class textstatistics:
         """
         self.__lang = lang
 
+    def analyze(
+        self,
+        text: str,
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+    ) -> dict[str, Any]:
+        """Calculate several metrics for `text` at once.
+
+        The text is tokenized and syllabified a single time and the shared counts
+        are reused for every metric, which is much faster than calling the
+        methods one by one. The results are the same as calling the methods.
+        Unique difficult words (``"difficult_words"`` with its default
+        ``unique=True``) and split words are counted on the text itself, and so
+        are the metrics that need syllables in a language without a pyphen
+        dictionary.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            Names of textstat methods, e.g. ``["flesch_reading_ease", "smog_index"]``.
+            Use a mapping to pass other arguments than `text`, e.g.
+            ``{"wiener_sachtextformel": {"variant": 1}}``.
+
+        Returns
+        -------
+        dict[str, Any]
+            The result of every requested method, by name.
+
+        Raises
+        ------
+        ValueError
+            If a metric is unknown or if its arguments don't match the method.
+        KeyError
+            If a metric needs syllables that can't be counted in the language.
+
+        """
+        specs = self.__get_metric_specs(metrics)
+        profile = backend.profiles.get_text_profile(text, self.__lang)
+        return self.__analyze_profile(profile, specs, text)
+
+    def analyze_stream(
+        self,
+        chunks: Iterable[str],
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+    ) -> dict[str, Any]:
+        """Calculate several metrics for a text read piece by piece, e.g. from a
+        socket or a generator, without holding all of it in memory.
+
+        The pieces are buffered up to the end of the last complete sentence and
+        the counts of every block are added up, so the pieces can be cut
+        anywhere. The results are the same as calling `analyze` on the whole
+        text, except for sentences longer than about a million characters,
+        which are cut between two words.
+
+        Parameters
+        ----------
+        chunks : Iterable[str]
+            The pieces of the text, in order.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `evaluate`.
+
+        Returns
+        -------
+        dict[str, Any]
+            The result of every requested method, by name.
+
+        Raises
+        ------
+        ValueError
+            If a metric can't be calculated from the counts of the text.
+
+        """
+        specs = self.__get_profile_metric_specs(metrics)
+        profile = backend.profiles.get_stream_profile(chunks, self.__lang)
+        return self.__analyze_profile(profile, specs)
+
+    def analyze_file(
+        self,
+        path: str | os.PathLike[str],
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+        encoding: str | None = None,
+    ) -> dict[str, Any]:
+        """Calculate several metrics for a text file of any size, which is read
+        in blocks with `analyze_stream`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The path of the file.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `analyze_stream`.
+        encoding : str or None, optional
+            The encoding of the file. The default is `text_encoding`.
+
+        Returns
+        -------
+        dict[str, Any]
+            The result of every requested method, by name.
+
+        """
+        block_size = backend.utils.constants.STREAM_BLOCK_SIZE
+        with open(path, encoding=encoding or self.text_encoding) as file:
+            return self.analyze_stream(
+                iter(functools.partial(file.read, block_size), ""), metrics
+            )
+
+    def text_profile(self, text: str) -> backend.profiles.TextProfile:
+        """Count everything the metrics need in a text.
+
+        The counts can be merged with the counts of other parts of a text,
+        with `+`, and pickled, so a corpus can be split into shards that are
+        counted in different processes or on different machines, and scored
+        as a whole with `evaluate` without reading it again.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+
+        Returns
+        -------
+        profiles.TextProfile
+            The counts of `text`, for the language of this instance.
+
+        """
+        return backend.profiles.get_text_profile(text, self.__lang)
+
+    def evaluate(
+        self,
+        profile: backend.profiles.TextProfile,
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+    ) -> dict[str, Any]:
+        """Calculate several metrics from the counts of a text, see
+        `text_profile`.
+
+        The results are the same as calling `analyze` on the text, using the
+        language of the profile and the rounding of this instance.
+
+        Parameters
+        ----------
+        profile : profiles.TextProfile
+            The counts of a text, e.g. the sum of the counts of its parts.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `analyze`. Unique difficult words
+            and split words can't be counted without the text, so
+            ``"difficult_words"`` needs ``{"unique": False}`` and
+            ``"lexicon_count"`` can't split contractions or hyphens.
+
+        Returns
+        -------
+        dict[str, Any]
+            The result of every requested method, by name.
+
+        Raises
+        ------
+        ValueError
+            If a metric can't be calculated from the counts of a text.
+
+        """
+        specs = self.__get_profile_metric_specs(metrics)
+        return self.__analyze_profile(profile, specs)
+
+    def sentence_index(self, text: str) -> backend.profiles.SentenceIndex:
+        """Index the counts of every sentence of a text, so that the counts of
+        any range of sentences are found in constant time.
+
+        ``index.profile(start, stop)`` returns the counts of the sentences
+        from `start` to `stop`, which can be scored with `evaluate`, and
+        ``index.span(start, stop)`` their position in the text.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+
+        Returns
+        -------
+        profiles.SentenceIndex
+            The index of `text`, for the language of this instance.
+
+        """
+        return backend.profiles.get_sentence_index(text, self.__lang)
+
+    def sliding_windows(
+        self,
+        text: str,
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+        size: int,
+        step: int = 1,
+    ) -> Iterator[tuple[int, int, dict[str, Any]]]:
+        """Calculate several metrics for every `size` consecutive sentences of a
+        text, e.g. to chart its readability.
+
+        The counts of the windows are read from a `sentence_index`, so the
+        cost doesn't depend on `size`. The results are the same as calling
+        `analyze` on the slices of the text.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `evaluate`.
+        size : int
+            Number of sentences in a window.
+        step : int, optional
+            Number of sentences between the starts of two windows. The default
+            is 1.
+
+        Returns
+        -------
+        Iterator[tuple[int, int, dict[str, Any]]]
+            For every window, the indices of its first sentence and of the
+            sentence after its last one, and the result of every requested
+            method, by name. Texts with fewer than `size` sentences have a
+            single window.
+
+        Raises
+        ------
+        ValueError
+            If a metric can't be calculated from the counts of a text, or if
+            `size` or `step` are not positive.
+
+        """
+        specs = self.__get_profile_metric_specs(metrics)
+        windows = self.sentence_index(text).windows(size, step)
+        return (
+            (start, stop, self.__analyze_profile(profile, specs))
+            for start, stop, profile in windows
+        )
+
+    def sentence_metrics(
+        self,
+        text: str,
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None] = (),
+    ) -> list[dict[str, Any]]:
+        """Count words, syllables and difficult words, and calculate several
+        metrics, for every sentence of a text, e.g. to find the hardest ones.
+
+        The text is split into sentences once, with the same rules as
+        `sentence_count`, and the counts of every sentence are gathered in the
+        same pass. The metrics of a sentence are the same as calling `analyze`
+        on its text.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `evaluate`. The default is none.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            For every sentence, its position in the text as ``"start"`` and
+            ``"end"``, its number of ``"words"``, ``"syllables"`` and
+            ``"difficult_words"`` (not only unique ones, and None for both if
+            the syllables of the language can't be counted, see
+            `backend.utils.has_pyphen`), and the result of every requested
+            method, by name.
+
+        Raises
+        ------
+        ValueError
+            If a metric can't be calculated from the counts of a text.
+
+        """
+        specs = self.__get_profile_metric_specs(metrics)
+        results = []
+        sentence_profiles = backend.profiles.get_sentence_profiles(text, self.__lang)
+        for start, end, profile in sentence_profiles:
+            result = {
+                "start": start,
+                "end": end,
+                "words": profile.count_words(),
+                "syllables": None,
+                "difficult_words": None,
+            }
+            # Unless pyphen has no dictionary for the language
+            if profile.syllables is not None:
+                result["syllables"] = profile.count_syllables()
+                result["difficult_words"] = profile.count_difficult_words()
+            result.update(self.__analyze_profile(profile, specs))
+            results.append(result)
+        return results
+
+    async def aanalyze(
+        self,
+        text: str,
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+    ) -> dict[str, Any]:
+        """Asynchronous version of `analyze`, which doesn't block the event loop.
+
+        The work is run in the executor set with `textstat.configure_async`
+        (a thread pool by default), and at most `max_concurrency` calls run at
+        once, so long texts can't starve other coroutines.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `analyze`.
+
+        Returns
+        -------
+        dict[str, Any]
+            The result of every requested method, by name.
+
+        """
+        specs = dict(self.__get_metric_specs(metrics))
+        # asyncio takes longer to import than textstat, only load it if used
+        import asyncio
+
+        from . import aio
+
+        loop = asyncio.get_running_loop()
+        async with aio.get_semaphore():
+            results = await loop.run_in_executor(
+                aio.get_executor(),
+                functools.partial(_analyze_texts, self, specs, [text]),
+            )
+        return results[0]
+
+    def batch(
+        self,
+        texts: Iterable[str],
+        metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None],
+        n_jobs: int | None = None,
+        executor: Executor | None = None,
+        chunksize: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Calculate several metrics for many texts, in parallel.
+
+        The texts are split into chunks that are scored with `analyze` on a
+        process pool, whose workers load the language resources once when they
+        start. The language, rounding and apostrophe settings of this instance
+        are used by the workers.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The text strings.
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            The metrics to calculate, see `analyze`.
+        n_jobs : int or None, optional
+            Number of worker processes, all CPUs if None. With 1, the texts are
+            scored in this process. If `executor` is given, it only sets the
+            default `chunksize`.
+        executor : concurrent.futures.Executor or None, optional
+            Executor to score the chunks with instead of a new process pool. It
+            is not shut down.
+        chunksize : int or None, optional
+            Number of texts sent to a worker at once. By default, about four
+            chunks per job of `n_jobs`, and at most 1000 texts per chunk.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The results of `analyze` for every text, in the same order.
+
+        """
+        specs = dict(self.__get_metric_specs(metrics))
+        texts = list(texts)
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+        if executor is None and (n_jobs == 1 or len(texts) <= 1):
+            return _analyze_texts(self, specs, texts)
+
+        if chunksize is None:
+            chunksize = min(1000, max(1, -(-len(texts) // (4 * n_jobs))))
+        chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+        worker = functools.partial(_analyze_texts, self, specs)
+
+        if executor is not None:
+            results = executor.map(worker, chunks)
+            return [result for chunk in results for result in chunk]
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(chunks)),
+            initializer=_load_resources,
+            initargs=(self.__lang,),
+        ) as pool:
+            return [result for chunk in pool.map(worker, chunks) for result in chunk]
+
     def char_count(self, text: str, ignore_spaces: bool = True) -> int:
         """Count the number of characters in a text.
 
@@ -204,7 +647,7 @@ class textstatistics:
             Number of characters.
 
         """
-        return counts.count_chars(text, ignore_spaces)
+        return backend.counts.count_chars(text, ignore_spaces)
 
     def letter_count(self, text: str, ignore_spaces: bool | None = None) -> int:
         """Count letters in a text.
@@ -234,7 +677,7 @@ class textstatistics:
                 DeprecationWarning,
                 stacklevel=2,
             )
-        return counts.count_letters(text)
+        return backend.counts.count_letters(text)
 
     def remove_punctuation(self, text: str) -> str:
         """Remove punctuation.
@@ -257,7 +700,7 @@ class textstatistics:
             A copy of the input text with punctuation removed.
 
         """
-        return transformations.remove_punctuation(text, self.__rm_apostrophe)
+        return backend.transformations.remove_punctuation(text, self.__rm_apostrophe)
 
     def lexicon_count(
         self,
@@ -291,7 +734,7 @@ class textstatistics:
             Number of words.
 
         """
-        return counts.count_words(
+        return backend.counts.count_words(
             text,
             rm_punctuation=removepunct,
             split_contractions=split_contractions,
@@ -314,7 +757,7 @@ class textstatistics:
         count : int
 
         """
-        return counts.count_miniwords(text, max_size)
+        return backend.counts.count_miniwords(text, max_size)
 
     def syllable_count(self, text: str, lang: str | None = None) -> int:
         """Estimate the number of syllables in a text using Pyphen.
@@ -344,7 +787,7 @@ class textstatistics:
                 stacklevel=2,
             )
 
-        return counts.count_syllables(text, self.__lang)
+        return backend.counts.count_syllables(text, self.__lang)
 
     def sentence_count(self, text: str) -> int:
         """Count the sentences in the text.
@@ -360,7 +803,7 @@ class textstatistics:
             Number of sentences in `text`.
 
         """
-        return counts.count_sentences(text)
+        return backend.counts.count_sentences(text)
 
     def avg_sentence_length(self, text: str) -> float:
         """Calculate the average sentence length in words.
@@ -387,7 +830,7 @@ class textstatistics:
             DeprecationWarning,
             stacklevel=2,
         )
-        return self._legacy_round(metrics.words_per_sentence(text))
+        return self._legacy_round(backend.metrics.words_per_sentence(text))
 
     def avg_syllables_per_word(self, text: str, interval: int | None = None) -> float:
         """Get the average number of syllables per `interval` words. If
@@ -408,7 +851,7 @@ class textstatistics:
         """
         if interval is None:
             interval = 1
-        aspw = metrics.syllables_per_word(text, self.__lang)
+        aspw = backend.metrics.syllables_per_word(text, self.__lang)
         aspw *= interval
         return self._legacy_round(aspw)
 
@@ -426,7 +869,7 @@ class textstatistics:
             The average number of characters per word.
 
         """
-        return self._legacy_round(metrics.chars_per_word(text))
+        return self._legacy_round(backend.metrics.chars_per_word(text))
 
     def avg_letter_per_word(self, text: str) -> float:
         """Calculate the average  word length in letters.
@@ -442,7 +885,7 @@ class textstatistics:
             The average number of letters per word.
 
         """
-        return self._legacy_round(metrics.letters_per_word(text))
+        return self._legacy_round(backend.metrics.letters_per_word(text))
 
     def avg_sentence_per_word(self, text: str) -> float:
         """Get the number of sentences per word.
@@ -458,7 +901,7 @@ class textstatistics:
             Number of sentences per word.
 
         """
-        return self._legacy_round(metrics.sentences_per_word(text))
+        return self._legacy_round(backend.metrics.sentences_per_word(text))
 
     def words_per_sentence(self, text: str) -> float:
         """Calculate the average number of words per sentence.
@@ -474,7 +917,7 @@ class textstatistics:
             The average number of words per sentence.
 
         """
-        return self._legacy_round(metrics.words_per_sentence(text))
+        return self._legacy_round(backend.metrics.words_per_sentence(text))
 
     def count_complex_arabic_words(self, text: str) -> int:
         """
@@ -491,7 +934,7 @@ class textstatistics:
             Number of arabic complex words.
 
         """
-        return counts.count_complex_arabic_words(text)
+        return backend.counts.count_complex_arabic_words(text)
 
     def count_arabic_syllables(self, text: str) -> int:
         """Count arabic syllables.
@@ -509,7 +952,7 @@ class textstatistics:
             Number of arabic syllables.
 
         """
-        return counts.count_arabic_syllables(text)
+        return backend.counts.count_arabic_syllables(text)
 
     def count_faseeh(self, text: str) -> int:
         """Counts faseeh in arabic texts.
@@ -525,7 +968,7 @@ class textstatistics:
             Number of faseeh.
 
         """
-        return counts.count_faseeh(text)
+        return backend.counts.count_faseeh(text)
 
     def count_arabic_long_words(self, text: str) -> int:
         """Counts long arabic words without short vowels (tashkeel).
@@ -542,7 +985,7 @@ class textstatistics:
             Number of long arabic words without short vowels (tashkeel).
 
         """
-        return counts.count_arabic_long_words(text)
+        return backend.counts.count_arabic_long_words(text)
 
     def flesch_reading_ease(self, text: str) -> float:
         """Calculate the Flesch Reading Ease formula.
@@ -557,7 +1000,9 @@ class textstatistics:
         float
             The Flesch Reading Ease for `text`.
         """
-        return self._legacy_round(metrics.flesch_reading_ease(text, self.__lang))
+        return self._legacy_round(
+            backend.metrics.flesch_reading_ease(text, self.__lang)
+        )
 
     def flesch_kincaid_grade(self, text: str) -> float:
         r"""Calculate the Flesh-Kincaid Grade for `text`.
@@ -581,7 +1026,9 @@ class textstatistics:
             (.39*avg\ sentence\ length)+(11.8*avg\ syllables\ per\ word)-15.59
 
         """
-        return self._legacy_round(metrics.flesch_kincaid_grade(text, self.__lang))
+        return self._legacy_round(
+            backend.metrics.flesch_kincaid_grade(text, self.__lang)
+        )
 
     def polysyllabcount(self, text: str) -> int:
         """Count the number of words with three or more syllables.
@@ -602,7 +1049,7 @@ class textstatistics:
         Contractions and hyphenations are therefore counted as one word.
 
         """
-        return counts.count_polysyllable_words(text, self.__lang)
+        return backend.counts.count_polysyllable_words(text, self.__lang)
 
     def smog_index(self, text: str) -> float:
         r"""Calculate the SMOG index.
@@ -627,7 +1074,7 @@ class textstatistics:
 
         Polysyllabic words are defined as words with more than 3 syllables.
         """
-        return self._legacy_round(metrics.smog_index(text, self.__lang))
+        return self._legacy_round(backend.metrics.smog_index(text, self.__lang))
 
     def coleman_liau_index(self, text: str) -> float:
         r"""Calculate the Coleman-Liaux index.
@@ -651,7 +1098,7 @@ class textstatistics:
             (0.058*n\ letters/n\ words)-(0.296*n\ sentences/n\ words)-15.8
 
         """
-        return self._legacy_round(metrics.coleman_liau_index(text))
+        return self._legacy_round(backend.metrics.coleman_liau_index(text))
 
     def automated_readability_index(self, text: str) -> float:
         r"""Calculate the Automated Readability Index (ARI).
@@ -675,7 +1122,7 @@ class textstatistics:
             (4.71*n\ characters/n\ words)+(0.5*n\ words/n\ sentences)-21.43
 
         """
-        return self._legacy_round(metrics.automated_readability_index(text))
+        return self._legacy_round(backend.metrics.automated_readability_index(text))
 
     def linsear_write_formula(
         self, text: str, strict_lower: bool = False, strict_upper: bool = True
@@ -715,7 +1162,7 @@ class textstatistics:
         difficult words are defined as words with 3 syllables or more.
         r"""
         return self._legacy_round(
-            metrics.linsear_write_formula(
+            backend.metrics.linsear_write_formula(
                 text, self.__lang, strict_lower=strict_lower, strict_upper=strict_upper
             )
         )
@@ -744,7 +1191,7 @@ class textstatistics:
             Number of difficult words.
 
         """
-        return counts.count_difficult_words(
+        return backend.counts.count_difficult_words(
             text, self.__lang, syllable_threshold, unique
         )
 
@@ -771,9 +1218,13 @@ class textstatistics:
         """
         if unique:
             return list(
-                selections.set_difficult_words(text, syllable_threshold, self.__lang)
+                backend.selections.set_difficult_words(
+                    text, syllable_threshold, self.__lang
+                )
             )
-        return selections.list_difficult_words(text, syllable_threshold, self.__lang)
+        return backend.selections.list_difficult_words(
+            text, syllable_threshold, self.__lang
+        )
 
     def is_difficult_word(self, word: str, syllable_threshold: int = 2) -> bool:
         """Return True if `word` is a difficult word.
@@ -801,7 +1252,9 @@ class textstatistics:
             True.
 
         """
-        return validations.is_difficult_word(word, syllable_threshold, self.__lang)
+        return backend.validations.is_difficult_word(
+            word, syllable_threshold, self.__lang
+        )
 
     def is_easy_word(self, word: str, syllable_threshold: int = 2) -> bool:
         """Return True if `word` is not a difficult word. See the docstring for
@@ -859,7 +1312,7 @@ class textstatistics:
         score.
         """
         return self._legacy_round(
-            metrics.dale_chall_readability_score(text, self.__lang)
+            backend.metrics.dale_chall_readability_score(text, self.__lang)
         )
 
     def gunning_fog(self, text: str) -> float:
@@ -875,7 +1328,7 @@ class textstatistics:
         float
             The Gunning Fog Index for `text`.
         """
-        return self._legacy_round(metrics.gunning_fog(text, self.__lang))
+        return self._legacy_round(backend.metrics.gunning_fog(text, self.__lang))
 
     def lix(self, text: str) -> float:
         r"""Calculate the LIX for `text`
@@ -903,7 +1356,7 @@ class textstatistics:
         C= Number of long words (More than 6 letters)
 
         """
-        return self._legacy_round(metrics.lix(text))
+        return self._legacy_round(backend.metrics.lix(text))
 
     def rix(self, text: str) -> float:
         r"""Calculate the RIX for `text`
@@ -936,7 +1389,7 @@ class textstatistics:
         hyphenated sequences and abbreviations count as single words.
 
         """
-        return self._legacy_round(metrics.rix(text))
+        return self._legacy_round(backend.metrics.rix(text))
 
     def spache_readability(self, text: str, float_output: bool = True) -> float | int:
         """Calculate SPACHE readability formula for young readers. If `float_output`
@@ -954,7 +1407,7 @@ class textstatistics:
         float or int
             The SPACHE readability score for `text`
         """
-        readability_score = metrics.spache_readability(text, self.__lang)
+        readability_score = backend.metrics.spache_readability(text, self.__lang)
         if float_output:
             return self._legacy_round(readability_score)
         else:
@@ -975,7 +1428,7 @@ class textstatistics:
             The New Dale Chall Readability Score for `text`
         """
         return self._legacy_round(
-            metrics.dale_chall_readability_score_v2(text, self.__lang)
+            backend.metrics.dale_chall_readability_score_v2(text, self.__lang)
         )
 
     def text_standard(self, text: str, float_output: bool = False) -> float | str:
@@ -996,7 +1449,26 @@ class textstatistics:
         float
             The Text Standard for `text`.
         """
-        standard_value = metrics.text_standard(text, self.__lang)
+        standard_value = backend.metrics.text_standard(text, self.__lang)
+        return self.__format_text_standard(standard_value, float_output)
+
+    def __format_text_standard(
+        self, standard_value: float, float_output: bool
+    ) -> float | str:
+        """Format the output of `text_standard`.
+
+        Parameters
+        ----------
+        standard_value : float
+            The numerical Text Standard.
+        float_output : bool
+            Whether to return a float or a string.
+
+        Returns
+        -------
+        float or str
+            The formatted Text Standard.
+        """
         if float_output:
             return self._legacy_round(standard_value)
         else:
@@ -1004,9 +1476,9 @@ class textstatistics:
             upper_score = lower_score + 1
             return "{}{} and {}{} grade".format(
                 lower_score,
-                utils.get_grade_suffix(lower_score),
+                backend.utils.get_grade_suffix(lower_score),
                 upper_score,
-                utils.get_grade_suffix(upper_score),
+                backend.utils.get_grade_suffix(upper_score),
             )
 
     def reading_time(self, text: str, ms_per_char: float = 14.69) -> float:
@@ -1024,7 +1496,7 @@ class textstatistics:
         float
             The reading time for `text`.
         """
-        return self._legacy_round(metrics.reading_time(text, ms_per_char))
+        return self._legacy_round(backend.metrics.reading_time(text, ms_per_char))
 
     # Spanish readability tests
     def fernandez_huerta(self, text: str) -> float:
@@ -1043,7 +1515,7 @@ class textstatistics:
         float
             The Fernandez Huerta readability score for `text`
         """
-        return self._legacy_round(metrics.fernandez_huerta(text, self.__lang))
+        return self._legacy_round(backend.metrics.fernandez_huerta(text, self.__lang))
 
     def szigriszt_pazos(self, text: str) -> float:
         """Calculate Szigriszt Pazos readability score (1992)
@@ -1061,7 +1533,7 @@ class textstatistics:
         float
             The Szigriszt Pazos readability score for `text`
         """
-        return self._legacy_round(metrics.szigriszt_pazos(text, self.__lang))
+        return self._legacy_round(backend.metrics.szigriszt_pazos(text, self.__lang))
 
     def gutierrez_polini(self, text: str) -> float:
         """Calculate Guttierrez de Polini index
@@ -1077,7 +1549,7 @@ class textstatistics:
         float
             The Gutierrez de Polini index for `text`
         """
-        return self._legacy_round(metrics.gutierrez_polini(text))
+        return self._legacy_round(backend.metrics.gutierrez_polini(text))
 
     def crawford(self, text: str) -> float:
         r"""Calculate the Crawford index for the text.
@@ -1105,7 +1577,7 @@ class textstatistics:
             (-0.205*n\ sentences/n\ words)+(0.049*n\ syllables/n\ words)-3.407
 
         """
-        return self._legacy_round(metrics.crawford(text, self.__lang))
+        return self._legacy_round(backend.metrics.crawford(text, self.__lang))
 
     def osman(self, text: str) -> float:
         """Calculate Osman index for Arabic texts
@@ -1121,7 +1593,7 @@ class textstatistics:
         float
             The Osman index for `text`
         """
-        return self._legacy_round(metrics.osman(text))
+        return self._legacy_round(backend.metrics.osman(text))
 
     def gulpease_index(self, text: str) -> float:
         """Calculate Indice Gulpease Index for Italian texts
@@ -1137,7 +1609,7 @@ class textstatistics:
         float
             The Gulpease Index for `text`
         """
-        return self._legacy_round(metrics.gulpease_index(text))
+        return self._legacy_round(backend.metrics.gulpease_index(text))
 
     def long_word_count(self, text: str, threshold: int = 6) -> int:
         """Counts words with more than `threshold` (default 6) letters.
@@ -1154,7 +1626,7 @@ class textstatistics:
         int
             Number of words with more than `threshold` letters.
         """
-        return counts.count_long_words(text, threshold=threshold)
+        return backend.counts.count_long_words(text, threshold=threshold)
 
     def monosyllabcount(self, text: str) -> int:
         """Counts words with only one syllable in a text.
@@ -1169,7 +1641,7 @@ class textstatistics:
         int
         Number of monosyllable words in the text.
         """
-        return counts.count_monosyllable_words(text, self.__lang)
+        return backend.counts.count_monosyllable_words(text, self.__lang)
 
     def wiener_sachtextformel(self, text: str, variant: int) -> float:
         """Calculate Wiener Sachtextformel for readability assessment of German texts
@@ -1189,7 +1661,7 @@ class textstatistics:
             The Wiener Sachtextformel readability score for `text`
         """
         return self._legacy_round(
-            metrics.wiener_sachtextformel(text, variant, self.__lang)
+            backend.metrics.wiener_sachtextformel(text, variant, self.__lang)
         )
 
     def mcalpine_eflaw(self, text: str) -> float:
@@ -1208,7 +1680,166 @@ class textstatistics:
         float
             The McAlpine EFLAW readability score for `text`
         """
-        return self._legacy_round(metrics.mcalpine_eflaw(text))
+        return self._legacy_round(backend.metrics.mcalpine_eflaw(text))
+
+    def __get_metric_specs(
+        self, metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Check the metric names passed to `analyze`.
+
+        Parameters
+        ----------
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            Names of textstat methods and their arguments.
+
+        Returns
+        -------
+        list[tuple[str, dict[str, Any]]]
+            The names and arguments of the metrics.
+
+        Raises
+        ------
+        ValueError
+            If a name is not a method that `analyze` supports, or if its
+            arguments don't match the method.
+
+        """
+        specs = backend.utils.get_metric_specs(metrics)
+        for name, kwargs in specs:
+            if name not in self.__profile_methods and (
+                name not in self.__special_methods
+            ):
+                raise ValueError(f"Unknown metric {name}")
+            try:
+                inspect.signature(getattr(self, name)).bind("", **kwargs)
+            except TypeError as error:
+                raise ValueError(f"Invalid arguments for {name}: {error}") from None
+        return specs
+
+    def __get_profile_metric_specs(
+        self, metrics: Iterable[str] | Mapping[str, Mapping[str, Any] | None]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Check the metric names passed to `evaluate`.
+
+        Parameters
+        ----------
+        metrics : Iterable[str] or Mapping[str, Mapping[str, Any] or None]
+            Names of textstat methods and their arguments.
+
+        Returns
+        -------
+        list[tuple[str, dict[str, Any]]]
+            The names and arguments of the metrics.
+
+        Raises
+        ------
+        ValueError
+            If a name is not a method that `evaluate` supports.
+
+        """
+        specs = self.__get_metric_specs(metrics)
+        for name, kwargs in specs:
+            if self.__needs_text(name, kwargs):
+                raise ValueError(f"{name} can't be calculated from a TextProfile")
+        return specs
+
+    def __analyze_profile(
+        self,
+        profile: backend.profiles.TextProfile,
+        specs: list[tuple[str, dict[str, Any]]],
+        text: str | None = None,
+    ) -> dict[str, Any]:
+        """Derive the results of `analyze` from the counts of a text.
+
+        Parameters
+        ----------
+        profile : profiles.TextProfile
+            The counts of the text.
+        specs : list[tuple[str, dict[str, Any]]]
+            The names and arguments of the metrics.
+        text : str or None, optional
+            The text, for the metrics that can't be derived from `profile`.
+
+        Returns
+        -------
+        dict[str, Any]
+            The result of every requested method, by name.
+
+        """
+        results: dict[str, Any] = {}
+        for name, kwargs in specs:
+            # Reported to the trace callbacks and profilers like the metrics
+            results[name] = backend.instrumentation.observed_metric(
+                f"analyze.{name}",
+                profile.chars_with_spaces,
+                profile.lang,
+                functools.partial(self.__metric_value, profile, name, kwargs, text),
+            )
+        return results
+
+    def __metric_value(
+        self,
+        profile: backend.profiles.TextProfile,
+        name: str,
+        kwargs: Mapping[str, Any],
+        text: str | None,
+    ) -> Any:
+        """Get the result of one metric of `analyze`, from `profile` if possible."""
+        try:
+            return self.__profile_value(profile, name, kwargs, text)
+        except KeyError as error:
+            if profile.syllables is not None or text is None:
+                raise
+            # Without a pyphen dictionary the methods still score the texts
+            # they don't have to syllabify, e.g. texts of easy words
+            try:
+                return getattr(self, name)(text, **kwargs)
+            except KeyError:
+                raise error from None
+
+    def __profile_value(
+        self,
+        profile: backend.profiles.TextProfile,
+        name: str,
+        kwargs: Mapping[str, Any],
+        text: str | None,
+    ) -> Any:
+        """Derive the result of one metric of `analyze` from `profile`."""
+        if name in self.__profile_methods:
+            method, rounded = self.__profile_methods[name]
+            value = getattr(profile, method)(**kwargs)
+            return self._legacy_round(value) if rounded else value
+        elif name == "avg_syllables_per_word":
+            interval = kwargs.get("interval") or 1
+            return self._legacy_round(profile.syllables_per_word() * interval)
+        elif name == "lexicon_count" and not self.__needs_text(name, kwargs):
+            return profile.count_words(kwargs.get("removepunct", True))
+        elif name == "difficult_words" and not self.__needs_text(name, kwargs):
+            return profile.count_difficult_words(kwargs.get("syllable_threshold", 2))
+        elif name == "spache_readability":
+            readability_score = profile.spache_readability()
+            if kwargs.get("float_output", True):
+                return self._legacy_round(readability_score)
+            else:
+                return int(readability_score)
+        elif name == "text_standard":
+            return self.__format_text_standard(
+                profile.text_standard(), kwargs.get("float_output", False)
+            )
+        else:
+            # Unique difficult words and split words are not in the profile
+            return getattr(self, name)(text, **kwargs)
+
+    @staticmethod
+    def __needs_text(name: str, kwargs: Mapping[str, Any]) -> bool:
+        """Whether a metric of `analyze` can't be derived from a TextProfile."""
+        if name == "lexicon_count":
+            return bool(
+                kwargs.get("split_contractions") or kwargs.get("split_hyphens")
+            )
+        if name == "difficult_words":
+            return bool(kwargs.get("unique", True))
+        return False
 
     def __get_lang_cfg(self, key: str) -> float:
         """Get a value from the configuration for a specific language.
@@ -1224,7 +1855,7 @@ class textstatistics:
             The value from the configuration.
 
         """
-        return utils.get_lang_cfg(self.__lang, key)
+        return backend.utils.get_lang_cfg(self.__lang, key)
 
     def __get_lang_root(self) -> str:
         """Get the root language of a language.
@@ -1238,7 +1869,7 @@ class textstatistics:
         str
             The root language of the given language.
         """
-        return utils.get_lang_root(self.__lang)
+        return backend.utils.get_lang_root(self.__lang)
 
     def __get_lang_easy_words(self) -> set[str]:
         """Get the easy words for a language.
@@ -1252,7 +1883,29 @@ class textstatistics:
         set[str]
             The easy words for the given language.
         """
-        return utils.get_lang_easy_words(self.__lang)
+        return backend.utils.get_lang_easy_words(self.__lang)
+
+
+def _analyze_texts(
+    ts: textstatistics,
+    metrics: Mapping[str, Mapping[str, Any]],
+    texts: list[str],
+) -> list[dict[str, Any]]:
+    """Score a chunk of `textstatistics.batch`."""
+    results = [ts.analyze(text, metrics) for text in texts]
+    # The workers of a process pool exit without running the atexit hook that
+    # writes the last syllable counts
+    store = backend.utils.get_syllable_store()
+    if store is not None:
+        store.flush()
+    return results
+
+
+def _load_resources(lang: str) -> None:
+    """Load the language resources once when a `batch` worker starts."""
+    backend.utils.get_syllable_table(lang)
+    backend.utils.get_pyphen(lang)
+    backend.utils.get_lang_easy_words(lang)
 
 
 textstat = textstatistics()